@@ -0,0 +1,211 @@
+"""Hash partition individuals, identities and relationships by project
+
+Opt-in, PostgreSQL only. Run it through the `partitioning` section of
+alembic.ini, optionally with the number of partitions:
+
+    alembic --name partitioning -x partitions=16 upgrade partitioning@head
+
+A partitioned table only enforces unique constraints that contain the
+partition key, so the primary keys become (id, project_id) and the
+foreign keys to `individuals` also match on project_id. The ORM keeps
+mapping `id` as the primary key; the sequences still make it unique.
+
+Revision ID: 4e7b2c9a1d58
+Revises: d9a1f6c3b8e2
+Create Date: 2026-10-19 14:48:09.117460
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7b2c9a1d58'
+down_revision: Union[str, None] = 'd9a1f6c3b8e2'
+branch_labels: Union[str, Sequence[str], None] = ('partitioning',)
+depends_on: Union[str, Sequence[str], None] = None
+
+# Referenced tables come first.
+TABLES = ('individuals', 'identities', 'relationships')
+
+PARTITIONED_CONSTRAINTS = """
+ALTER TABLE individuals
+    ADD CONSTRAINT individuals_pkey PRIMARY KEY (id, project_id),
+    ADD CONSTRAINT uix_project_individual_number
+        UNIQUE (project_id, individual_number);
+ALTER TABLE identities
+    ADD CONSTRAINT identities_pkey PRIMARY KEY (id, project_id),
+    ADD CONSTRAINT uix_identity_identity_number
+        UNIQUE (project_id, individual_id, identity_number);
+CREATE UNIQUE INDEX uix_individual_primary_identity
+    ON identities (project_id, individual_id)
+    INCLUDE (first_name, last_name, gender)
+    WHERE is_primary = true{live_and};
+ALTER TABLE relationships
+    ADD CONSTRAINT relationships_pkey PRIMARY KEY (id, project_id);
+
+ALTER TABLE identities
+    ADD CONSTRAINT identities_individual_id_fkey
+        FOREIGN KEY (individual_id, project_id)
+        REFERENCES individuals (id, project_id) ON DELETE CASCADE;
+ALTER TABLE relationships
+    ADD CONSTRAINT relationships_individual_id_fkey
+        FOREIGN KEY (individual_id, project_id)
+        REFERENCES individuals (id, project_id) ON DELETE CASCADE,
+    ADD CONSTRAINT relationships_related_id_fkey
+        FOREIGN KEY (related_id, project_id)
+        REFERENCES individuals (id, project_id) ON DELETE CASCADE;
+ALTER TABLE individual_display
+    ADD CONSTRAINT individual_display_individual_id_fkey
+        FOREIGN KEY (individual_id, project_id)
+        REFERENCES individuals (id, project_id) ON DELETE CASCADE;
+ALTER TABLE individual_fragments
+    ADD CONSTRAINT individual_fragments_individual_id_fkey
+        FOREIGN KEY (individual_id, project_id)
+        REFERENCES individuals (id, project_id) ON DELETE CASCADE;
+"""
+
+PLAIN_CONSTRAINTS = """
+ALTER TABLE individuals
+    ADD CONSTRAINT individuals_pkey PRIMARY KEY (id),
+    ADD CONSTRAINT uix_project_individual_number
+        UNIQUE (project_id, individual_number);
+ALTER TABLE identities
+    ADD CONSTRAINT identities_pkey PRIMARY KEY (id),
+    ADD CONSTRAINT uix_identity_identity_number
+        UNIQUE (individual_id, identity_number);
+CREATE UNIQUE INDEX uix_individual_primary_identity
+    ON identities (individual_id)
+    INCLUDE (first_name, last_name, gender)
+    WHERE is_primary = true{live_and};
+ALTER TABLE relationships
+    ADD CONSTRAINT relationships_pkey PRIMARY KEY (id);
+
+ALTER TABLE identities
+    ADD CONSTRAINT identities_individual_id_fkey
+        FOREIGN KEY (individual_id)
+        REFERENCES individuals (id) ON DELETE CASCADE;
+ALTER TABLE relationships
+    ADD CONSTRAINT relationships_individual_id_fkey
+        FOREIGN KEY (individual_id)
+        REFERENCES individuals (id) ON DELETE CASCADE,
+    ADD CONSTRAINT relationships_related_id_fkey
+        FOREIGN KEY (related_id)
+        REFERENCES individuals (id) ON DELETE CASCADE;
+ALTER TABLE individual_display
+    ADD CONSTRAINT individual_display_individual_id_fkey
+        FOREIGN KEY (individual_id)
+        REFERENCES individuals (id) ON DELETE CASCADE;
+ALTER TABLE individual_fragments
+    ADD CONSTRAINT individual_fragments_individual_id_fkey
+        FOREIGN KEY (individual_id)
+        REFERENCES individuals (id) ON DELETE CASCADE;
+"""
+
+# The constraints and indexes that do not change with the layout.
+SHARED_CONSTRAINTS = """
+ALTER TABLE individuals
+    ADD CONSTRAINT individuals_user_id_fkey FOREIGN KEY (user_id)
+        REFERENCES users (id) ON DELETE CASCADE,
+    ADD CONSTRAINT individuals_project_id_fkey FOREIGN KEY (project_id)
+        REFERENCES projects (id) ON DELETE CASCADE;
+CREATE INDEX ix_individuals_user_project_updated
+    ON individuals (user_id, project_id, updated_at DESC, id);
+CREATE INDEX ix_individuals_birth_place ON individuals (birth_place);
+CREATE INDEX ix_individuals_death_place ON individuals (death_place);
+
+ALTER TABLE identities
+    ADD CONSTRAINT identities_project_id_fkey FOREIGN KEY (project_id)
+        REFERENCES projects (id) ON DELETE CASCADE;
+CREATE INDEX ix_identities_project_id ON identities (project_id);
+
+ALTER TABLE relationships
+    ADD CONSTRAINT relationships_project_id_fkey FOREIGN KEY (project_id)
+        REFERENCES projects (id) ON DELETE CASCADE;
+CREATE UNIQUE INDEX uix_relationship_pair ON relationships (
+    project_id, least(individual_id, related_id),
+    greatest(individual_id, related_id)){live_where};
+CREATE INDEX ix_relationships_individual_type
+    ON relationships (individual_id, initial_relationship)
+    INCLUDE (related_id);
+CREATE INDEX ix_relationships_related_type
+    ON relationships (related_id, initial_relationship)
+    INCLUDE (individual_id);
+
+ANALYZE individuals, identities, relationships;
+"""
+
+# Added by the soft delete revision, which may run before or after this
+# one.
+TOMBSTONE_INDEXES = """
+CREATE INDEX ix_individuals_deleted_at ON individuals (deleted_at)
+    WHERE deleted_at IS NOT NULL;
+CREATE INDEX ix_identities_deleted_at ON identities (deleted_at)
+    WHERE deleted_at IS NOT NULL;
+CREATE INDEX ix_relationships_deleted_at ON relationships (deleted_at)
+    WHERE deleted_at IS NOT NULL;
+"""
+
+
+def _execute(*statements: str) -> None:
+    """
+    Executes the constraint scripts, restricting unique indexes to live
+    rows when the tables have tombstones.
+    """
+    tombstones = op.get_bind().execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+        "WHERE table_schema = current_schema() "
+        "AND table_name = 'individuals' "
+        "AND column_name = 'deleted_at')")).scalar()
+    predicates = {
+        "live_and": " AND deleted_at IS NULL" if tombstones else "",
+        "live_where": " WHERE deleted_at IS NULL" if tombstones else ""}
+    for statement in statements:
+        op.execute(statement.format(**predicates))
+    if tombstones:
+        op.execute(TOMBSTONE_INDEXES)
+
+
+def _rebuild(partitions: int = 0) -> None:
+    """
+    Copies the tables into new ones, hash partitioned by project_id into
+    `partitions` partitions, or plain if zero, and drops the old ones.
+
+    Check constraints, defaults and the id sequences are carried over;
+    keys and indexes are added by the caller.
+    """
+    for table in TABLES:
+        layout = " PARTITION BY HASH (project_id)" if partitions else ""
+        op.execute(f"""
+            CREATE TABLE {table}_new (LIKE {table} INCLUDING DEFAULTS
+                                      INCLUDING CONSTRAINTS){layout}
+        """)
+        for remainder in range(partitions):
+            op.execute(f"""
+                CREATE TABLE {table}_p{remainder} PARTITION OF
+                    {table}_new FOR VALUES WITH (MODULUS {partitions},
+                                                 REMAINDER {remainder})
+            """)
+        op.execute(f"INSERT INTO {table}_new SELECT * FROM {table}")
+        op.execute(
+            f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}_new.id")
+
+    # Dropping also removes the foreign keys of the dependent tables.
+    for table in reversed(TABLES):
+        op.execute(f"DROP TABLE {table} CASCADE")
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+
+def upgrade() -> None:
+    partitions = int(context.get_x_argument(as_dictionary=True).get(
+        'partitions', 16))
+    _rebuild(partitions)
+    _execute(PARTITIONED_CONSTRAINTS, SHARED_CONSTRAINTS)
+
+
+def downgrade() -> None:
+    _rebuild()
+    _execute(PLAIN_CONSTRAINTS, SHARED_CONSTRAINTS)
@@ -0,0 +1,43 @@
+"""Add unique index on relationship pairs
+
+Pairs stored more than once, e.g. as reversed partner rows, keep only
+their oldest row, so the index can be built on existing data.
+
+Revision ID: 7a3d5c9e1f24
+Revises: e2b8f41c6d07
+Create Date: 2026-10-19 11:02:47.519083
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3d5c9e1f24'
+down_revision: Union[str, None] = 'e2b8f41c6d07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DELETE FROM relationships duplicate
+        USING relationships kept
+        WHERE kept.project_id = duplicate.project_id
+          AND LEAST(kept.individual_id, kept.related_id) =
+              LEAST(duplicate.individual_id, duplicate.related_id)
+          AND GREATEST(kept.individual_id, kept.related_id) =
+              GREATEST(duplicate.individual_id, duplicate.related_id)
+          AND kept.id < duplicate.id
+    """)
+    op.create_index('uix_relationship_pair', 'relationships',
+                    ['project_id',
+                     sa.text('LEAST(individual_id, related_id)'),
+                     sa.text('GREATEST(individual_id, related_id)')],
+                    unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uix_relationship_pair', table_name='relationships')
@@ -0,0 +1,76 @@
+"""Add composite and covering indexes for hot queries
+
+Revision ID: c5f0e8a2d6b3
+Revises: 7a3d5c9e1f24
+Create Date: 2026-10-19 13:26:05.871342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f0e8a2d6b3'
+down_revision: Union[str, None] = '7a3d5c9e1f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_individuals_user_project_updated', 'individuals',
+                    ['user_id', 'project_id', sa.text('updated_at DESC'),
+                     'id'], unique=False)
+    op.create_index('ix_relationships_individual_type', 'relationships',
+                    ['individual_id', 'initial_relationship'],
+                    unique=False, postgresql_include=['related_id'])
+    op.create_index('ix_relationships_related_type', 'relationships',
+                    ['related_id', 'initial_relationship'], unique=False,
+                    postgresql_include=['individual_id'])
+    op.drop_index('uix_individual_primary_identity',
+                  table_name='identities')
+    op.create_index('uix_individual_primary_identity', 'identities',
+                    ['individual_id'], unique=True,
+                    postgresql_where=sa.text('is_primary = true'),
+                    postgresql_include=['first_name', 'last_name',
+                                        'gender'])
+
+    # Each of these is the leading column of a composite index above or
+    # of a unique constraint, which serves the same lookups.
+    op.drop_index('ix_individuals_user_id', table_name='individuals')
+    op.drop_index('ix_individuals_project_id', table_name='individuals')
+    op.drop_index('ix_identities_individual_id', table_name='identities')
+    op.drop_index('ix_relationships_individual_id',
+                  table_name='relationships')
+    op.drop_index('ix_relationships_related_id',
+                  table_name='relationships')
+    op.drop_index('ix_relationships_project_id',
+                  table_name='relationships')
+
+
+def downgrade() -> None:
+    op.create_index('ix_relationships_project_id', 'relationships',
+                    ['project_id'], unique=False)
+    op.create_index('ix_relationships_related_id', 'relationships',
+                    ['related_id'], unique=False)
+    op.create_index('ix_relationships_individual_id', 'relationships',
+                    ['individual_id'], unique=False)
+    op.create_index('ix_identities_individual_id', 'identities',
+                    ['individual_id'], unique=False)
+    op.create_index('ix_individuals_project_id', 'individuals',
+                    ['project_id'], unique=False)
+    op.create_index('ix_individuals_user_id', 'individuals',
+                    ['user_id'], unique=False)
+
+    op.drop_index('uix_individual_primary_identity',
+                  table_name='identities')
+    op.create_index('uix_individual_primary_identity', 'identities',
+                    ['individual_id'], unique=True,
+                    postgresql_where=sa.text('is_primary = true'))
+    op.drop_index('ix_relationships_related_type',
+                  table_name='relationships')
+    op.drop_index('ix_relationships_individual_type',
+                  table_name='relationships')
+    op.drop_index('ix_individuals_user_project_updated',
+                  table_name='individuals')
@@ -0,0 +1,42 @@
+"""Add project_id to identities
+
+Revision ID: d9a1f6c3b8e2
+Revises: c5f0e8a2d6b3
+Create Date: 2026-10-19 14:12:37.640218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a1f6c3b8e2'
+down_revision: Union[str, None] = 'c5f0e8a2d6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('identities',
+                  sa.Column('project_id', sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE identities SET project_id = individuals.project_id
+        FROM individuals
+        WHERE individuals.id = identities.individual_id
+    """)
+    op.alter_column('identities', 'project_id', nullable=False)
+    op.create_index(op.f('ix_identities_project_id'), 'identities',
+                    ['project_id'], unique=False)
+    op.create_foreign_key('identities_project_id_fkey', 'identities',
+                          'projects', ['project_id'], ['id'],
+                          ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    op.drop_constraint('identities_project_id_fkey', 'identities',
+                       type_='foreignkey')
+    op.drop_index(op.f('ix_identities_project_id'),
+                  table_name='identities')
+    op.drop_column('identities', 'project_id')
@@ -0,0 +1,75 @@
+"""Add deleted_at tombstones to the genealogy tables
+
+Unique indexes that a re-created row can collide with only cover live
+rows. Works on the plain and the partitioned layout.
+
+Revision ID: f3c7a1e9b5d2
+Revises: d9a1f6c3b8e2
+Create Date: 2026-10-19 16:05:42.318907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c7a1e9b5d2'
+down_revision: Union[str, None] = 'd9a1f6c3b8e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('projects', 'individuals', 'identities', 'relationships')
+
+
+def _primary_identity_columns() -> list:
+    """
+    Returns the key of the primary identity index, which also holds the
+    partition key when `identities` is partitioned.
+    """
+    partitioned = op.get_bind().execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+        "WHERE partrelid = 'identities'::regclass)")).scalar()
+    return ['project_id', 'individual_id'] if partitioned \
+        else ['individual_id']
+
+
+def _recreate_unique_indexes(live_only: str) -> None:
+    op.drop_index('uix_individual_primary_identity',
+                  table_name='identities')
+    op.create_index('uix_individual_primary_identity', 'identities',
+                    _primary_identity_columns(), unique=True,
+                    postgresql_where=sa.text(
+                        'is_primary = true' + live_only),
+                    postgresql_include=['first_name', 'last_name',
+                                        'gender'])
+    op.drop_index('uix_relationship_pair', table_name='relationships')
+    op.create_index('uix_relationship_pair', 'relationships',
+                    ['project_id',
+                     sa.text('least(individual_id, related_id)'),
+                     sa.text('greatest(individual_id, related_id)')],
+                    unique=True,
+                    postgresql_where=sa.text('deleted_at IS NULL')
+                    if live_only else None)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column('deleted_at',
+                                       sa.DateTime(timezone=True),
+                                       nullable=True))
+        op.create_index(f'ix_{table}_deleted_at', table, ['deleted_at'],
+                        unique=False,
+                        postgresql_where=sa.text('deleted_at IS NOT NULL'))
+    _recreate_unique_indexes(' AND deleted_at IS NULL')
+
+
+def downgrade() -> None:
+    # Tombstoned rows would otherwise reappear.
+    for table in reversed(TABLES):
+        op.execute(f"DELETE FROM {table} WHERE deleted_at IS NOT NULL")
+    _recreate_unique_indexes('')
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_deleted_at', table_name=table)
+        op.drop_column(table, 'deleted_at')
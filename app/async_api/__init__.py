@@ -0,0 +1 @@
+from .application import create_async_app
@@ -0,0 +1,121 @@
+import contextvars
+import logging
+from contextlib import asynccontextmanager
+
+from a2wsgi import WSGIMiddleware
+from fastapi import FastAPI, Request
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.middleware.cors import CORSMiddleware
+from werkzeug.exceptions import HTTPException, InternalServerError
+
+from app import create_app
+from app.async_api import identities, individuals, projects, \
+    relationships
+from app.async_api.database import init_async_database
+from app.async_api.helpers import FlaskJSONResponse, error_response
+from app.async_api.security import AuthError
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(api: FastAPI):
+    """
+    Closes the pooled asyncpg connections when the server stops.
+    """
+    yield
+    await api.state.engine.dispose()
+
+
+def create_async_app(env: str = "development", flask_app=None):
+    """
+    Application factory for the asyncio variant of the API.
+
+    The project, individual, identity and relationship endpoints run on
+    an AsyncSession, so a slow query only suspends its own request. All
+    other routes, e.g. authentication, imports, jobs and the web pages,
+    are served by the Flask app on a thread pool.
+
+    Args:
+        env (str): The environment to configure the app for.
+        flask_app (Flask, optional): The Flask app to share
+            configuration and caches with. Created if not given.
+
+    Returns:
+        FastAPI: Configured ASGI application instance.
+    """
+    flask_app = flask_app or create_app(env)
+    api = FastAPI(title="Gener-AI-tions", lifespan=lifespan,
+                  default_response_class=FlaskJSONResponse,
+                  docs_url=None, redoc_url=None, openapi_url=None)
+    api.state.config = flask_app.config
+    init_async_database(api, flask_app.config)
+
+    api.add_middleware(
+        CORSMiddleware,
+        allow_origins=flask_app.config.get("CORS_ALLOWED_ORIGINS", ["*"]),
+        allow_credentials=flask_app.config.get(
+            "CORS_SUPPORTS_CREDENTIALS", False),
+        allow_methods=["*"], allow_headers=["*"])
+    register_error_handlers(api)
+
+    api.include_router(projects.router, prefix="/api/projects")
+    api.include_router(individuals.router, prefix="/api/individuals")
+    api.include_router(identities.router, prefix="/api/identities")
+    api.include_router(relationships.router,
+                       prefix="/api/relationships")
+    api.mount("/", WSGIMiddleware(_isolated(flask_app)))
+    return api
+
+
+def _isolated(wsgi_app):
+    """
+    Runs every WSGI request in an empty context, so the Flask app always
+    pushes, and tears down, its own app context in the worker thread
+    instead of reusing one inherited from the event loop.
+    """
+
+    def application(environ, start_response):
+        return contextvars.Context().run(wsgi_app, environ,
+                                         start_response)
+
+    return application
+
+
+def register_error_handlers(api: FastAPI):
+    """
+    Registers error handlers returning the same bodies as the Flask app.
+    """
+
+    @api.exception_handler(AuthError)
+    async def handle_auth_error(request: Request, e: AuthError):
+        logger.warning(f"Authorization failed: {e}")
+        return FlaskJSONResponse({e.key: e.message}, status_code=401)
+
+    @api.exception_handler(ValidationError)
+    async def handle_validation_error(request: Request,
+                                      e: ValidationError):
+        logger.error(f"Pydantic Validation Error: {e}")
+        errors = [{'type': err['type'], 'loc': err['loc'],
+                   'msg': err['msg']} for err in e.errors()]
+        return error_response({"validation_errors": errors}, 400)
+
+    @api.exception_handler(HTTPException)
+    async def handle_http_exception(request: Request, e: HTTPException):
+        if isinstance(e, InternalServerError):
+            logger.error(f"InternalServerError: {e}")
+            return error_response("An internal error occurred.", 500)
+        logger.error(f"HTTP Exception: {e}")
+        return error_response(str(e), e.code)
+
+    @api.exception_handler(SQLAlchemyError)
+    async def handle_database_error(request: Request, e: SQLAlchemyError):
+        logger.error(f"Database error: {e}")
+        return error_response("An internal error occurred.", 500)
+
+    @api.exception_handler(Exception)
+    async def handle_general_exception(request: Request, e: Exception):
+        logger.error(f"Unhandled Exception: {type(e)}: {e}",
+                     exc_info=True)
+        return error_response("An unexpected error occurred.", 500)
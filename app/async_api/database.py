@@ -0,0 +1,44 @@
+from typing import AsyncIterator
+
+from fastapi import Request
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, \
+    create_async_engine
+
+
+def async_database_url(uri: str) -> URL:
+    """
+    Returns the asyncpg variant of a PostgreSQL database URL.
+
+    Raises:
+        ValueError: If the URL is not a PostgreSQL URL.
+    """
+    url = make_url(uri)
+    if url.get_backend_name() != "postgresql":
+        raise ValueError("The async API requires a PostgreSQL database.")
+    return url.set(drivername="postgresql+asyncpg")
+
+
+def init_async_database(api, config):
+    """
+    Creates the async engine and session factory of the app, sized like
+    the engine of the Flask app.
+    """
+    engine = create_async_engine(
+        async_database_url(config["SQLALCHEMY_DATABASE_URI"]),
+        echo=config.get("SQLALCHEMY_ECHO", False),
+        pool_size=config.get("SQLALCHEMY_POOL_SIZE", 5),
+        max_overflow=config.get("SQLALCHEMY_MAX_OVERFLOW", 10),
+    )
+    api.state.engine = engine
+    api.state.sessionmaker = async_sessionmaker(engine)
+
+
+async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    Dependency yielding the session of the current request. The services
+    run on it through `AsyncSession.run_sync`, so their statements are
+    awaited on asyncpg instead of blocking the event loop.
+    """
+    async with request.app.state.sessionmaker() as session:
+        yield session
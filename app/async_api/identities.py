@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from werkzeug.exceptions import BadRequest, NotFound
+
+from app.async_api.database import get_session
+from app.async_api.helpers import conditional_project_get, parse_body, \
+    success_response
+from app.async_api.security import ProjectAccess, project_access
+from app.schemas.identity_schema import IdentityCreate, \
+    IdentityUpdate, IdentityOut
+from app.services.identity_service import IdentityService
+
+router = APIRouter()
+
+
+@router.post("/")
+async def create_identity(
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Create a new identity for an individual within a project.
+    Expects JSON payload conforming to IdentityCreate schema.
+    """
+    identity_create, data = await parse_body(request, IdentityCreate)
+
+    def create(db):
+        new_identity = IdentityService(db=db).create_identity(
+            identity_create=identity_create,
+            is_primary=data.get('is_primary', False)
+        )
+        if not new_identity:
+            raise BadRequest("Failed to create identity.")
+        return IdentityOut.model_validate(new_identity,
+                                          from_attributes=True).model_dump()
+
+    identity = await session.run_sync(create)
+    return success_response("Identity created successfully",
+                            {"identity": identity}, 201)
+
+
+@router.get("/")
+@conditional_project_get
+async def list_identities(
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    List all identities associated with a specific project.
+    """
+    identities = await session.run_sync(
+        lambda db: [IdentityOut.model_validate(identity).model_dump()
+                    for identity in IdentityService(
+                        db=db).get_all_identities(
+                        project_id=access.project_id)])
+    return success_response("Identities fetched successfully.",
+                            {"identities": identities})
+
+
+@router.get("/{identity_id:int}")
+@conditional_project_get
+async def get_identity(
+        identity_id: int,
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Retrieve details of a specific identity by its ID.
+    """
+
+    def load(db):
+        identity = IdentityService(db=db).get_identity_by_id(identity_id)
+        if not identity:
+            raise NotFound("Identity not found.")
+        return IdentityOut.model_validate(identity).model_dump()
+
+    identity = await session.run_sync(load)
+    return success_response("Identity fetched successfully.",
+                            {"data": identity})
+
+
+@router.patch("/{identity_id:int}")
+async def update_identity(
+        identity_id: int,
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Update an existing identity.
+    Expects JSON payload conforming to IdentityUpdate schema.
+    """
+    identity_update, _ = await parse_body(request, IdentityUpdate)
+
+    def update(db):
+        updated_identity = IdentityService(db=db).update_identity(
+            identity_id, identity_update)
+        if not updated_identity:
+            raise BadRequest("Failed to update identity.")
+        return IdentityOut.model_validate(updated_identity).model_dump()
+
+    identity = await session.run_sync(update)
+    return success_response("Identity updated successfully",
+                            {"data": identity})
+
+
+@router.delete("/{identity_id:int}")
+async def delete_identity(
+        identity_id: int,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Delete an identity by its ID.
+    """
+    success = await session.run_sync(
+        lambda db: IdentityService(db=db).delete_identity(identity_id))
+    if not success:
+        raise BadRequest("Failed to delete identity.")
+    return success_response("Identity deleted successfully.")
@@ -0,0 +1,188 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from werkzeug.exceptions import BadRequest, NotFound
+
+from app.async_api.database import get_session
+from app.async_api.helpers import conditional_project_get, \
+    fragment_response, parse_body, success_response
+from app.async_api.security import ProjectAccess, project_access
+from app.models.enums_model import ChangeEntityEnum
+from app.schemas.individual_schema import IndividualCreate, \
+    IndividualUpdate
+from app.services.change_feed_service import ChangeFeedService
+from app.services.display_service import DisplayNameService
+from app.services.fragment_service import FragmentService
+from app.services.individual_service import IndividualService
+from app.utils.detail_cache import get_individual_detail, \
+    remember_individual_detail
+from app.utils.serializers import individual_dict
+
+router = APIRouter()
+
+
+@router.post("/")
+async def create_individual(
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Create a new individual within a project.
+    Expects JSON payload conforming to IndividualCreate schema.
+    """
+    individual_create, _ = await parse_body(request, IndividualCreate)
+
+    def create(db):
+        new_individual = IndividualService(db=db).create_individual(
+            user_id=access.user_id,
+            project_id=access.project_id,
+            individual_create=individual_create
+        )
+        if not new_individual:
+            raise BadRequest("Failed to create individual.")
+        return individual_dict(new_individual)
+
+    individual = await session.run_sync(create)
+    return success_response("Individual created successfully.",
+                            {"individual": individual}, 201)
+
+
+@router.get("/")
+@conditional_project_get
+async def list_individuals(
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    List all individuals within a specific project.
+    Optional query parameter 'q' for search.
+    """
+    search_query = request.query_params.get("q") or None
+    fragments = await session.run_sync(
+        lambda db: FragmentService(db=db).get_project_fragments(
+            user_id=access.user_id,
+            project_id=access.project_id,
+            search_query=search_query
+        ))
+    return fragment_response(
+        "Individuals fetched successfully.",
+        {"project_id": access.project_id,
+         "change_seq": request.state.change_seq},
+        "individuals", fragments)
+
+
+@router.get("/search")
+@conditional_project_get
+async def search_individuals(
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Search for individuals within a project based on a query.
+    Optional query parameter 'exclude_ids' can be provided as a comma-separated string.
+    """
+    q = request.query_params.get("q", "")
+    exclude_ids = request.query_params.get("exclude_ids", "")
+    try:
+        exclude_list = [int(x) for x in exclude_ids.split(",") if
+                        x.strip()] if exclude_ids.strip() else []
+    except ValueError:
+        raise BadRequest("Invalid exclude_ids parameter.")
+
+    fragments = await session.run_sync(
+        lambda db: FragmentService(db=db).get_project_fragments(
+            user_id=access.user_id,
+            project_id=access.project_id,
+            search_query=q if q else None,
+            exclude_ids=exclude_list
+        ))
+    return fragment_response("Search completed.", {}, "individuals",
+                             fragments)
+
+
+@router.get("/{individual_id:int}")
+@conditional_project_get
+async def get_individual(
+        individual_id: int,
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Retrieve detailed information of a specific individual by ID.
+    """
+
+    def load(db):
+        individual = IndividualService(db=db).get_individual_by_id(
+            individual_id=individual_id,
+            user_id=access.user_id,
+            project_id=access.project_id
+        )
+        if not individual:
+            raise NotFound("Individual not found.")
+        data = individual_dict(individual)
+        data.update(DisplayNameService(db=db).get_kinship(individual_id))
+        return data
+
+    # The detail cache may read and write its SQLite tier, so it is
+    # used from the thread pool rather than inside run_sync.
+    version = await session.run_sync(
+        lambda db: ChangeFeedService(db=db).entity_seq(
+            access.project_id, ChangeEntityEnum.INDIVIDUAL, individual_id))
+    data = await run_in_threadpool(get_individual_detail,
+                                   access.project_id, individual_id,
+                                   version)
+    if data is None:
+        data = await session.run_sync(load)
+        await run_in_threadpool(remember_individual_detail,
+                                access.project_id, individual_id,
+                                version, data)
+    return success_response("Individual fetched successfully.",
+                            {"data": data})
+
+
+@router.patch("/{individual_id:int}")
+async def update_individual(
+        individual_id: int,
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Update an existing individual.
+    Expects JSON payload conforming to IndividualUpdate schema.
+    """
+    individual_update, _ = await parse_body(request, IndividualUpdate)
+
+    def update(db):
+        updated = IndividualService(db=db).update_individual(
+            individual_id=individual_id,
+            user_id=access.user_id,
+            project_id=access.project_id,
+            individual_update=individual_update
+        )
+        if not updated:
+            raise BadRequest("Failed to update individual.")
+        return individual_dict(updated)
+
+    data = await session.run_sync(update)
+    return success_response("Individual updated successfully.",
+                            {"data": data})
+
+
+@router.delete("/{individual_id:int}")
+async def delete_individual(
+        individual_id: int,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Delete an individual by their ID.
+    """
+    success = await session.run_sync(
+        lambda db: IndividualService(db=db).delete_individual(
+            individual_id,
+            user_id=access.user_id,
+            project_id=access.project_id
+        ))
+    if not success:
+        raise BadRequest("Failed to delete individual.")
+    return success_response("Individual deleted successfully.")
+
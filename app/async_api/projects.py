@@ -0,0 +1,164 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from werkzeug.exceptions import BadRequest, Conflict, NotFound
+
+from app.async_api.database import get_session
+from app.async_api.helpers import parse_body, success_response
+from app.async_api.security import current_user_id
+from app.blueprints.api.projects import CHANGES_LIMIT
+from app.schemas.identity_schema import IdentityOut
+from app.schemas.project_schema import ProjectCreate, ProjectUpdate, \
+    ProjectOut
+from app.services.change_feed_service import ChangeFeedService
+from app.services.project_service import ProjectService
+from app.utils.access_cache import forget_project
+from app.utils.serializers import individual_dict, relationship_names, \
+    short_relationship_dict
+
+router = APIRouter()
+
+
+@router.post("/")
+async def create_project(
+        request: Request,
+        user_id: int = Depends(current_user_id),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Create a new project for the current user.
+    Expects JSON payload conforming to ProjectCreate schema.
+    """
+    project_create, _ = await parse_body(request, ProjectCreate)
+
+    def create(db):
+        new_project = ProjectService(db=db).create_project(
+            user_id=user_id, project_create=project_create)
+        if not new_project:
+            raise Conflict("Failed to create project.")
+        return ProjectOut.model_validate(new_project).model_dump()
+
+    project = await session.run_sync(create)
+    return success_response("Project created successfully.",
+                            {"project": project}, 201)
+
+
+@router.get("/")
+async def list_projects(
+        user_id: int = Depends(current_user_id),
+        session: AsyncSession = Depends(get_session)):
+    """
+    List all projects associated with the current user.
+    """
+    projects = await session.run_sync(
+        lambda db: [ProjectOut.model_validate(p).model_dump() for p in
+                    ProjectService(db=db).get_projects_by_user(
+                        user_id=user_id)])
+    return success_response("Projects fetched successfully.",
+                            {"projects": projects})
+
+
+@router.get("/{project_id:int}")
+async def get_project(
+        project_id: int,
+        user_id: int = Depends(current_user_id),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Retrieve details of a specific project by its ID.
+    """
+
+    def load(db):
+        project = ProjectService(db=db).get_project_by_id(
+            project_id=project_id)
+        if not project or project.user_id != user_id:
+            raise NotFound("Project not found or not owned by user.")
+        return ProjectOut.model_validate(project).model_dump()
+
+    project = await session.run_sync(load)
+    return success_response("Project retrieved successfully.",
+                            {"project": project})
+
+
+@router.put("/{project_id:int}")
+async def update_project(
+        project_id: int,
+        request: Request,
+        user_id: int = Depends(current_user_id),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Update an existing project.
+    Expects JSON payload conforming to ProjectUpdate schema.
+    """
+    project_update, _ = await parse_body(request, ProjectUpdate)
+
+    def update(db):
+        updated_project = ProjectService(db=db).update_project(
+            project_id=project_id, user_id=user_id,
+            project_update=project_update
+        )
+        if not updated_project:
+            raise Conflict(
+                "Failed to update project. Possibly name in use or project not found.")
+        return ProjectOut.model_validate(updated_project).model_dump()
+
+    project = await session.run_sync(update)
+    return success_response("Project updated successfully.",
+                            {"project": project})
+
+
+@router.get("/{project_id:int}/changes")
+async def list_changes(
+        project_id: int,
+        request: Request,
+        user_id: int = Depends(current_user_id),
+        session: AsyncSession = Depends(get_session)):
+    """
+    List the individuals, identities and relationships changed since a
+    change sequence, plus the ids of deleted ones.
+    Query parameter 'since' is the 'change_seq' of a previous response.
+    """
+    try:
+        since = int(request.query_params.get("since", ""))
+    except ValueError:
+        since = None
+    if since is None or since < 0:
+        raise BadRequest("A non-negative 'since' parameter is required.")
+
+    def load(db):
+        project = ProjectService(db=db).get_project_by_id(
+            project_id=project_id)
+        if not project or project.user_id != user_id:
+            raise NotFound("Project not found or not owned by user.")
+        changes = ChangeFeedService(db=db).get_changed_entities(
+            project_id=project_id, since=since, limit=CHANGES_LIMIT)
+        if not changes["reset"]:
+            changes["individuals"] = [
+                individual_dict(i) for i in changes["individuals"]]
+            changes["identities"] = [
+                IdentityOut.model_validate(i).model_dump()
+                for i in changes["identities"]]
+            names = relationship_names(db, changes["relationships"])
+            changes["relationships"] = [
+                short_relationship_dict(r, names)
+                for r in changes["relationships"]]
+        return changes
+
+    changes = await session.run_sync(load)
+    return success_response("Changes fetched successfully.", changes)
+
+
+@router.delete("/{project_id:int}")
+async def delete_project(
+        project_id: int,
+        user_id: int = Depends(current_user_id),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Delete a specific project by its ID.
+    """
+    success = await session.run_sync(
+        lambda db: ProjectService(db=db).delete_project(
+            project_id=project_id, user_id=user_id,
+            invalidate_cache=False))
+    if not success:
+        raise BadRequest("Failed to delete project or no permission.")
+    await run_in_threadpool(forget_project, project_id)
+    return success_response("Project deleted successfully.")
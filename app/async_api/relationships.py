@@ -0,0 +1,135 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from werkzeug.exceptions import BadRequest, NotFound
+
+from app.async_api.database import get_session
+from app.async_api.helpers import conditional_project_get, parse_body, \
+    success_response
+from app.async_api.security import ProjectAccess, project_access
+from app.schemas.relationship_schema import RelationshipCreate, \
+    RelationshipUpdate
+from app.services.relationship_service import RelationshipService
+from app.utils.serializers import relationship_names, \
+    short_relationship_dict
+
+router = APIRouter()
+
+
+@router.post("/")
+async def create_relationship(
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Create a new relationship between two individuals within a project.
+    Expects JSON payload conforming to RelationshipCreate schema.
+    """
+    relationship_create, _ = await parse_body(request, RelationshipCreate)
+
+    def create(db):
+        new_relationship = RelationshipService(db=db).create_relationship(
+            relationship_create, access.project_id)
+        if not new_relationship:
+            raise BadRequest("Failed to create relationship.")
+        return short_relationship_dict(
+            new_relationship, relationship_names(db, [new_relationship]))
+
+    try:
+        relationship = await session.run_sync(create)
+    except ValueError as ve:
+        raise BadRequest(str(ve))
+    return success_response("Relationship created successfully.",
+                            {"data": relationship}, 201)
+
+
+@router.get("/")
+@conditional_project_get
+async def list_relationships(
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    List all relationships associated with a specific project.
+    """
+
+    def load(db):
+        rels = RelationshipService(db=db).list_relationships(
+            access.project_id)
+        names = relationship_names(db, rels)
+        return [short_relationship_dict(r, names) for r in rels]
+
+    relationships = await session.run_sync(load)
+    return success_response("Relationships fetched successfully.",
+                            {"relationships": relationships})
+
+
+@router.get("/{relationship_id:int}")
+@conditional_project_get
+async def get_relationship(
+        relationship_id: int,
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Retrieve details of a specific relationship by its ID.
+    """
+
+    def load(db):
+        relationship = RelationshipService(
+            db=db).get_relationship_by_id(relationship_id)
+        if not relationship or \
+                relationship.project_id != access.project_id:
+            raise NotFound("Relationship not found.")
+        return short_relationship_dict(relationship,
+                                        relationship_names(db, [relationship]))
+
+    relationship = await session.run_sync(load)
+    return success_response("Relationship fetched successfully.",
+                            {"data": relationship})
+
+
+@router.patch("/{relationship_id:int}")
+async def update_relationship(
+        relationship_id: int,
+        request: Request,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Update an existing relationship.
+    Expects JSON payload conforming to RelationshipUpdate schema.
+    """
+    relationship_update, _ = await parse_body(request, RelationshipUpdate)
+
+    def update(db):
+        updated_rel = RelationshipService(db=db).update_relationship(
+            relationship_id, relationship_update, access.project_id)
+        if not updated_rel:
+            raise NotFound("Relationship not found or update failed.")
+        return short_relationship_dict(updated_rel,
+                                        relationship_names(db, [updated_rel]))
+
+    try:
+        relationship = await session.run_sync(update)
+    except ValueError as ve:
+        raise BadRequest(str(ve))
+    return success_response("Relationship updated successfully",
+                            {"data": relationship})
+
+
+@router.delete("/{relationship_id:int}")
+async def delete_relationship(
+        relationship_id: int,
+        access: ProjectAccess = Depends(project_access),
+        session: AsyncSession = Depends(get_session)):
+    """
+    Delete a specific relationship by its ID.
+    """
+    try:
+        success = await session.run_sync(
+            lambda db: RelationshipService(db=db).delete_relationship(
+                relationship_id, access.project_id))
+    except ValueError as ve:
+        raise BadRequest(str(ve))
+    if not success:
+        raise BadRequest("Failed to delete relationship.")
+    return success_response("Relationship deleted successfully.")
@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from hmac import compare_digest
+from typing import Optional
+
+import jwt
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from werkzeug.exceptions import BadRequest, NotFound
+
+from app.async_api.database import get_session
+from app.models.project_model import Project
+from app.services.project_service import ProjectService
+from app.utils.access_cache import is_cached_project_owner, \
+    remember_project_owner
+
+ACCESS_COOKIE = "access_token_cookie"
+CSRF_HEADER = "X-CSRF-TOKEN"
+CSRF_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class AuthError(Exception):
+    """
+    Raised when a request carries no valid access token. The response
+    matches the one of the Flask app for the same failure.
+    """
+
+    def __init__(self, message: str, key: str = "error"):
+        super().__init__(message)
+        self.message = message
+        self.key = key
+
+
+@dataclass
+class ProjectAccess:
+    """
+    The user and project of a project-scoped request. `project` is set
+    when the ownership check had to load it.
+    """
+    user_id: int
+    project_id: int
+    project: Optional[Project] = None
+
+
+def decode_access_token(request: Request) -> dict:
+    """
+    Decodes the access token cookie set by the Flask app's login, with
+    the same settings and CSRF double submit check as Flask-JWT-Extended.
+
+    Raises:
+        AuthError: If the token is missing, invalid or expired.
+    """
+    config = request.app.state.config
+    token = request.cookies.get(ACCESS_COOKIE)
+    if not token:
+        raise AuthError("Authorization token required.")
+    try:
+        claims = jwt.decode(token, config["JWT_SECRET_KEY"],
+                            algorithms=[config.get("JWT_ALGORITHM",
+                                                   "HS256")])
+    except jwt.ExpiredSignatureError:
+        raise AuthError("Token expired. Please log in again.")
+    except jwt.InvalidTokenError:
+        raise AuthError("Invalid token. Please log in again.")
+    if claims.get("type") != "access" or not claims.get("sub"):
+        raise AuthError("Invalid token. Please log in again.")
+
+    if config.get("JWT_COOKIE_CSRF_PROTECT") and \
+            request.method in CSRF_METHODS:
+        csrf = request.headers.get(CSRF_HEADER)
+        if not csrf:
+            raise AuthError("Missing CSRF token", key="msg")
+        if not compare_digest(csrf, claims.get("csrf", "")):
+            raise AuthError("CSRF double submit tokens do not match",
+                            key="msg")
+    return claims
+
+
+async def current_user_id(request: Request) -> int:
+    """
+    Dependency returning the ID of the authenticated user.
+
+    Raises:
+        AuthError: If the request carries no valid access token.
+        BadRequest: If the user ID in the token is invalid.
+    """
+    try:
+        return int(decode_access_token(request)["sub"])
+    except ValueError:
+        raise BadRequest("Invalid user ID in token.")
+
+
+async def project_access(
+        request: Request,
+        user_id: int = Depends(current_user_id),
+        session: AsyncSession = Depends(get_session)) -> ProjectAccess:
+    """
+    Dependency checking that the user owns the project given by the
+    'project_id' query parameter, like `require_project_access`. The
+    access cache may read its SQLite tier, so it is used from the
+    thread pool.
+
+    Raises:
+        BadRequest: If the project ID is missing.
+        NotFound: If the project is not found or not owned by the user.
+    """
+    try:
+        project_id = int(request.query_params.get("project_id", ""))
+    except ValueError:
+        project_id = None
+    if not project_id:
+        raise BadRequest("Project ID is required.")
+
+    access = ProjectAccess(user_id=user_id, project_id=project_id)
+    if not await run_in_threadpool(is_cached_project_owner, user_id,
+                                   project_id):
+        access.project = await session.run_sync(
+            lambda db: ProjectService(db=db).get_project_by_id(
+                project_id=project_id))
+        if not access.project or access.project.user_id != user_id:
+            raise NotFound("Project not found or not owned by the user.")
+        await run_in_threadpool(remember_project_owner, user_id,
+                                project_id)
+    return access
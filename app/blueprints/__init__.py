@@ -1,7 +1,9 @@
 from .api.admin import api_admin_bp
 from .api.auth import api_auth_bp
 from .api.identities import api_identities_bp
+from .api.imports import api_imports_bp
 from .api.individuals import api_individuals_bp
+from .api.jobs import api_jobs_bp
 from .api.projects import api_projects_bp
 from .api.relationships import api_relationships_bp
 from .api.swagger import swagger_bp, swaggerui_blueprint
@@ -27,8 +29,10 @@ def register_blueprints(app):
     app.register_blueprint(api_auth_bp, url_prefix='/api/auth')
     app.register_blueprint(api_identities_bp,
                            url_prefix='/api/identities')
+    app.register_blueprint(api_imports_bp, url_prefix='/api/imports')
     app.register_blueprint(api_individuals_bp,
                            url_prefix='/api/individuals')
+    app.register_blueprint(api_jobs_bp, url_prefix='/api/jobs')
     app.register_blueprint(api_users_bp, url_prefix='/api/users')
     app.register_blueprint(api_projects_bp,
                            url_prefix='/api/projects')
@@ -1,7 +1,9 @@
 from .admin import api_admin_bp
 from .auth import api_auth_bp
 from .identities import api_identities_bp
+from .imports import api_imports_bp
 from .individuals import api_individuals_bp
+from .jobs import api_jobs_bp
 from .projects import api_projects_bp
 from .relationships import api_relationships_bp
 from .swagger import swagger_bp, swaggerui_blueprint
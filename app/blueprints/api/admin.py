@@ -5,10 +5,12 @@ from flask_jwt_extended import jwt_required
 from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import InternalServerError
 
+from app.cache import cache_stats
 from app.extensions import SessionLocal
 from app.models.user_model import User
 from app.schemas.user_schema import UserOut
 from app.services.user_service import UserService
+from app.utils.query_metrics import query_metrics
 from app.utils.response_helpers import success_response
 from app.utils.security_decorators import admin_required
 
@@ -53,3 +55,32 @@ def list_users():
     except SQLAlchemyError as e:
         current_app.logger.error(f"Error fetching users: {e}")
         raise InternalServerError("Database error occurred.")
+
+
+@api_admin_bp.route('/cache', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_cache_stats():
+    """
+    Retrieve hit/miss metrics and sizes of the application caches in
+    this worker process. Accessible only to admins.
+    Returns:
+        JSON response containing the metrics per cache.
+    """
+    return success_response("Cache statistics fetched successfully.",
+                            {"caches": cache_stats()}, 200)
+
+
+@api_admin_bp.route('/queries', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_query_metrics():
+    """
+    Retrieve per-endpoint SQL query counts, database time and repeated
+    statement shapes recorded by this worker process. Accessible only
+    to admins.
+    Returns:
+        JSON response containing the metrics per endpoint.
+    """
+    return success_response("Query metrics fetched successfully.",
+                            {"endpoints": query_metrics()}, 200)
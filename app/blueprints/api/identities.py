@@ -6,11 +6,12 @@ from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import BadRequest, InternalServerError, \
     NotFound
 
-from app.extensions import SessionLocal
+from app.extensions import get_db_session
 from app.schemas.identity_schema import IdentityCreate, \
     IdentityUpdate, IdentityOut
 from app.services.identity_service import IdentityService
 from app.utils.response_helpers import success_response
+from app.utils.etag_utils import conditional_project_get
 from app.utils.security_decorators import require_project_access
 
 logger = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ def create_identity():
     except ValidationError as e:
         raise BadRequest(str(e))
 
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_identity = IdentityService(db=session)
         try:
             new_identity = service_identity.create_identity(
@@ -57,11 +58,12 @@ def create_identity():
 
 @api_identities_bp.route('/', methods=['GET'])
 @require_project_access
+@conditional_project_get
 def list_identities():
     """
     List all identities associated with a specific project.
     """
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_identity = IdentityService(db=session)
         try:
             identities = service_identity.get_all_identities(
@@ -82,11 +84,12 @@ def list_identities():
 
 @api_identities_bp.route('/<int:identity_id>', methods=['GET'])
 @require_project_access
+@conditional_project_get
 def get_identity(identity_id):
     """
     Retrieve details of a specific identity by its ID.
     """
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_identity = IdentityService(db=session)
         try:
             identity = service_identity.get_identity_by_id(
@@ -117,7 +120,7 @@ def update_identity(identity_id):
     except ValidationError as e:
         raise BadRequest(str(e))
 
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_identity = IdentityService(db=session)
         try:
             updated_identity = service_identity.update_identity(
@@ -139,7 +142,7 @@ def delete_identity(identity_id):
     """
     Delete an identity by its ID.
     """
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_identity = IdentityService(db=session)
         try:
             success = service_identity.delete_identity(identity_id)
@@ -0,0 +1,85 @@
+import io
+import logging
+
+from flask import Blueprint, request, g
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import BadRequest, InternalServerError
+
+from app.extensions import get_db_session
+from app.jobs import CSV_IMPORT, spool_upload, remove_files
+from app.schemas.job_schema import JobOut
+from app.services.import_service import ImportService
+from app.services.job_service import JobService
+from app.utils.response_helpers import success_response
+from app.utils.security_decorators import require_project_access
+
+logger = logging.getLogger(__name__)
+
+api_imports_bp = Blueprint('api_imports_bp', __name__)
+
+
+@api_imports_bp.route('/csv', methods=['POST'])
+@require_project_access
+def import_csv():
+    """
+    Bulk import individuals and relationships into a project.
+    Expects a multipart form with an 'individuals' CSV file and an
+    optional 'relationships' CSV file. With 'background=true' the files
+    are queued for the job worker and a job is returned instead.
+    """
+    individuals_file = request.files.get('individuals')
+    if not individuals_file:
+        raise BadRequest("An 'individuals' CSV file is required.")
+    relationships_file = request.files.get('relationships')
+
+    if request.args.get('background', 'false').lower() == 'true':
+        return _enqueue_import(individuals_file, relationships_file)
+
+    with get_db_session() as session:
+        service_import = ImportService(db=session)
+        try:
+            counts = service_import.import_csv(
+                user_id=g.user_id,
+                project_id=g.project_id,
+                individuals_csv=_text_stream(individuals_file),
+                relationships_csv=_text_stream(
+                    relationships_file) if relationships_file else None
+            )
+            return success_response("CSV import completed.",
+                                    {"imported": counts}, 201)
+        except ValueError as ve:
+            raise BadRequest(str(ve))
+        except SQLAlchemyError as e:
+            logger.error(f"Error importing CSV: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+def _enqueue_import(individuals_file, relationships_file):
+    """
+    Helper function to spool the uploaded files and queue an import job.
+    """
+    files = {'individuals': spool_upload(individuals_file)}
+    if relationships_file:
+        files['relationships'] = spool_upload(relationships_file)
+
+    with get_db_session() as session:
+        service_job = JobService(db=session)
+        try:
+            job = service_job.enqueue_job(
+                user_id=g.user_id, job_type=CSV_IMPORT,
+                payload={'files': files}, project_id=g.project_id)
+            return success_response(
+                "CSV import queued.",
+                {"job": JobOut.model_validate(job).model_dump()}, 202)
+        except SQLAlchemyError as e:
+            remove_files(files.values())
+            logger.error(f"Error queueing CSV import: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+def _text_stream(file_storage):
+    """
+    Helper function to wrap an uploaded file as a UTF-8 text stream.
+    """
+    return io.TextIOWrapper(file_storage.stream, encoding='utf-8-sig',
+                            newline='')
@@ -6,12 +6,20 @@ from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import BadRequest, NotFound, \
     InternalServerError
 
-from app.extensions import SessionLocal
+from app.extensions import get_db_session
+from app.models.enums_model import ChangeEntityEnum
 from app.schemas.identity_schema import IdentityIdOut
 from app.schemas.individual_schema import IndividualCreate, \
     IndividualUpdate, IndividualOut
+from app.services.change_feed_service import ChangeFeedService
+from app.services.display_service import DisplayNameService
+from app.services.fragment_service import FragmentService
 from app.services.individual_service import IndividualService
-from app.utils.response_helpers import success_response
+from app.utils.detail_cache import get_individual_detail, \
+    remember_individual_detail
+from app.utils.response_helpers import fragment_response, \
+    success_response
+from app.utils.etag_utils import conditional_project_get
 from app.utils.security_decorators import require_project_access
 
 logger = logging.getLogger(__name__)
@@ -34,7 +42,7 @@ def create_individual():
     except ValidationError as e:
         raise BadRequest(str(e))
 
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_individual = IndividualService(db=session)
         try:
             new_individual = service_individual.create_individual(
@@ -60,32 +68,26 @@ def create_individual():
 
 @api_individuals_bp.route("/", methods=["GET"])
 @require_project_access
+@conditional_project_get
 def list_individuals():
     """
     List all individuals within a specific project.
     Optional query parameter 'q' for search.
     """
     search_query = request.args.get("q", type=str, default=None)
-    with SessionLocal() as session:
-        service_individual = IndividualService(db=session)
+    with get_db_session() as session:
+        service_fragment = FragmentService(db=session)
         try:
-            individuals = service_individual.get_individuals_by_project(
+            fragments = service_fragment.get_project_fragments(
                 user_id=g.user_id,
                 project_id=g.project_id,
                 search_query=search_query if search_query else None
             )
-            individuals_out = []
-            for individual in individuals:
-                individual_out = IndividualOut.model_validate(
-                    individual, from_attributes=True)
-                individual_out.identities = [IdentityIdOut(id=i.id)
-                                             for i in
-                                             individual.identities]
-                individuals_out.append(individual_out.model_dump())
-            return success_response(
+            return fragment_response(
                 "Individuals fetched successfully.",
                 {"project_id": g.project_id,
-                 "individuals": individuals_out})
+                 "change_seq": g.change_seq},
+                "individuals", fragments)
         except SQLAlchemyError as e:
             logger.error(f"Error listing individuals: {e}")
             raise InternalServerError("Database error occurred.")
@@ -93,29 +95,35 @@ def list_individuals():
 
 @api_individuals_bp.route("/<int:individual_id>", methods=["GET"])
 @require_project_access
+@conditional_project_get
 def get_individual(individual_id):
     """
     Retrieve detailed information of a specific individual by ID.
     """
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_individual = IndividualService(db=session)
         try:
-            individual = service_individual.get_individual_by_id(
-                individual_id=individual_id,
-                user_id=g.user_id,
-                project_id=g.project_id
-            )
-            if not individual:
-                raise NotFound("Individual not found.")
-            individual_out = IndividualOut.model_validate(individual,
-                                                          from_attributes=True)
-            individual_out.identities = [IdentityIdOut(id=i.id) for i
-                                         in individual.identities]
-            data = individual_out.model_dump()
-            data["parents"] = individual.parents
-            data["children"] = individual.children
-            data["partners"] = individual.partners
-            data["siblings"] = individual.siblings
+            version = ChangeFeedService(db=session).entity_seq(
+                g.project_id, ChangeEntityEnum.INDIVIDUAL, individual_id)
+            data = get_individual_detail(g.project_id, individual_id,
+                                         version)
+            if data is None:
+                individual = service_individual.get_individual_by_id(
+                    individual_id=individual_id,
+                    user_id=g.user_id,
+                    project_id=g.project_id
+                )
+                if not individual:
+                    raise NotFound("Individual not found.")
+                individual_out = IndividualOut.model_validate(
+                    individual, from_attributes=True)
+                individual_out.identities = [IdentityIdOut(id=i.id) for i
+                                             in individual.identities]
+                data = individual_out.model_dump()
+                data.update(DisplayNameService(
+                    db=session).get_kinship(individual_id))
+                remember_individual_detail(g.project_id, individual_id,
+                                           version, data)
             return success_response(
                 "Individual fetched successfully.", {"data": data})
         except SQLAlchemyError as e:
@@ -138,7 +146,7 @@ def update_individual(individual_id):
     except ValidationError as e:
         raise BadRequest(str(e))
 
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_individual = IndividualService(db=session)
         try:
             updated = service_individual.update_individual(
@@ -168,7 +176,7 @@ def delete_individual(individual_id):
     """
     Delete an individual by their ID.
     """
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_individual = IndividualService(db=session)
         try:
             success = service_individual.delete_individual(
@@ -186,8 +194,40 @@ def delete_individual(individual_id):
             raise InternalServerError("Database error occurred.")
 
 
+@api_individuals_bp.route("/<int:individual_id>/restore",
+                          methods=["POST"])
+@require_project_access
+def restore_individual(individual_id):
+    """
+    Restore a deleted individual, with the identities and relationships
+    deleted along with it, until the purger removes them.
+    """
+    with get_db_session() as session:
+        service_individual = IndividualService(db=session)
+        try:
+            individual = service_individual.restore_individual(
+                individual_id,
+                user_id=g.user_id,
+                project_id=g.project_id
+            )
+            if not individual:
+                raise NotFound("Deleted individual not found.")
+            individual_out = IndividualOut.model_validate(
+                individual, from_attributes=True)
+            individual_out.identities = [
+                IdentityIdOut(id=identity.id) for identity in
+                individual.identities]
+            return success_response(
+                "Individual restored successfully.",
+                {"individual": individual_out.model_dump()})
+        except SQLAlchemyError as e:
+            logger.error(f"Error restoring individual: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
 @api_individuals_bp.route("/search", methods=["GET"])
 @require_project_access
+@conditional_project_get
 def search_individuals():
     """
     Search for individuals within a project based on a query.
@@ -201,32 +241,17 @@ def search_individuals():
     except ValueError:
         raise BadRequest("Invalid exclude_ids parameter.")
 
-    with SessionLocal() as session:
+    with get_db_session() as session:
         try:
-            from app.services.project_service import ProjectService
-            service_project = ProjectService(db=session)
-            project = service_project.get_project_by_id(
-                project_id=g.project_id)
-            if not project or project.user_id != g.user_id:
-                raise NotFound(
-                    "Project not found or not owned by this user.")
-            service_individual = IndividualService(db=session)
-            individuals = service_individual.get_individuals_by_project(
+            service_fragment = FragmentService(db=session)
+            fragments = service_fragment.get_project_fragments(
                 user_id=g.user_id,
                 project_id=g.project_id,
-                search_query=q if q else None
+                search_query=q if q else None,
+                exclude_ids=exclude_list
             )
-            filtered = [i for i in individuals if
-                        i.id not in exclude_list]
-            results = []
-            for i in filtered:
-                out = IndividualOut.model_validate(i,
-                                                   from_attributes=True)
-                out.identities = [IdentityIdOut(id=ident.id) for
-                                  ident in i.identities]
-                results.append(out.model_dump())
-            return success_response("Search completed.",
-                                    {"individuals": results})
+            return fragment_response("Search completed.", {},
+                                     "individuals", fragments)
         except SQLAlchemyError as e:
             logger.error(f"Error searching individuals: {e}")
             raise InternalServerError("Database error occurred.")
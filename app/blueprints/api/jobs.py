@@ -0,0 +1,114 @@
+import logging
+import os
+
+from flask import Blueprint, request, send_file
+from flask_jwt_extended import jwt_required
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import NotFound, Conflict, InternalServerError
+
+from app.extensions import SessionLocal
+from app.models.enums_model import JobStatusEnum
+from app.schemas.job_schema import JobOut
+from app.services.job_service import JobService
+from app.utils.auth_utils import get_current_user_id
+from app.utils.response_helpers import success_response
+
+logger = logging.getLogger(__name__)
+
+api_jobs_bp = Blueprint('api_jobs_bp', __name__)
+
+
+@api_jobs_bp.route('/', methods=['GET'])
+@jwt_required()
+def list_jobs():
+    """
+    List the most recent background jobs of the current user.
+    Optional query parameter 'project_id' to filter by project.
+    """
+    user_id = get_current_user_id()
+    project_id = request.args.get('project_id', type=int)
+    with SessionLocal() as session:
+        service_job = JobService(db=session)
+        try:
+            jobs = service_job.get_jobs(user_id=user_id,
+                                        project_id=project_id)
+            jobs_out = [JobOut.model_validate(j).model_dump()
+                        for j in jobs]
+            return success_response("Jobs fetched successfully.",
+                                    {"jobs": jobs_out})
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during job listing: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+@api_jobs_bp.route('/<int:job_id>', methods=['GET'])
+@jwt_required()
+def get_job(job_id):
+    """
+    Retrieve the status and progress of a background job.
+    """
+    user_id = get_current_user_id()
+    with SessionLocal() as session:
+        service_job = JobService(db=session)
+        try:
+            job = service_job.get_job(job_id=job_id, user_id=user_id)
+            if not job:
+                raise NotFound("Job not found.")
+            return success_response(
+                "Job retrieved successfully.",
+                {"job": JobOut.model_validate(job).model_dump()})
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during job retrieval: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+@api_jobs_bp.route('/<int:job_id>/cancel', methods=['POST'])
+@jwt_required()
+def cancel_job(job_id):
+    """
+    Cancel a queued job, or request a running job to stop.
+    """
+    user_id = get_current_user_id()
+    with SessionLocal() as session:
+        service_job = JobService(db=session)
+        try:
+            job = service_job.cancel_job(job_id=job_id,
+                                         user_id=user_id)
+            if not job:
+                raise NotFound("Job not found.")
+            if job.is_finished and \
+                    job.status != JobStatusEnum.CANCELLED:
+                raise Conflict("Job has already finished.")
+            return success_response(
+                "Job cancellation requested.",
+                {"job": JobOut.model_validate(job).model_dump()})
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during job cancellation: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+@api_jobs_bp.route('/<int:job_id>/download', methods=['GET'])
+@jwt_required()
+def download_job_result(job_id):
+    """
+    Download the result file of a completed job, such as a snapshot.
+    """
+    user_id = get_current_user_id()
+    with SessionLocal() as session:
+        service_job = JobService(db=session)
+        try:
+            job = service_job.get_job(job_id=job_id, user_id=user_id)
+            if not job:
+                raise NotFound("Job not found.")
+            if job.status != JobStatusEnum.COMPLETED or \
+                    not job.result_file or \
+                    not os.path.exists(job.result_file):
+                raise NotFound("Job has no result file.")
+            extension = os.path.splitext(job.result_file)[1]
+            return send_file(job.result_file,
+                             mimetype='application/octet-stream',
+                             as_attachment=True,
+                             download_name=f"job-{job.id}{extension}")
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during job download: {e}")
+            raise InternalServerError("Database error occurred.")
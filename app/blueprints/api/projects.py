@@ -1,21 +1,34 @@
+import io
 import logging
+import os
 
-from flask import Blueprint, request
+from flask import Blueprint, current_app, request, send_file
 from flask_jwt_extended import jwt_required
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import BadRequest, NotFound, Conflict, \
-    InternalServerError
+    InternalServerError, RequestEntityTooLarge
 
 from app.extensions import SessionLocal
+from app.jobs import PROJECT_CLONE, SNAPSHOT_EXPORT, SNAPSHOT_RESTORE, \
+    remove_files, spool_upload
+from app.schemas.identity_schema import IdentityOut
+from app.schemas.job_schema import JobOut
 from app.schemas.project_schema import ProjectCreate, ProjectUpdate, \
-    ProjectOut
+    ProjectClone, ProjectOut
+from app.services.change_feed_service import ChangeFeedService
+from app.services.job_service import JobService
 from app.services.project_service import ProjectService
+from app.services.snapshot_service import SnapshotService
 from app.utils.auth_utils import get_current_user_id
 from app.utils.response_helpers import success_response
+from app.utils.serializers import individual_dict, relationship_names, \
+    short_relationship_dict
 
 logger = logging.getLogger(__name__)
 
+CHANGES_LIMIT = 1000
+
 api_projects_bp = Blueprint('api_projects_bp', __name__)
 
 
@@ -139,11 +152,175 @@ def update_project(project_id):
             raise InternalServerError("Database error occurred.")
 
 
+@api_projects_bp.route('/<int:project_id>/changes', methods=['GET'])
+@jwt_required()
+def list_changes(project_id):
+    """
+    List the individuals, identities and relationships changed since a
+    change sequence, plus the ids of deleted ones.
+    Query parameter 'since' is the 'change_seq' of a previous response.
+    """
+    user_id = get_current_user_id()
+    since = request.args.get('since', type=int)
+    if since is None or since < 0:
+        raise BadRequest("A non-negative 'since' parameter is required.")
+
+    with SessionLocal() as session:
+        project = ProjectService(db=session).get_project_by_id(
+            project_id=project_id)
+        if not project or project.user_id != user_id:
+            raise NotFound("Project not found or not owned by user.")
+        service_feed = ChangeFeedService(db=session)
+        try:
+            changes = service_feed.get_changed_entities(
+                project_id=project_id, since=since, limit=CHANGES_LIMIT)
+            if not changes["reset"]:
+                changes["individuals"] = [
+                    individual_dict(i) for i in changes["individuals"]]
+                changes["identities"] = [
+                    IdentityOut.model_validate(i).model_dump()
+                    for i in changes["identities"]]
+                names = relationship_names(session, changes["relationships"])
+                changes["relationships"] = [
+                    short_relationship_dict(r, names)
+                    for r in changes["relationships"]]
+            return success_response("Changes fetched successfully.",
+                                    changes)
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during change listing: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+@api_projects_bp.route('/<int:project_id>/clone', methods=['POST'])
+@jwt_required()
+def clone_project(project_id):
+    """
+    Clone a project, including its individuals, identities and
+    relationships, for the current user.
+    Accepts an optional JSON payload conforming to ProjectClone schema.
+    With 'background=true' the clone runs as a job.
+    """
+    user_id = get_current_user_id()
+    data = request.get_json(silent=True) or {}
+    try:
+        project_clone = ProjectClone.model_validate(data)
+    except ValidationError as e:
+        raise BadRequest(str(e))
+
+    if _run_in_background():
+        return _enqueue_project_job(
+            user_id, project_id, PROJECT_CLONE,
+            project_clone.model_dump(exclude_none=True),
+            "Project clone queued.")
+
+    with SessionLocal() as session:
+        service_project = ProjectService(db=session)
+        try:
+            new_project = service_project.clone_project(
+                project_id=project_id, user_id=user_id,
+                project_clone=project_clone)
+            if not new_project:
+                raise NotFound(
+                    "Project not found or not owned by user.")
+            project_out = ProjectOut.model_validate(
+                new_project).model_dump()
+            return success_response("Project cloned successfully.",
+                                    {"project": project_out}, 201)
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during project clone: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+@api_projects_bp.route('/<int:project_id>/snapshot', methods=['GET'])
+@jwt_required()
+def export_snapshot(project_id):
+    """
+    Download a compact binary snapshot of a project.
+    With 'background=true' the snapshot is written by a job and can be
+    downloaded from the job once it has completed.
+    """
+    user_id = get_current_user_id()
+    if _run_in_background():
+        return _enqueue_project_job(user_id, project_id,
+                                    SNAPSHOT_EXPORT, {},
+                                    "Snapshot export queued.")
+    with SessionLocal() as session:
+        service_snapshot = SnapshotService(db=session)
+        try:
+            buffer = io.BytesIO()
+            counts = service_snapshot.export_project(
+                project_id=project_id, user_id=user_id,
+                fileobj=buffer)
+            if counts is None:
+                raise NotFound(
+                    "Project not found or not owned by user.")
+            buffer.seek(0)
+            return send_file(buffer,
+                             mimetype='application/octet-stream',
+                             as_attachment=True,
+                             download_name=f"project-{project_id}.gaisnap")
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Database error during snapshot export: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+@api_projects_bp.route('/snapshot', methods=['POST'])
+@jwt_required()
+def restore_snapshot():
+    """
+    Restore a project snapshot into a new project for the current user.
+    Expects a multipart form with a 'snapshot' file of at most
+    SNAPSHOT_MAX_BYTES and an optional 'name'. The upload is spooled
+    to disk and memory-mapped; with 'background=true' the restore runs
+    as a job.
+    """
+    user_id = get_current_user_id()
+    max_bytes = current_app.config["SNAPSHOT_MAX_BYTES"]
+    if request.content_length and request.content_length > max_bytes:
+        raise RequestEntityTooLarge(
+            f"Snapshots are limited to {max_bytes} bytes.")
+    snapshot_file = request.files.get('snapshot')
+    if not snapshot_file:
+        raise BadRequest("A 'snapshot' file is required.")
+    name = request.form.get('name') or None
+
+    path = spool_upload(snapshot_file)
+    if os.path.getsize(path) > max_bytes:
+        remove_files([path])
+        raise RequestEntityTooLarge(
+            f"Snapshots are limited to {max_bytes} bytes.")
+    if _run_in_background():
+        return _enqueue_restore(user_id, path, name)
+
+    with SessionLocal() as session:
+        service_snapshot = SnapshotService(db=session)
+        try:
+            new_project = service_snapshot.restore_project(
+                user_id=user_id, source=path, name=name)
+            if not new_project:
+                raise Conflict("Failed to restore snapshot.")
+            project_out = ProjectOut.model_validate(
+                new_project).model_dump()
+            return success_response(
+                "Snapshot restored successfully.",
+                {"project": project_out}, 201)
+        except ValueError as ve:
+            raise BadRequest(str(ve))
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Database error during snapshot restore: {e}")
+            raise InternalServerError("Database error occurred.")
+        finally:
+            remove_files([path])
+
+
 @api_projects_bp.route('/<int:project_id>', methods=['DELETE'])
 @jwt_required()
 def delete_project(project_id):
     """
     Delete a specific project by its ID.
+    The project can be restored until the purger removes it.
     """
     user_id = get_current_user_id()
     with SessionLocal() as session:
@@ -160,3 +337,79 @@ def delete_project(project_id):
             logger.error(
                 f"Database error during project deletion: {e}")
             raise InternalServerError("Database error occurred.")
+
+
+@api_projects_bp.route('/<int:project_id>/restore', methods=['POST'])
+@jwt_required()
+def restore_project(project_id):
+    """
+    Restore a deleted project until the purger removes it.
+    """
+    user_id = get_current_user_id()
+    with SessionLocal() as session:
+        service_project = ProjectService(db=session)
+        try:
+            project = service_project.restore_project(
+                project_id=project_id, user_id=user_id)
+            if not project:
+                raise NotFound(
+                    "Deleted project not found or not owned by user.")
+            project_out = ProjectOut.model_validate(project).model_dump()
+            return success_response("Project restored successfully.",
+                                    {"project": project_out})
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Database error during project restore: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+def _run_in_background() -> bool:
+    """
+    Helper function to check whether a request asks for a background job.
+    """
+    return request.args.get('background', 'false').lower() == 'true'
+
+
+def _enqueue_project_job(user_id, project_id, job_type, payload,
+                         message):
+    """
+    Helper function to queue a job for a project owned by the user.
+    """
+    with SessionLocal() as session:
+        project = ProjectService(db=session).get_project_by_id(
+            project_id=project_id)
+        if not project or project.user_id != user_id:
+            raise NotFound("Project not found or not owned by user.")
+        service_job = JobService(db=session)
+        try:
+            job = service_job.enqueue_job(
+                user_id=user_id, job_type=job_type, payload=payload,
+                project_id=project_id)
+            return success_response(
+                message, {"job": JobOut.model_validate(job).model_dump()},
+                202)
+        except SQLAlchemyError as e:
+            logger.error(f"Error queueing {job_type} job: {e}")
+            raise InternalServerError("Database error occurred.")
+
+
+def _enqueue_restore(user_id, path, name):
+    """
+    Helper function to queue the restore of a spooled snapshot.
+    """
+    payload = {"files": {"snapshot": path}}
+    if name:
+        payload["name"] = name
+    with SessionLocal() as session:
+        service_job = JobService(db=session)
+        try:
+            job = service_job.enqueue_job(
+                user_id=user_id, job_type=SNAPSHOT_RESTORE,
+                payload=payload)
+            return success_response(
+                "Snapshot restore queued.",
+                {"job": JobOut.model_validate(job).model_dump()}, 202)
+        except SQLAlchemyError as e:
+            remove_files([path])
+            logger.error(f"Error queueing snapshot restore: {e}")
+            raise InternalServerError("Database error occurred.")
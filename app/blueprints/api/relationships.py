@@ -6,12 +6,15 @@ from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import BadRequest, NotFound, \
     InternalServerError
 
-from app.extensions import SessionLocal
+from app.extensions import get_db_session
 from app.schemas.relationship_schema import RelationshipCreate, \
     RelationshipUpdate
 from app.services.relationship_service import RelationshipService
 from app.utils.response_helpers import success_response
+from app.utils.etag_utils import conditional_project_get
 from app.utils.security_decorators import require_project_access
+from app.utils.serializers import relationship_names, \
+    short_relationship_dict
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +36,7 @@ def create_relationship():
     except ValidationError as e:
         raise BadRequest(str(e))
 
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_relationship = RelationshipService(db=session)
         try:
             new_relationship = service_relationship.create_relationship(
@@ -43,7 +46,8 @@ def create_relationship():
                 raise BadRequest("Failed to create relationship.")
             return success_response(
                 "Relationship created successfully.",
-                {"data": _short_relationship_dict(new_relationship)},
+                {"data": short_relationship_dict(
+                    new_relationship, relationship_names(session, [new_relationship]))},
                 201
             )
         except ValueError as ve:
@@ -55,17 +59,19 @@ def create_relationship():
 
 @api_relationships_bp.route("/", methods=["GET"])
 @require_project_access
+@conditional_project_get
 def list_relationships():
     """
     List all relationships associated with a specific project.
     """
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_relationship = RelationshipService(db=session)
         try:
             rels = service_relationship.list_relationships(
                 g.project_id)
-            relationship_out = [_short_relationship_dict(r) for r in
-                                rels]
+            names = relationship_names(session, rels)
+            relationship_out = [short_relationship_dict(r, names)
+                                for r in rels]
             return success_response(
                 "Relationships fetched successfully.",
                 {"relationships": relationship_out})
@@ -77,11 +83,12 @@ def list_relationships():
 @api_relationships_bp.route("/<int:relationship_id>",
                             methods=["GET"])
 @require_project_access
+@conditional_project_get
 def get_relationship(relationship_id):
     """
     Retrieve details of a specific relationship by its ID.
     """
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_relationship = RelationshipService(db=session)
         try:
             relationship = service_relationship.get_relationship_by_id(
@@ -90,7 +97,8 @@ def get_relationship(relationship_id):
                 raise NotFound("Relationship not found.")
             return success_response(
                 "Relationship fetched successfully.",
-                {"data": _short_relationship_dict(relationship)})
+                {"data": short_relationship_dict(
+                    relationship, relationship_names(session, [relationship]))})
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving relationship: {e}")
             raise InternalServerError("Database error occurred.")
@@ -112,7 +120,7 @@ def update_relationship(relationship_id):
     except ValidationError as e:
         raise BadRequest(str(e))
 
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_relationship = RelationshipService(db=session)
         try:
             updated_rel = service_relationship.update_relationship(
@@ -122,7 +130,8 @@ def update_relationship(relationship_id):
                     "Relationship not found or update failed.")
             return success_response(
                 "Relationship updated successfully",
-                {"data": _short_relationship_dict(updated_rel)})
+                {"data": short_relationship_dict(
+                    updated_rel, relationship_names(session, [updated_rel]))})
         except ValueError as ve:
             raise BadRequest(str(ve))
         except SQLAlchemyError as e:
@@ -137,7 +146,7 @@ def delete_relationship(relationship_id):
     """
     Delete a specific relationship by its ID.
     """
-    with SessionLocal() as session:
+    with get_db_session() as session:
         service_relationship = RelationshipService(db=session)
         try:
             success = service_relationship.delete_relationship(
@@ -151,31 +160,3 @@ def delete_relationship(relationship_id):
         except SQLAlchemyError as e:
             logger.error(f"Error deleting relationship: {e}")
             raise InternalServerError("Database error occurred.")
-
-
-def _short_relationship_dict(rel):
-    """
-    Helper function to return a compact dictionary representation of a relationship.
-    """
-    return {
-        "id": rel.id,
-        "initial_relationship": rel.initial_relationship,
-        "relationship_detail": (
-                    rel.relationship_detail_horizontal or rel.relationship_detail_vertical),
-        "notes": rel.notes,
-        "union_date": rel.union_date,
-        "union_place": rel.union_place,
-        "dissolution_date": rel.dissolution_date,
-        "created_at": rel.created_at,
-        "updated_at": rel.updated_at,
-        "individual": {
-            "id": rel.individual.id,
-            "first_name": rel.individual.first_name,
-            "last_name": rel.individual.last_name
-        },
-        "related": {
-            "id": rel.related.id,
-            "first_name": rel.related.first_name,
-            "last_name": rel.related.last_name
-        }
-    }
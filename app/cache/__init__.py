@@ -0,0 +1,12 @@
+from .registry import (
+    CLAIMS,
+    INDIVIDUAL_DETAILS,
+    PROJECT_ACCESS,
+    USERS,
+    cache_stats,
+    clear_caches,
+    configure_caches,
+    get_cache
+)
+from .store import SQLiteStore
+from .tiered import CacheStats, TieredCache
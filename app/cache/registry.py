@@ -0,0 +1,90 @@
+from typing import Dict, Optional
+
+from app.cache.store import SQLiteStore
+from app.cache.tiered import TieredCache
+from app.schemas.user_schema import UserSnapshot
+
+PROJECT_ACCESS = "project_access"
+USERS = "users"
+CLAIMS = "claims"
+INDIVIDUAL_DETAILS = "individual_details"
+
+_caches: Dict[str, TieredCache] = {}
+_store: Optional[SQLiteStore] = None
+
+
+def _cache_settings(config) -> Dict[str, dict]:
+    """
+    Returns the constructor arguments of the application's caches.
+    """
+    return {
+        PROJECT_ACCESS: {
+            "ttl": config.get("PROJECT_ACCESS_CACHE_TTL", 30),
+            "local_maxsize": config.get("PROJECT_ACCESS_CACHE_SIZE", 4096)},
+        USERS: {
+            "ttl": config.get("USER_CACHE_TTL", 60),
+            "local_maxsize": config.get("USER_CACHE_SIZE", 1024),
+            "model": UserSnapshot},
+        # Claims decide admin rights, so they are never served from a
+        # possibly stale in-process tier.
+        CLAIMS: {
+            "ttl": config.get("CLAIMS_CACHE_TTL", 300),
+            "local_maxsize": 0},
+        INDIVIDUAL_DETAILS: {
+            "ttl": config.get("INDIVIDUAL_DETAIL_CACHE_TTL", 3600),
+            "local_maxsize": config.get("INDIVIDUAL_DETAIL_CACHE_SIZE",
+                                        2048),
+            "local_ttl": 300},
+    }
+
+
+def configure_caches(config):
+    """
+    (Re)creates the application's caches from configuration. The
+    shared tier is disabled when CACHE_SHARED_ENABLED is false or no
+    CACHE_PATH is set.
+
+    Raises:
+        PermissionError: If the cache file or its directory belongs to
+            another user.
+    """
+    global _store
+    _store = None
+    if config.get("CACHE_SHARED_ENABLED", True) and \
+            config.get("CACHE_PATH"):
+        _store = SQLiteStore(
+            config["CACHE_PATH"],
+            max_entries=config.get("CACHE_MAX_ENTRIES", 50000))
+    sync_interval = config.get("CACHE_SYNC_INTERVAL", 1.0)
+    _caches.clear()
+    for name, settings in _cache_settings(config).items():
+        _caches[name] = TieredCache(name, store=_store,
+                                    sync_interval=sync_interval,
+                                    **settings)
+
+
+def get_cache(name: str) -> TieredCache:
+    """
+    Returns a named cache. Before configure_caches() runs, in-process
+    caches with default settings are used.
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = TieredCache(
+            name, **_cache_settings({})[name])
+    return cache
+
+
+def cache_stats() -> Dict[str, dict]:
+    """
+    Returns the metrics of all caches, keyed by name.
+    """
+    return {name: cache.info() for name, cache in _caches.items()}
+
+
+def clear_caches():
+    """
+    Drops all entries of all caches.
+    """
+    for cache in _caches.values():
+        cache.clear()
@@ -0,0 +1,260 @@
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from app.utils.private_files import create_private_file, \
+    ensure_private_dir
+
+logger = logging.getLogger(__name__)
+
+ALL = "*"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at
+    ON cache_entries (accessed_at);
+CREATE TABLE IF NOT EXISTS cache_tags (
+    namespace TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (namespace, tag, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cache_invalidations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    namespace TEXT NOT NULL,
+    tag TEXT,
+    key TEXT,
+    created_at REAL NOT NULL
+);
+"""
+
+Invalidation = Tuple[int, str, Optional[str], Optional[str]]
+
+
+class SQLiteStore:
+    """
+    Shared cache tier kept in a local SQLite file, so that all worker
+    processes on a host see the same entries.
+
+    Besides the entries and their tags, the store keeps a log of
+    invalidations. Processes replay the log to drop stale entries from
+    their in-process tier, and writers use it to refuse values that
+    were loaded before a concurrent invalidation.
+
+    Eviction is approximately LRU: `accessed_at` is refreshed at most
+    once per `touch_interval`, and when the store grows past
+    `max_entries` the least recently accessed entries are deleted.
+
+    The file and its directory are private to the application user,
+    since every worker trusts what it reads from the store.
+    """
+
+    def __init__(self, path: str, max_entries: int = 50000,
+                 log_retention: float = 3600,
+                 touch_interval: float = 60):
+        self.path = path
+        self.max_entries = max_entries
+        ensure_private_dir(os.path.dirname(os.path.abspath(path)))
+        os.close(create_private_file(path))
+        self.log_retention = log_retention
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """
+        Returns the stored value, or None if missing or expired.
+        """
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, expires_at, accessed_at FROM cache_entries "
+            "WHERE namespace = ? AND key = ?", (namespace, key)).fetchone()
+        if row is None or row[1] <= now:
+            return None
+        if row[2] < now - self.touch_interval:
+            with conn:
+                conn.execute(
+                    "UPDATE cache_entries SET accessed_at = ? "
+                    "WHERE namespace = ? AND key = ?",
+                    (now, namespace, key))
+        return row[0]
+
+    def set(self, namespace: str, key: str, value: str, ttl: float,
+            tags: Iterable[str] = (),
+            since: Optional[int] = None) -> bool:
+        """
+        Stores a value with a time-to-live and tags.
+
+        If `since` is given, the value is only stored if the key, any of
+        its tags or the whole namespace was not invalidated after that
+        log sequence.
+
+        Returns:
+            bool: True if the value was stored.
+        """
+        tags = list(tags)
+        conn = self._connection()
+        now = time.time()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if since is not None and self._invalidated_since(
+                    conn, namespace, key, tags, since):
+                return False
+            conn.execute(
+                "INSERT INTO cache_entries "
+                "(namespace, key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (namespace, key) DO UPDATE SET "
+                "value = excluded.value, expires_at = excluded.expires_at, "
+                "accessed_at = excluded.accessed_at",
+                (namespace, key, value, now + ttl, now))
+            conn.execute(
+                "DELETE FROM cache_tags WHERE namespace = ? AND key = ?",
+                (namespace, key))
+            conn.executemany(
+                "INSERT OR IGNORE INTO cache_tags (namespace, tag, key) "
+                "VALUES (?, ?, ?)",
+                [(namespace, tag, key) for tag in tags])
+        if random.random() < 0.01:
+            self.trim()
+        return True
+
+    def delete(self, namespace: str, key: str):
+        """
+        Deletes an entry and logs the invalidation.
+        """
+        conn = self._connection()
+        with conn:
+            self._delete_keys(conn, namespace, [key])
+            self._log(conn, namespace, key=key)
+
+    def invalidate_tag(self, namespace: str, tag: str):
+        """
+        Deletes all entries with a tag and logs the invalidation.
+        """
+        conn = self._connection()
+        with conn:
+            keys = [row[0] for row in conn.execute(
+                "SELECT key FROM cache_tags "
+                "WHERE namespace = ? AND tag = ?", (namespace, tag))]
+            self._delete_keys(conn, namespace, keys)
+            self._log(conn, namespace, tag=tag)
+
+    def clear(self, namespace: str):
+        """
+        Deletes all entries of a namespace and logs the invalidation.
+        """
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ?",
+                         (namespace,))
+            conn.execute("DELETE FROM cache_tags WHERE namespace = ?",
+                         (namespace,))
+            self._log(conn, namespace, tag=ALL)
+
+    def last_invalidation(self) -> int:
+        """
+        Returns the sequence of the latest logged invalidation.
+        """
+        row = self._connection().execute(
+            "SELECT MAX(seq) FROM cache_invalidations").fetchone()
+        return row[0] or 0
+
+    def invalidations_since(self, seq: int) -> List[Invalidation]:
+        """
+        Returns the invalidations logged after a sequence, oldest first.
+        """
+        return self._connection().execute(
+            "SELECT seq, namespace, tag, key FROM cache_invalidations "
+            "WHERE seq > ? ORDER BY seq", (seq,)).fetchall()
+
+    def count(self, namespace: str) -> int:
+        """
+        Returns the number of unexpired entries of a namespace.
+        """
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM cache_entries "
+            "WHERE namespace = ? AND expires_at > ?",
+            (namespace, time.time())).fetchone()[0]
+
+    def trim(self):
+        """
+        Deletes expired entries, evicts the least recently accessed
+        entries beyond `max_entries` and prunes the invalidation log.
+        """
+        conn = self._connection()
+        now = time.time()
+        with conn:
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?",
+                         (now,))
+            excess = conn.execute(
+                "SELECT COUNT(*) FROM cache_entries").fetchone()[0] \
+                - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE (namespace, key) IN "
+                    "(SELECT namespace, key FROM cache_entries "
+                    "ORDER BY accessed_at LIMIT ?)", (excess,))
+            conn.execute(
+                "DELETE FROM cache_tags WHERE NOT EXISTS "
+                "(SELECT 1 FROM cache_entries e WHERE "
+                "e.namespace = cache_tags.namespace "
+                "AND e.key = cache_tags.key)")
+            conn.execute(
+                "DELETE FROM cache_invalidations WHERE created_at < ?",
+                (now - self.log_retention,))
+
+    @staticmethod
+    def _invalidated_since(conn, namespace: str, key: str,
+                           tags: List[str], since: int) -> bool:
+        tags = tags + [ALL]
+        placeholders = ", ".join("?" for _ in tags)
+        return conn.execute(
+            "SELECT 1 FROM cache_invalidations "
+            "WHERE seq > ? AND namespace = ? "
+            f"AND (key = ? OR tag IN ({placeholders})) LIMIT 1",
+            (since, namespace, key, *tags)).fetchone() is not None
+
+    @staticmethod
+    def _delete_keys(conn, namespace: str, keys: List[str]):
+        conn.executemany(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+            [(namespace, key) for key in keys])
+        conn.executemany(
+            "DELETE FROM cache_tags WHERE namespace = ? AND key = ?",
+            [(namespace, key) for key in keys])
+
+    @staticmethod
+    def _log(conn, namespace: str, tag: Optional[str] = None,
+             key: Optional[str] = None):
+        conn.execute(
+            "INSERT INTO cache_invalidations "
+            "(namespace, tag, key, created_at) VALUES (?, ?, ?, ?)",
+            (namespace, tag, key, time.time()))
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns this thread's connection, reopening it after a fork.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.isolation_level = "DEFERRED"
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
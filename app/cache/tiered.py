@@ -0,0 +1,323 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Hashable, Iterable, Optional, Type
+
+from cachetools import TLRUCache
+from pydantic import BaseModel, ValidationError
+from werkzeug.http import http_date
+
+from app.cache.store import ALL, SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+def _json_default(o):
+    """
+    Encodes dates the way Flask's default JSON provider does, so cached
+    payloads serialise to the same response either way.
+    """
+    if isinstance(o, date):
+        return http_date(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON "
+                    f"serializable")
+
+
+class CacheStats:
+    """
+    Hit and miss counters of one cache.
+    """
+
+    def __init__(self):
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.rejected_sets = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def as_dict(self) -> dict:
+        lookups = self.local_hits + self.shared_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.local_hits + self.shared_hits)
+                               / lookups, 4) if lookups else None,
+            "sets": self.sets,
+            "rejected_sets": self.rejected_sets,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
+
+
+class TieredCache:
+    """
+    Cache with an in-process LRU tier in front of an optional shared
+    SQLite tier.
+
+    Entries have a time-to-live and optional tags; deleting a key or
+    invalidating a tag removes it from both tiers. Other processes
+    replay the store's invalidation log at most every `sync_interval`
+    seconds, which bounds how long their in-process tier can serve a
+    stale entry. `get_or_set` refuses to store a value if the key or
+    one of its tags was invalidated while the value was being loaded.
+
+    Errors of the shared tier are logged and treated as misses, so a
+    broken cache file never breaks a request.
+
+    The shared tier stores JSON, never pickles, so a tampered file can
+    at worst yield wrong data of a valid shape. Values must be JSON
+    serialisable, or instances of `model`, which are dumped with
+    `model_dump` and read back with `model_validate`. Tuples come back
+    from the shared tier as lists.
+    """
+
+    def __init__(self, namespace: str, store: Optional[SQLiteStore] = None,
+                 ttl: float = 300, local_maxsize: int = 1024,
+                 local_ttl: Optional[float] = None,
+                 sync_interval: float = 1.0,
+                 model: Optional[Type[BaseModel]] = None):
+        self.namespace = namespace
+        self.store = store
+        self.model = model
+        self.ttl = ttl
+        self.local_ttl = ttl if local_ttl is None else min(local_ttl, ttl)
+        self.sync_interval = sync_interval
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+        self._local = TLRUCache(maxsize=local_maxsize, ttu=self._ttu) \
+            if local_maxsize > 0 and self.local_ttl > 0 else None
+        self._generation = 0
+        self._synced_seq: Optional[int] = None
+        self._synced_at = 0.0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns a cached value, looking in the in-process tier first.
+        """
+        key = self._key(key)
+        self._sync()
+        with self._lock:
+            if self._local is not None:
+                entry = self._local.get(key, MISSING)
+                if entry is not MISSING:
+                    self.stats.local_hits += 1
+                    return entry[0]
+
+        if self.store is not None:
+            try:
+                raw = self.store.get(self.namespace, key)
+            except sqlite3.Error as e:
+                self._store_error("read", e)
+                raw = None
+            if raw is not None:
+                try:
+                    value, tags = self._decode(raw)
+                except (ValueError, TypeError, ValidationError) as e:
+                    self._store_error("decode", e)
+                    raw = None
+            if raw is not None:
+                with self._lock:
+                    self.stats.shared_hits += 1
+                    self._set_local(key, value, tags, self.local_ttl)
+                return value
+
+        with self._lock:
+            self.stats.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any,
+            ttl: Optional[float] = None, tags: Iterable[str] = ()):
+        """
+        Stores a value in both tiers.
+        """
+        self._set(self._key(key), value, ttl, tuple(tags))
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any],
+                   ttl: Optional[float] = None,
+                   tags: Iterable[str] = ()) -> Any:
+        """
+        Returns a cached value, or loads and stores it. The loaded value
+        is not stored if the key or a tag was invalidated meanwhile.
+        """
+        value = self.get(key, MISSING)
+        if value is not MISSING:
+            return value
+        with self._lock:
+            generation = self._generation
+        since = self._last_invalidation()
+        value = loader()
+        self._set(self._key(key), value, ttl, tuple(tags),
+                  generation=generation, since=since)
+        return value
+
+    def delete(self, key: Hashable):
+        """
+        Removes a key from both tiers.
+        """
+        key = self._key(key)
+        with self._lock:
+            self._generation += 1
+            self.stats.invalidations += 1
+            if self._local is not None:
+                self._local.pop(key, None)
+        if self.store is not None:
+            try:
+                self.store.delete(self.namespace, key)
+            except sqlite3.Error as e:
+                self._store_error("delete", e)
+
+    def invalidate_tag(self, tag: str):
+        """
+        Removes every entry with a tag from both tiers.
+        """
+        with self._lock:
+            self._generation += 1
+            self.stats.invalidations += 1
+            self._drop_local_tag(tag)
+        if self.store is not None:
+            try:
+                self.store.invalidate_tag(self.namespace, tag)
+            except sqlite3.Error as e:
+                self._store_error("invalidate", e)
+
+    def clear(self):
+        """
+        Removes every entry from both tiers.
+        """
+        with self._lock:
+            self._generation += 1
+            if self._local is not None:
+                self._local.clear()
+        if self.store is not None:
+            try:
+                self.store.clear(self.namespace)
+            except sqlite3.Error as e:
+                self._store_error("clear", e)
+
+    def info(self) -> dict:
+        """
+        Returns the hit/miss metrics and tier sizes of the cache.
+        """
+        with self._lock:
+            info = self.stats.as_dict()
+            info["local_size"] = len(self._local) \
+                if self._local is not None else None
+            info["local_maxsize"] = self._local.maxsize \
+                if self._local is not None else 0
+        info["shared_size"] = None
+        if self.store is not None:
+            try:
+                info["shared_size"] = self.store.count(self.namespace)
+            except sqlite3.Error as e:
+                self._store_error("count", e)
+        return info
+
+    def _set(self, key: str, value: Any, ttl: Optional[float],
+             tags: tuple, generation: Optional[int] = None,
+             since: Optional[int] = None):
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._sync()
+        stored = True
+        if self.store is not None:
+            try:
+                stored = self.store.set(
+                    self.namespace, key, self._encode(value, tags),
+                    ttl, tags, since=since)
+            except sqlite3.Error as e:
+                self._store_error("write", e)
+        with self._lock:
+            if not stored or (generation is not None and
+                              generation != self._generation):
+                self.stats.rejected_sets += 1
+                return
+            self.stats.sets += 1
+            self._set_local(key, value, tags, min(ttl, self.local_ttl))
+
+    def _encode(self, value: Any, tags: tuple) -> str:
+        if self.model is not None:
+            value = value.model_dump(mode="json")
+        return json.dumps([value, list(tags)], default=_json_default)
+
+    def _decode(self, raw) -> tuple:
+        value, tags = json.loads(raw)
+        if self.model is not None:
+            value = self.model.model_validate(value)
+        return value, tuple(tags)
+
+    def _set_local(self, key: str, value: Any, tags: tuple, ttl: float):
+        if self._local is not None:
+            self._local[key] = (value, tags, ttl)
+
+    def _drop_local_tag(self, tag: str):
+        if self._local is None:
+            return
+        for key in [k for k, entry in self._local.items()
+                    if tag in entry[1]]:
+            self._local.pop(key, None)
+
+    def _sync(self):
+        """
+        Replays invalidations logged by other processes into the
+        in-process tier.
+        """
+        if self.store is None or self._local is None:
+            return
+        now = time.monotonic()
+        if now - self._synced_at < self.sync_interval:
+            return
+        self._synced_at = now
+        try:
+            if self._synced_seq is None:
+                self._synced_seq = self.store.last_invalidation()
+                return
+            rows = self.store.invalidations_since(self._synced_seq)
+        except sqlite3.Error as e:
+            self._store_error("sync", e)
+            return
+        with self._lock:
+            for seq, namespace, tag, key in rows:
+                self._synced_seq = seq
+                if namespace != self.namespace:
+                    continue
+                self._generation += 1
+                if tag == ALL:
+                    self._local.clear()
+                elif tag is not None:
+                    self._drop_local_tag(tag)
+                else:
+                    self._local.pop(key, None)
+
+    def _last_invalidation(self) -> Optional[int]:
+        if self.store is None:
+            return None
+        try:
+            return self.store.last_invalidation()
+        except sqlite3.Error as e:
+            self._store_error("read", e)
+            return None
+
+    def _store_error(self, action: str, error: Exception):
+        with self._lock:
+            self.stats.errors += 1
+        logger.warning(
+            f"Shared cache {action} failed for {self.namespace}: {error}")
+
+    @staticmethod
+    def _ttu(_key, entry, now):
+        return now + entry[2]
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        if isinstance(key, tuple):
+            return ":".join(str(part) for part in key)
+        return str(key)
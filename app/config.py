@@ -1,5 +1,6 @@
 import os
 import secrets
+import tempfile
 from datetime import timedelta
 
 from dotenv import load_dotenv
@@ -7,6 +8,24 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _hour_range(name: str, default: str) -> tuple:
+    """
+    Reads a 'start-end' range of UTC hours from the environment.
+
+    Raises:
+        ValueError: If the value is not two hours between 0 and 23.
+    """
+    value = os.getenv(name, default)
+    try:
+        start, end = (int(hour) for hour in value.split('-'))
+    except ValueError:
+        start = end = -1
+    if not (0 <= start <= 23 and 0 <= end <= 23):
+        raise ValueError(f"{name} must be 'start-end' UTC hours between "
+                         f"0 and 23, e.g. '{default}', not '{value}'.")
+    return start, end
+
+
 class Config:
     """
     Base configuration with default settings.
@@ -18,6 +37,13 @@ class Config:
         raise RuntimeError("DATABASE_URL is not set in .env file.")
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_REPLICA_URIS = [
+        uri.strip() for uri in
+        os.getenv('DATABASE_REPLICA_URLS', '').split(',') if uri.strip()]
+    REPLICA_RETRY_INTERVAL = float(
+        os.getenv('REPLICA_RETRY_INTERVAL', 30))
+    READ_YOUR_WRITES_SECONDS = int(
+        os.getenv('READ_YOUR_WRITES_SECONDS', 5))
 
     JWT_SECRET_KEY = os.getenv(
         'JWT_SECRET_KEY') or secrets.token_urlsafe(32)
@@ -36,6 +62,9 @@ class Config:
     CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS',
                                      'http://localhost:3000').split(
         ',')
+    # The API authenticates with cookies, so cross-origin requests
+    # must be allowed to send them.
+    CORS_SUPPORTS_CREDENTIALS = True
 
     BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
     SQLALCHEMY_POOL_SIZE = int(os.getenv('SQLALCHEMY_POOL_SIZE', 5))
@@ -44,6 +73,64 @@ class Config:
 
     WTF_CSRF_ENABLED = False
 
+    # Local state shared by the app's processes, e.g. the shared cache
+    # tier and the job spool. Created with mode 0700; one owned by
+    # another user is refused.
+    INSTANCE_DIR = os.getenv('INSTANCE_DIR', os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        'instance'))
+
+    CACHE_SHARED_ENABLED = os.getenv('CACHE_SHARED_ENABLED',
+                                     'True').lower() == 'true'
+    CACHE_PATH = os.getenv('CACHE_PATH', os.path.join(
+        INSTANCE_DIR, 'cache.sqlite'))
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 50000))
+    CACHE_SYNC_INTERVAL = float(os.getenv('CACHE_SYNC_INTERVAL', 1.0))
+    PROJECT_ACCESS_CACHE_TTL = float(
+        os.getenv('PROJECT_ACCESS_CACHE_TTL', 30))
+    PROJECT_ACCESS_CACHE_SIZE = int(
+        os.getenv('PROJECT_ACCESS_CACHE_SIZE', 4096))
+    USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', 60))
+    USER_CACHE_SIZE = int(os.getenv('USER_CACHE_SIZE', 1024))
+    CLAIMS_CACHE_TTL = float(os.getenv('CLAIMS_CACHE_TTL', 300))
+    INDIVIDUAL_DETAIL_CACHE_SIZE = int(
+        os.getenv('INDIVIDUAL_DETAIL_CACHE_SIZE', 2048))
+    INDIVIDUAL_DETAIL_CACHE_TTL = float(
+        os.getenv('INDIVIDUAL_DETAIL_CACHE_TTL', 3600))
+
+    QUERY_METRICS_ENABLED = os.getenv('QUERY_METRICS_ENABLED',
+                                      'True').lower() == 'true'
+    QUERY_METRICS_HEADERS = os.getenv('QUERY_METRICS_HEADERS',
+                                      'False').lower() == 'true'
+    QUERY_REPEAT_THRESHOLD = int(os.getenv('QUERY_REPEAT_THRESHOLD', 5))
+
+    # Spooled uploads and exports hold personal data; the directory is
+    # private to the app user, like INSTANCE_DIR.
+    JOB_SPOOL_DIR = os.getenv('JOB_SPOOL_DIR', os.path.join(
+        INSTANCE_DIR, 'jobs'))
+    JOB_POLL_INTERVAL = float(os.getenv('JOB_POLL_INTERVAL', 1.0))
+    JOB_PROGRESS_INTERVAL = float(
+        os.getenv('JOB_PROGRESS_INTERVAL', 0.5))
+    # Running jobs renew their heartbeat every JOB_HEARTBEAT_INTERVAL
+    # seconds; a job without one for JOB_STALE_AFTER is claimed again.
+    JOB_HEARTBEAT_INTERVAL = float(
+        os.getenv('JOB_HEARTBEAT_INTERVAL', 30.0))
+    JOB_STALE_AFTER = timedelta(
+        seconds=int(os.getenv('JOB_STALE_AFTER', 300)))
+    JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', 3))
+    JOB_RETENTION = timedelta(
+        hours=int(os.getenv('JOB_RETENTION_HOURS', 24)))
+    SNAPSHOT_MAX_BYTES = int(
+        os.getenv('SNAPSHOT_MAX_BYTES', 256 * 1024 * 1024))
+
+    # Deleted rows can be restored for DELETED_RETENTION, after which the
+    # worker purges them during the off-peak PURGE_WINDOW, given as
+    # 'start-end' UTC hours.
+    DELETED_RETENTION = timedelta(
+        days=int(os.getenv('DELETED_RETENTION_DAYS', 30)))
+    PURGE_WINDOW = _hour_range('PURGE_WINDOW', '2-5')
+    PURGE_BATCH_SIZE = int(os.getenv('PURGE_BATCH_SIZE', 500))
+
 
 class DevelopmentConfig(Config):
     """
@@ -51,6 +138,7 @@ class DevelopmentConfig(Config):
     """
     DEBUG = True
     SQLALCHEMY_ECHO = True
+    QUERY_METRICS_HEADERS = True
 
 
 class TestingConfig(Config):
@@ -60,7 +148,12 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = os.getenv('TEST_DATABASE_URL')
+    SQLALCHEMY_REPLICA_URIS = []
     SQLALCHEMY_ECHO = False
+    QUERY_METRICS_HEADERS = True
+    INSTANCE_DIR = tempfile.mkdtemp(prefix='gener-ai-tions-test-')
+    CACHE_PATH = os.path.join(INSTANCE_DIR, 'cache.sqlite')
+    JOB_SPOOL_DIR = os.path.join(INSTANCE_DIR, 'jobs')
 
 
 class ProductionConfig(Config):
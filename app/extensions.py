@@ -1,24 +1,41 @@
-from functools import lru_cache
-
-from flask import jsonify
+from flask import g, jsonify
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 
+from app.cache import configure_caches
 from app.models.user_model import User
+from app.utils.access_cache import get_user_claims
+from app.utils.db_routing import ReplicaPool, RoutingSession, \
+    init_read_routing
+from app.utils.query_metrics import init_query_metrics
 
 jwt = JWTManager()
 cors = CORS()
 
 engine = None
-SessionLocal = scoped_session(sessionmaker())
+SessionLocal = scoped_session(sessionmaker(class_=RoutingSession))
+
+
+def get_db_session():
+    """
+    Returns the database session of the current request, creating it
+    on first use. The session is removed when the app context tears
+    down, so every request checks out at most one connection.
+
+    Returns:
+        Session: The request-scoped SQLAlchemy session.
+    """
+    if "db_session" not in g:
+        g.db_session = SessionLocal()
+    return g.db_session
 
 
 def initialize_extensions(app):
     """
     Initialize and configure all extensions:
-    - SQLAlchemy (engine, session)
+    - SQLAlchemy (engine, read replicas, session)
     - Flask-JWT-Extended
     - Flask-CORS
 
@@ -27,21 +44,43 @@ def initialize_extensions(app):
     """
     global engine, SessionLocal
 
-    engine = create_engine(
-        app.config["SQLALCHEMY_DATABASE_URI"],
+    engine_options = dict(
         echo=app.config.get("SQLALCHEMY_ECHO", False),
         pool_size=app.config.get("SQLALCHEMY_POOL_SIZE", 5),
         max_overflow=app.config.get("SQLALCHEMY_MAX_OVERFLOW", 10),
     )
+    engine = create_engine(app.config["SQLALCHEMY_DATABASE_URI"],
+                           **engine_options)
     app.logger.debug(f"Database engine created: {engine}")
+    replicas = ReplicaPool(
+        [create_engine(uri, pool_pre_ping=True, **engine_options)
+         for uri in app.config.get("SQLALCHEMY_REPLICA_URIS", [])],
+        retry_interval=app.config.get("REPLICA_RETRY_INTERVAL", 30.0))
+    if replicas:
+        app.logger.debug(f"{len(replicas)} read replica(s) configured.")
 
     SessionLocal.configure(bind=engine)
     app.extensions["engine"] = engine
+    init_query_metrics(app, engine, *replicas.engines)
+    init_read_routing(app, replicas)
+
+    @app.teardown_appcontext
+    def remove_db_session(_exception=None):
+        """
+        Closes the request-scoped session and returns its connection
+        to the pool.
+        """
+        g.pop("db_session", None)
+        SessionLocal.remove()
+
+    configure_caches(app.config)
 
     jwt.init_app(app)
 
     cors.init_app(app, resources={r"/*": {
-        "origins": app.config.get("CORS_ALLOWED_ORIGINS", "*")}})
+        "origins": app.config.get("CORS_ALLOWED_ORIGINS", "*"),
+        "supports_credentials": app.config.get(
+            "CORS_SUPPORTS_CREDENTIALS", False)}})
 
     @jwt.expired_token_loader
     def handle_expired_token(_jwt_header, _jwt_data):
@@ -80,28 +119,23 @@ def initialize_extensions(app):
         return jsonify(
             {"error": "Token revoked. Please log in again."}), 401
 
-    @lru_cache(maxsize=1024)
-    def get_user_admin_status(user_id: int) -> bool:
+    def load_user_claims(user_id: int) -> dict:
         """
-        Retrieve the admin status for a user from the database.
-        This function is cached to avoid repeated DB queries for the same user.
+        Loads the additional JWT claims of a user from the database.
+
+        Raises:
+            SQLAlchemyError: If the user cannot be loaded, so that
+            failures are not cached.
         """
-        try:
-            with SessionLocal() as session:
-                user = session.query(User).filter(
-                    User.id == user_id).first()
-                if user:
-                    return user.is_admin
-        except Exception as e:
-            app.logger.error(
-                f"Error retrieving admin status for user {user_id}: {e}")
-        return False
+        is_admin = get_db_session().query(User.is_admin).filter(
+            User.id == user_id).scalar()
+        return {"is_admin": bool(is_admin)}
 
     @jwt.additional_claims_loader
     def add_claims_to_jwt(identity):
         """
         Adds additional claims to the JWT, such as admin status.
-        Uses a cached lookup to minimize performance overhead.
+        Uses the shared claims cache to minimize performance overhead.
         Args:
             identity (str): The identity of the user (usually user ID).
         Returns:
@@ -109,8 +143,7 @@ def initialize_extensions(app):
         """
         try:
             user_id = int(identity)
-            is_admin = get_user_admin_status(user_id)
-            return {"is_admin": is_admin}
+            return get_user_claims(user_id, load_user_claims)
         except Exception as e:
             app.logger.error(f"Error adding claims to JWT: {e}")
         return {"is_admin": False}
@@ -0,0 +1,11 @@
+from .registry import (
+    JobCancelled,
+    JobContext,
+    job_handler,
+    get_job_handler,
+    is_read_only_job
+)
+from .handlers import CSV_IMPORT, PROJECT_CLONE, SNAPSHOT_EXPORT, \
+    SNAPSHOT_RESTORE
+from .spool import spool_upload, remove_files
+from .worker import Worker, in_purge_window
@@ -0,0 +1,122 @@
+import io
+import os
+from contextlib import ExitStack
+
+from app.jobs.registry import JobContext, job_handler
+from app.schemas.project_schema import ProjectClone
+from app.services.import_service import ImportService
+from app.services.project_service import ProjectService
+from app.services.snapshot_service import SnapshotService
+
+CSV_IMPORT = "csv_import"
+SNAPSHOT_EXPORT = "snapshot_export"
+SNAPSHOT_RESTORE = "snapshot_restore"
+PROJECT_CLONE = "project_clone"
+
+
+class _CountingReader(io.RawIOBase):
+    """
+    Raw binary reader that reports the number of bytes consumed, so
+    progress can be tracked while COPY streams a spooled file.
+    """
+
+    def __init__(self, raw, on_read):
+        self._raw = raw
+        self._on_read = on_read
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self._raw.readinto(buffer)
+        if count:
+            self._on_read(count)
+        return count
+
+
+@job_handler(CSV_IMPORT)
+def run_csv_import(context: JobContext) -> dict:
+    """
+    Imports spooled CSV files. Progress is measured in bytes read.
+    """
+    files = context.payload["files"]
+    total = sum(os.path.getsize(path) for path in files.values())
+    consumed = 0
+
+    def on_read(count):
+        nonlocal consumed
+        consumed += count
+        context.progress(consumed, total)
+
+    def open_csv(path):
+        raw = stack.enter_context(open(path, "rb", buffering=0))
+        return io.TextIOWrapper(
+            io.BufferedReader(_CountingReader(raw, on_read)),
+            encoding="utf-8-sig", newline="")
+
+    with ExitStack() as stack:
+        individuals_csv = open_csv(files["individuals"])
+        relationships_csv = open_csv(files["relationships"]) \
+            if "relationships" in files else None
+        context.progress(0, total, "Reading CSV files", force=True)
+        counts = ImportService(db=context.session).import_csv(
+            user_id=context.user_id,
+            project_id=context.project_id,
+            individuals_csv=individuals_csv,
+            relationships_csv=relationships_csv,
+            progress=context.check_cancelled
+        )
+    return {"imported": counts}
+
+
+@job_handler(SNAPSHOT_EXPORT, read_only=True)
+def run_snapshot_export(context: JobContext) -> dict:
+    """
+    Writes a project snapshot to the spool directory for download.
+    Progress is measured in rows read.
+    """
+    path = context.output_path(".gaisnap")
+    context.result_file = path
+    with open(path, "wb") as f:
+        counts = SnapshotService(db=context.session).export_project(
+            project_id=context.project_id, user_id=context.user_id,
+            fileobj=f, progress=context.progress)
+    if counts is None:
+        raise ValueError("Project not found or snapshot failed.")
+    return {"exported": counts}
+
+
+@job_handler(SNAPSHOT_RESTORE)
+def run_snapshot_restore(context: JobContext) -> dict:
+    """
+    Restores a spooled snapshot into a new project for the user.
+    """
+    context.progress(0, None, "Restoring snapshot", force=True)
+    new_project = SnapshotService(db=context.session).restore_project(
+        user_id=context.user_id,
+        source=context.payload["files"]["snapshot"],
+        name=context.payload.get("name"))
+    if not new_project:
+        raise ValueError("Failed to restore snapshot.")
+    return {"project_id": new_project.id}
+
+
+@job_handler(PROJECT_CLONE)
+def run_project_clone(context: JobContext) -> dict:
+    """
+    Clones a project, including its individuals, identities and
+    relationships. Progress is measured in batches of copied rows.
+    """
+
+    def on_batch(done, total):
+        context.progress(done, total, force=done == total)
+
+    context.progress(0, None, "Cloning project", force=True)
+    new_project = ProjectService(db=context.session).clone_project(
+        project_id=context.project_id, user_id=context.user_id,
+        project_clone=ProjectClone.model_validate(context.payload),
+        progress=on_batch)
+    if not new_project:
+        raise ValueError("Project not found.")
+    return {"project_id": new_project.id}
+
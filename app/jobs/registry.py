@@ -0,0 +1,121 @@
+import logging
+import os
+import time
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.job_model import Job
+from app.services.job_service import JobService
+from app.utils.private_files import create_private_file, \
+    ensure_private_dir
+
+logger = logging.getLogger(__name__)
+
+_HANDLERS: Dict[str, Callable[["JobContext"], Optional[dict]]] = {}
+_READ_ONLY = set()
+
+
+class JobCancelled(Exception):
+    """
+    Raised inside a handler when cancellation of its job was requested.
+    """
+
+
+def job_handler(job_type: str, read_only: bool = False):
+    """
+    Decorator registering a function as the handler for a job type.
+
+    The handler receives a JobContext and returns a JSON-serialisable
+    result dict (or None). Reads of `read_only` handlers are served by
+    a replica when one is configured.
+    """
+
+    def decorator(fn):
+        _HANDLERS[job_type] = fn
+        if read_only:
+            _READ_ONLY.add(job_type)
+        return fn
+
+    return decorator
+
+
+def get_job_handler(job_type: str):
+    """
+    Returns the handler registered for a job type, or None.
+    """
+    return _HANDLERS.get(job_type)
+
+
+def is_read_only_job(job_type: str) -> bool:
+    """
+    Returns True if the handler of a job type only reads data.
+    """
+    return job_type in _READ_ONLY
+
+
+class JobContext:
+    """
+    State handed to a job handler: the job's parameters, a database
+    session for the actual work and a throttled progress reporter.
+
+    Progress is written through a separate session, so updates are
+    visible to pollers while the work transaction is still open.
+    """
+
+    def __init__(self, job: Job, jobs: JobService, session: Session,
+                 spool_dir: str, progress_interval: float = 0.5):
+        self.job_id = job.id
+        self.user_id = job.user_id
+        self.project_id = job.project_id
+        self.payload = dict(job.payload or {})
+        self.session = session
+        self.result_file: Optional[str] = None
+        self.cancelled = False
+        self._jobs = jobs
+        self._spool_dir = spool_dir
+        self._interval = progress_interval
+        self._last_report = 0.0
+        self._current = 0
+        self._total: Optional[int] = None
+
+    def progress(self, current: int, total: Optional[int] = None,
+                 message: Optional[str] = None, force: bool = False):
+        """
+        Records progress. Updates are written at most once per
+        progress interval unless `force` is set.
+
+        Drivers may wrap the exception when it is raised from inside a
+        streaming call such as COPY, so `cancelled` is set as well.
+
+        Raises:
+            JobCancelled: If cancellation of the job was requested.
+        """
+        self._current = current
+        if total is not None:
+            self._total = total
+        now = time.monotonic()
+        if not force and message is None and \
+                now - self._last_report < self._interval:
+            return
+        self._last_report = now
+        if self._jobs.report_progress(self.job_id, current, total,
+                                      message):
+            self.cancelled = True
+            raise JobCancelled()
+
+    def check_cancelled(self, message: Optional[str] = None):
+        """
+        Forces a progress update, raising JobCancelled if requested.
+        """
+        self.progress(self._current, self._total, message, force=True)
+
+    def output_path(self, suffix: str) -> str:
+        """
+        Returns a path in the spool directory for a result file. The
+        file is created empty, with mode 0600.
+        """
+        path = os.path.join(ensure_private_dir(self._spool_dir),
+                            f"job-{self.job_id}-result{suffix}")
+        os.close(create_private_file(path, truncate=True))
+        return path
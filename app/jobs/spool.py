@@ -0,0 +1,44 @@
+import logging
+import os
+import shutil
+import uuid
+from typing import Iterable
+
+from flask import current_app
+
+from app.utils.private_files import create_private_file, \
+    ensure_private_dir
+
+logger = logging.getLogger(__name__)
+
+
+def spool_upload(file_storage) -> str:
+    """
+    Saves an uploaded file to the job spool directory so a worker can
+    process it after the request has finished. The directory and file
+    are only accessible by the application user.
+
+    Returns:
+        str: Path of the spooled file.
+
+    Raises:
+        PermissionError: If the spool directory belongs to another user.
+    """
+    spool_dir = ensure_private_dir(current_app.config["JOB_SPOOL_DIR"])
+    path = os.path.join(spool_dir, f"upload-{uuid.uuid4().hex}")
+    with os.fdopen(create_private_file(path), "wb") as f:
+        shutil.copyfileobj(file_storage.stream, f)
+    return path
+
+
+def remove_files(paths: Iterable[str]):
+    """
+    Removes spooled files, ignoring files that are already gone.
+    """
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove spooled file {path}: {e}")
@@ -0,0 +1,236 @@
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.extensions import SessionLocal
+from app.jobs.registry import JobCancelled, JobContext, get_job_handler, \
+    is_read_only_job
+from app.jobs.spool import remove_files
+from app.models.enums_model import JobStatusEnum
+from app.services.job_service import JobService, job_files
+from app.services.purge_service import PurgeService
+from app.utils.db_routing import use_replica
+
+logger = logging.getLogger(__name__)
+
+
+def in_purge_window(window: Tuple[int, int],
+                    now: Optional[datetime] = None) -> bool:
+    """
+    Returns True if the current UTC hour lies within a purge window of
+    (start, end) hours. The window may wrap past midnight.
+    """
+    start, end = window
+    hour = (now or datetime.now(timezone.utc)).hour
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+class Heartbeat:
+    """
+    Renews the heartbeat of a running job from a background thread for
+    as long as its handler runs, so a long step without progress
+    updates, e.g. a single large INSERT ... SELECT, does not make the
+    job look stale to other workers.
+    """
+
+    def __init__(self, app, job_id: int, worker_id: str,
+                 interval: float):
+        self.app = app
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"job-{job_id}-heartbeat", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        with self.app.app_context():
+            while not self._stopped.wait(self.interval):
+                try:
+                    with SessionLocal.session_factory() as session:
+                        if not JobService(db=session).renew_heartbeat(
+                                self.job_id, self.worker_id):
+                            logger.warning(
+                                f"Job {self.job_id} is no longer owned "
+                                f"by worker {self.worker_id}.")
+                            return
+                except SQLAlchemyError as e:
+                    logger.error(f"Worker database error: {e}")
+
+
+class Worker:
+    """
+    Polls the jobs table and runs queued jobs one at a time, outside
+    the web request cycle. Several workers may run side by side.
+    """
+
+    def __init__(self, app, worker_id: str = None):
+        self.app = app
+        self.worker_id = worker_id or \
+            f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = False
+        self._last_purge = 0.0
+        self._last_deleted_purge = 0.0
+
+    def stop(self, *_args):
+        """
+        Asks the worker to exit once the current job has finished.
+        """
+        logger.info(f"Worker {self.worker_id} stopping.")
+        self._stopping = True
+
+    def run_forever(self):
+        """
+        Runs jobs until SIGTERM or SIGINT is received.
+        """
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        logger.info(f"Worker {self.worker_id} started.")
+        with self.app.app_context():
+            while not self._stopping:
+                try:
+                    ran_job = self.run_once()
+                    self.purge_if_due()
+                    self.purge_deleted_if_due()
+                except SQLAlchemyError as e:
+                    logger.error(f"Worker database error: {e}")
+                    ran_job = False
+                if not ran_job and not self._stopping:
+                    time.sleep(current_app.config["JOB_POLL_INTERVAL"])
+
+    def run_once(self) -> bool:
+        """
+        Claims and runs a single job.
+
+        Returns:
+            bool: True if a job was run, False if the queue was empty.
+        """
+        config = current_app.config
+        with SessionLocal.session_factory() as control:
+            service_job = JobService(db=control)
+            job = service_job.claim_next_job(
+                self.worker_id, config["JOB_STALE_AFTER"])
+            if job is None:
+                return False
+            if job.attempts > config["JOB_MAX_ATTEMPTS"]:
+                if service_job.finish_job(
+                        job.id, JobStatusEnum.FAILED,
+                        error="Job exceeded the maximum number of "
+                              "attempts.",
+                        worker_id=self.worker_id):
+                    remove_files(job_files(job))
+                return True
+
+            with SessionLocal.session_factory() as work, \
+                    Heartbeat(self.app, job.id, self.worker_id,
+                              config["JOB_HEARTBEAT_INTERVAL"]):
+                context = JobContext(job, service_job, work,
+                                     config["JOB_SPOOL_DIR"],
+                                     config["JOB_PROGRESS_INTERVAL"])
+                finished = self._execute(job.job_type, context,
+                                         service_job)
+            # A job claimed again by another worker still needs them.
+            if finished:
+                remove_files(context.payload.get("files", {}).values())
+        return True
+
+    def _execute(self, job_type: str, context: JobContext,
+                 service_job: JobService) -> bool:
+        """
+        Runs the handler of a job and stores its outcome.
+
+        Returns:
+            bool: False if the job was claimed by another worker in the
+            meantime, in which case the outcome is discarded.
+        """
+        handler = get_job_handler(job_type)
+        started = time.monotonic()
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job type: {job_type}")
+            replicas = current_app.extensions.get("replicas") \
+                if is_read_only_job(job_type) else None
+            with use_replica(replicas):
+                result = handler(context)
+            finished = service_job.finish_job(
+                context.job_id, JobStatusEnum.COMPLETED, result=result,
+                result_file=context.result_file,
+                worker_id=self.worker_id)
+        except Exception as e:
+            context.session.rollback()
+            if context.result_file:
+                remove_files([context.result_file])
+            if isinstance(e, JobCancelled) or context.cancelled:
+                finished = service_job.finish_job(
+                    context.job_id, JobStatusEnum.CANCELLED,
+                    worker_id=self.worker_id)
+            elif isinstance(e, ValueError):
+                finished = service_job.finish_job(
+                    context.job_id, JobStatusEnum.FAILED, error=str(e),
+                    worker_id=self.worker_id)
+            else:
+                logger.exception(f"Job {context.job_id} failed: {e}")
+                finished = service_job.finish_job(
+                    context.job_id, JobStatusEnum.FAILED,
+                    error="Job failed unexpectedly.",
+                    worker_id=self.worker_id)
+        logger.info(f"Job {context.job_id} ({job_type}) took "
+                    f"{time.monotonic() - started:.1f}s")
+        return finished
+
+    def purge_if_due(self, interval: float = 3600.0):
+        """
+        Deletes expired finished jobs and their files, at most once per
+        interval.
+        """
+        now = time.monotonic()
+        if now - self._last_purge < interval:
+            return
+        self._last_purge = now
+        with SessionLocal.session_factory() as session:
+            paths = JobService(db=session).purge_finished_jobs(
+                current_app.config["JOB_RETENTION"])
+        remove_files(paths)
+
+    def purge_deleted_if_due(self, interval: float = 300.0,
+                             budget: float = 60.0):
+        """
+        Physically deletes rows that were deleted longer ago than the
+        retention period, at most once per interval and only inside the
+        purge window. A pass stops after `budget` seconds, so queued
+        jobs still run while a large backlog is purged.
+        """
+        config = current_app.config
+        now = time.monotonic()
+        if now - self._last_deleted_purge < interval or \
+                not in_purge_window(config["PURGE_WINDOW"]):
+            return
+        self._last_deleted_purge = now
+
+        def keep_going():
+            return not self._stopping and \
+                time.monotonic() - now < budget and \
+                in_purge_window(config["PURGE_WINDOW"])
+
+        with SessionLocal.session_factory() as session:
+            PurgeService(db=session).purge_deleted(
+                config["DELETED_RETENTION"], config["PURGE_BATCH_SIZE"],
+                keep_going=keep_going)
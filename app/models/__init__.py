@@ -1,12 +1,20 @@
-from .base_model import Base
+from .base_model import Base, SoftDeleteMixin
 from .enums_model import (
     GenderEnum,
     InitialRelationshipEnum,
     HorizontalRelationshipTypeEnum,
-    VerticalRelationshipTypeEnum
+    VerticalRelationshipTypeEnum,
+    JobStatusEnum,
+    ChangeEntityEnum,
+    CounterScopeEnum
 )
+from .change_model import ProjectChange
+from .counter_model import NumberCounter
+from .display_model import IndividualDisplay
+from .fragment_model import IndividualFragment
 from .identity_model import Identity
 from .individual_model import Individual
+from .job_model import Job
 from .project_model import Project
 from .relationship_model import Relationship
 from .user_model import User
\ No newline at end of file
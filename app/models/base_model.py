@@ -1,3 +1,49 @@
-from sqlalchemy.orm import declarative_base
+import weakref
+
+from sqlalchemy import Column, DateTime, event
+from sqlalchemy.orm import Session, declarative_base, with_loader_criteria
 
 Base = declarative_base()
+
+
+class SoftDeleteMixin:
+    """
+    Adds a `deleted_at` tombstone. Deleting sets it instead of removing
+    the row, so a delete is a single update and can be undone until the
+    purger removes the row for good.
+
+    ORM selects skip tombstoned rows, also in joins, subqueries and
+    relationship loads, unless executed with the `include_deleted`
+    execution option. Hand-written SQL must filter them itself.
+    """
+
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+
+_LIVE_ROWS = with_loader_criteria(SoftDeleteMixin,
+                                  lambda cls: cls.deleted_at.is_(None),
+                                  include_aliases=True)
+
+# Filtered copies of the statements executed, so a statement that is
+# executed again, e.g. a cached one, keeps its memoized cache key.
+_live_statements = weakref.WeakKeyDictionary()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_deleted_rows(execute_state):
+    """
+    Adds the tombstone filter to top-level ORM selects. Relationship
+    and column loads inherit it from the statement that loaded their
+    parent objects.
+    """
+    if execute_state.is_select and \
+            not execute_state.is_column_load and \
+            not execute_state.is_relationship_load and \
+            not execute_state.execution_options.get("include_deleted",
+                                                    False):
+        statement = execute_state.statement
+        live = _live_statements.get(statement)
+        if live is None:
+            live = _live_statements[statement] = \
+                statement.options(_LIVE_ROWS)
+        execute_state.statement = live
@@ -0,0 +1,40 @@
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Boolean,
+    Integer,
+    Enum,
+    ForeignKey,
+    Index
+)
+
+from app.models.base_model import Base
+from app.models.enums_model import ChangeEntityEnum
+
+
+class ProjectChange(Base):
+    """
+    Represents the latest change to an entity within a project.
+
+    Only one row is kept per entity, so the table stays as small as the
+    project itself. `seq` is the project's change sequence at the time
+    of the change and `deleted` marks tombstones.
+    """
+
+    __tablename__ = 'project_changes'
+    __table_args__ = (
+        Index('ix_project_changes_project_seq', 'project_id', 'seq'),
+    )
+
+    project_id = Column(Integer, ForeignKey('projects.id',
+                                            ondelete='CASCADE'),
+                        primary_key=True)
+    entity_type = Column(Enum(ChangeEntityEnum), primary_key=True)
+    entity_id = Column(Integer, primary_key=True)
+    seq = Column(BigInteger, nullable=False)
+    deleted = Column(Boolean, nullable=False, default=False)
+
+    def __repr__(self):
+        return (f"<ProjectChange(project_id={self.project_id}, "
+                f"entity_type='{self.entity_type}', "
+                f"entity_id={self.entity_id}, seq={self.seq})>")
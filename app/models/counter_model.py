@@ -0,0 +1,29 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    Enum
+)
+
+from app.models.base_model import Base
+from app.models.enums_model import CounterScopeEnum
+
+
+class NumberCounter(Base):
+    """
+    Holds the last number handed out within a numbering scope.
+
+    `scope_id` is the owner of the numbers: the user for project
+    numbers, the project for individual numbers and the individual for
+    identity numbers. Rows are created on first use.
+    """
+
+    __tablename__ = 'number_counters'
+
+    scope = Column(Enum(CounterScopeEnum), primary_key=True)
+    scope_id = Column(Integer, primary_key=True)
+    last_value = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return (f"<NumberCounter(scope='{self.scope}', "
+                f"scope_id={self.scope_id}, "
+                f"last_value={self.last_value})>")
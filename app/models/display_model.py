@@ -0,0 +1,44 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Enum,
+    ForeignKey,
+    Index
+)
+
+from app.models.base_model import Base
+from app.models.enums_model import GenderEnum
+
+
+class IndividualDisplay(Base):
+    """
+    Holds the primary-identity name of every individual.
+
+    The table is maintained by the services whenever a primary identity
+    changes, so listings and kinship lists can resolve names with one
+    indexed join instead of walking `Individual.primary_identity`.
+    `sort_key` is the lower-cased "last first" name used for ordering.
+    """
+
+    __tablename__ = 'individual_display'
+    __table_args__ = (
+        Index('ix_individual_display_project_sort', 'project_id',
+              'sort_key'),
+    )
+
+    individual_id = Column(Integer, ForeignKey('individuals.id',
+                                               ondelete='CASCADE'),
+                           primary_key=True)
+    project_id = Column(Integer, ForeignKey('projects.id',
+                                            ondelete='CASCADE'),
+                        nullable=False)
+    first_name = Column(String(100), nullable=True)
+    last_name = Column(String(100), nullable=True)
+    gender = Column(Enum(GenderEnum), nullable=True)
+    sort_key = Column(String(201), nullable=False, default='')
+
+    def __repr__(self):
+        return (f"<IndividualDisplay(individual_id={self.individual_id}, "
+                f"first_name='{self.first_name}', "
+                f"last_name='{self.last_name}')>")
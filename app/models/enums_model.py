@@ -37,3 +37,23 @@ class HorizontalRelationshipTypeEnum(str, Enum):
     PARTNERSHIP = "partnership"
     OTHER = "other"
     UNKNOWN = "unknown"
+
+
+class JobStatusEnum(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ChangeEntityEnum(str, Enum):
+    INDIVIDUAL = "individual"
+    IDENTITY = "identity"
+    RELATIONSHIP = "relationship"
+
+
+class CounterScopeEnum(str, Enum):
+    PROJECT_NUMBER = "project_number"
+    INDIVIDUAL_NUMBER = "individual_number"
+    IDENTITY_NUMBER = "identity_number"
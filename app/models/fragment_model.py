@@ -0,0 +1,35 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    Text,
+    Date,
+    ForeignKey
+)
+
+from app.models.base_model import Base
+
+
+class IndividualFragment(Base):
+    """
+    Holds the serialised list-view JSON of an individual.
+
+    Fragments are rebuilt by the services whenever the individual or
+    one of its identities changes, so list endpoints can splice them
+    into a response without validating every row. `expires_on` is the
+    day the embedded age changes, after which the fragment is rebuilt.
+    """
+
+    __tablename__ = 'individual_fragments'
+
+    individual_id = Column(Integer, ForeignKey('individuals.id',
+                                               ondelete='CASCADE'),
+                           primary_key=True)
+    project_id = Column(Integer, ForeignKey('projects.id',
+                                            ondelete='CASCADE'),
+                        nullable=False, index=True)
+    payload = Column(Text, nullable=False)
+    expires_on = Column(Date, nullable=True)
+
+    def __repr__(self):
+        return (f"<IndividualFragment(individual_id="
+                f"{self.individual_id}, project_id={self.project_id})>")
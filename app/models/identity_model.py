@@ -17,11 +17,11 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.models.base_model import Base
+from app.models.base_model import Base, SoftDeleteMixin
 from app.models.enums_model import GenderEnum
 
 
-class Identity(Base):
+class Identity(SoftDeleteMixin, Base):
     """
     Represents an individual's identity within a project.
     """
@@ -33,15 +33,27 @@ class Identity(Base):
         CheckConstraint(
             'valid_until IS NULL OR valid_until > valid_from',
             name='chk_validity_dates'),
+        # Covers the name columns, so display names are read from the
+        # index alone.
         Index('uix_individual_primary_identity', 'individual_id',
               unique=True,
-              postgresql_where=text('is_primary = true')),
+              postgresql_where=text(
+                  'is_primary = true AND deleted_at IS NULL'),
+              postgresql_include=['first_name', 'last_name', 'gender']),
+        # Tombstones awaiting the purger.
+        Index('ix_identities_deleted_at', 'deleted_at',
+              postgresql_where=text('deleted_at IS NOT NULL')),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     individual_id = Column(Integer, ForeignKey('individuals.id',
                                                ondelete='CASCADE'),
-                           nullable=False, index=True)
+                           nullable=False)
+    # The project of the individual, the partition key of `identities`
+    # when partitioned.
+    project_id = Column(Integer, ForeignKey('projects.id',
+                                            ondelete='CASCADE'),
+                        nullable=False, index=True)
     identity_number = Column(Integer, nullable=False)
     first_name = Column(String(100), nullable=True)
     last_name = Column(String(100), nullable=True)
@@ -7,16 +7,18 @@ from sqlalchemy import (
     Date,
     DateTime,
     func,
+    text,
     UniqueConstraint,
-    CheckConstraint
+    CheckConstraint,
+    Index
 )
 from sqlalchemy.orm import relationship
 
-from app.models.base_model import Base
+from app.models.base_model import Base, SoftDeleteMixin
 from app.models.enums_model import InitialRelationshipEnum
 
 
-class Individual(Base):
+class Individual(SoftDeleteMixin, Base):
     """
     Represents an individual within a project.
     """
@@ -28,16 +30,22 @@ class Individual(Base):
         CheckConstraint(
             'death_date IS NULL OR birth_date IS NULL OR birth_date <= death_date',
             name='chk_individual_dates'),
+        # Project listings, most recently updated first.
+        Index('ix_individuals_user_project_updated', 'user_id',
+              'project_id', text('updated_at DESC'), 'id'),
+        # Tombstones awaiting the purger.
+        Index('ix_individuals_deleted_at', 'deleted_at',
+              postgresql_where=text('deleted_at IS NOT NULL')),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     individual_number = Column(Integer, nullable=False)
     user_id = Column(Integer,
                      ForeignKey('users.id', ondelete='CASCADE'),
-                     nullable=False, index=True)
+                     nullable=False)
     project_id = Column(Integer, ForeignKey('projects.id',
                                             ondelete='CASCADE'),
-                        nullable=False, index=True)
+                        nullable=False)
     birth_date = Column(Date, nullable=True)
     birth_place = Column(String(100), nullable=True, index=True)
     death_date = Column(Date, nullable=True)
@@ -54,7 +62,7 @@ class Individual(Base):
     identities = relationship('Identity',
                               back_populates='individual',
                               cascade='all, delete-orphan',
-                              lazy='joined',
+                              passive_deletes=True,
                               overlaps='primary_identity')
     primary_identity = relationship(
         "Identity",
@@ -69,13 +77,15 @@ class Individual(Base):
         'Relationship',
         foreign_keys='Relationship.individual_id',
         back_populates='individual',
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
     relationships_as_related = relationship(
         'Relationship',
         foreign_keys='Relationship.related_id',
         back_populates='related',
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
 
     @property
@@ -0,0 +1,64 @@
+from sqlalchemy import (
+    Column,
+    Boolean,
+    BigInteger,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    Enum,
+    ForeignKey,
+    JSON,
+    Index
+)
+from sqlalchemy.sql import func
+
+from app.models.base_model import Base
+from app.models.enums_model import JobStatusEnum
+
+
+class Job(Base):
+    """
+    Represents a background job executed by the worker process.
+    """
+
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        Index('ix_jobs_status_id', 'status', 'id'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer,
+                     ForeignKey('users.id', ondelete='CASCADE'),
+                     nullable=False, index=True)
+    project_id = Column(Integer,
+                        ForeignKey('projects.id', ondelete='CASCADE'),
+                        nullable=True)
+    job_type = Column(String(50), nullable=False)
+    status = Column(Enum(JobStatusEnum), nullable=False,
+                    default=JobStatusEnum.QUEUED)
+    payload = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    result_file = Column(String(255), nullable=True)
+    error = Column(Text, nullable=True)
+    progress_current = Column(BigInteger, nullable=False, default=0)
+    progress_total = Column(BigInteger, nullable=True)
+    progress_message = Column(String(255), nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    worker_id = Column(String(100), nullable=True)
+    created_at = Column(DateTime(timezone=True),
+                        server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return (f"<Job(id={self.id}, job_type='{self.job_type}', "
+                f"status='{self.status}')>")
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatusEnum.COMPLETED,
+                               JobStatusEnum.FAILED,
+                               JobStatusEnum.CANCELLED)
@@ -1,18 +1,21 @@
 from sqlalchemy import (
     Column,
+    BigInteger,
     Integer,
     String,
     DateTime,
     ForeignKey,
-    UniqueConstraint
+    UniqueConstraint,
+    Index,
+    text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.models.base_model import Base
+from app.models.base_model import Base, SoftDeleteMixin
 
 
-class Project(Base):
+class Project(SoftDeleteMixin, Base):
     """
     Represents a project managed by a user.
     """
@@ -21,6 +24,9 @@ class Project(Base):
     __table_args__ = (
         UniqueConstraint('user_id', 'project_number',
                          name='uix_user_project_number'),
+        # Tombstones awaiting the purger.
+        Index('ix_projects_deleted_at', 'deleted_at',
+              postgresql_where=text('deleted_at IS NOT NULL')),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -29,6 +35,8 @@ class Project(Base):
                      ForeignKey('users.id', ondelete='CASCADE'),
                      nullable=False)
     name = Column(String(100), nullable=False)
+    change_seq = Column(BigInteger, nullable=False, default=0,
+                        server_default='0')
     created_at = Column(DateTime(timezone=True),
                         server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True),
@@ -38,10 +46,12 @@ class Project(Base):
     user = relationship('User', back_populates='projects')
     individuals = relationship('Individual',
                                back_populates='project',
-                               cascade='all, delete-orphan')
+                               cascade='all, delete-orphan',
+                               passive_deletes=True)
     relationships = relationship('Relationship',
                                  back_populates='project',
-                                 cascade='all, delete-orphan')
+                                 cascade='all, delete-orphan',
+                                 passive_deletes=True)
 
     def __repr__(self):
         return f"<Project(id={self.id}, name='{self.name}', user_id={self.user_id})>"
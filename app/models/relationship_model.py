@@ -6,12 +6,14 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     CheckConstraint,
+    Index,
+    text,
     Enum as SAEnum
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.models.base_model import Base
+from app.models.base_model import Base, SoftDeleteMixin
 from app.models.enums_model import (
     InitialRelationshipEnum,
     HorizontalRelationshipTypeEnum,
@@ -19,7 +21,7 @@ from app.models.enums_model import (
 )
 
 
-class Relationship(Base):
+class Relationship(SoftDeleteMixin, Base):
     """
     Represents a relationship between two individuals within a project.
     """
@@ -32,18 +34,27 @@ class Relationship(Base):
             'dissolution_date IS NULL OR union_date IS NULL OR union_date <= dissolution_date',
             name='chk_relationship_dates'
         ),
+        # Kinship lookups from either side by relationship type.
+        Index('ix_relationships_individual_type', 'individual_id',
+              'initial_relationship', postgresql_include=['related_id']),
+        Index('ix_relationships_related_type', 'related_id',
+              'initial_relationship',
+              postgresql_include=['individual_id']),
+        # Tombstones awaiting the purger.
+        Index('ix_relationships_deleted_at', 'deleted_at',
+              postgresql_where=text('deleted_at IS NOT NULL')),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     project_id = Column(Integer, ForeignKey('projects.id',
                                             ondelete='CASCADE'),
-                        nullable=False, index=True)
+                        nullable=False)
     individual_id = Column(Integer, ForeignKey('individuals.id',
                                                ondelete='CASCADE'),
-                           nullable=False, index=True)
+                           nullable=False)
     related_id = Column(Integer, ForeignKey('individuals.id',
                                             ondelete='CASCADE'),
-                        nullable=False, index=True)
+                        nullable=False)
 
     initial_relationship = Column(
         SAEnum(InitialRelationshipEnum,
@@ -76,14 +87,12 @@ class Relationship(Base):
     individual = relationship(
         'Individual',
         foreign_keys=[individual_id],
-        back_populates='relationships_as_individual',
-        lazy='joined'
+        back_populates='relationships_as_individual'
     )
     related = relationship(
         'Individual',
         foreign_keys=[related_id],
-        back_populates='relationships_as_related',
-        lazy='joined'
+        back_populates='relationships_as_related'
     )
 
     def __repr__(self) -> str:
@@ -92,3 +101,10 @@ class Relationship(Base):
             f"related_id={self.related_id}, initial_relationship={self.initial_relationship}, "
             f"union_date={self.union_date}, dissolution_date={self.dissolution_date})>"
         )
+
+
+# One live relationship per unordered pair of individuals in a project.
+Index('uix_relationship_pair', Relationship.project_id,
+      func.least(Relationship.individual_id, Relationship.related_id),
+      func.greatest(Relationship.individual_id, Relationship.related_id),
+      unique=True, postgresql_where=text('deleted_at IS NULL'))
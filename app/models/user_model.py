@@ -33,9 +33,11 @@ class User(Base):
                         onupdate=func.now(), nullable=False)
 
     individuals = relationship('Individual', back_populates='user',
-                               cascade='all, delete-orphan')
+                               cascade='all, delete-orphan',
+                               passive_deletes=True)
     projects = relationship('Project', back_populates='user',
-                            cascade='all, delete-orphan')
+                            cascade='all, delete-orphan',
+                            passive_deletes=True)
 
     def set_password(self, password: str):
         """
@@ -11,10 +11,12 @@ from .individual_schema import (
     IndividualUpdate,
     IndividualOut
 )
+from .job_schema import JobOut
 from .project_schema import (
     ProjectBase,
     ProjectCreate,
     ProjectUpdate,
+    ProjectClone,
     ProjectOut
 )
 from .relationship_schema import (
@@ -28,5 +30,6 @@ from .user_schema import (
     UserCreate,
     UserLogin,
     UserUpdate,
-    UserOut
+    UserOut,
+    UserSnapshot
 )
\ No newline at end of file
@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.models.enums_model import JobStatusEnum
+
+
+class JobOut(BaseModel):
+    """
+    Schema for returning the state of a background job.
+    """
+    id: int = Field(
+        ...,
+        description="The unique ID of the job"
+    )
+    job_type: str = Field(
+        ...,
+        description="Kind of work the job performs"
+    )
+    status: JobStatusEnum = Field(
+        ...,
+        description="Current status of the job"
+    )
+    project_id: Optional[int] = Field(
+        None,
+        description="The project the job operates on"
+    )
+    progress_current: int = Field(
+        0,
+        description="Units of work completed so far"
+    )
+    progress_total: Optional[int] = Field(
+        None,
+        description="Total units of work, if known"
+    )
+    progress_message: Optional[str] = Field(
+        None,
+        description="Description of the current stage"
+    )
+    cancel_requested: bool = Field(
+        False,
+        description="Whether cancellation of the job was requested"
+    )
+    result: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Result of a completed job"
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Error message of a failed job"
+    )
+    created_at: datetime = Field(
+        ...,
+        description="The timestamp when the job was queued"
+    )
+    started_at: Optional[datetime] = Field(
+        None,
+        description="The timestamp when a worker started the job"
+    )
+    finished_at: Optional[datetime] = Field(
+        None,
+        description="The timestamp when the job finished"
+    )
+
+    model_config = ConfigDict(from_attributes=True,
+                              use_enum_values=True)
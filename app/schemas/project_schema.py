@@ -39,6 +39,20 @@ class ProjectUpdate(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProjectClone(BaseModel):
+    """
+    Schema for cloning an existing project.
+    """
+    name: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=255,
+        description="Name of the cloned project; defaults to the source name with a '(copy)' suffix"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ProjectOut(ProjectBase):
     """
     Schema for returning project data.
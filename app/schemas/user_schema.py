@@ -147,3 +147,23 @@ class UserOut(UserBase):
     )
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserSnapshot(BaseModel):
+    """
+    Lightweight, immutable view of a user for template rendering.
+    """
+    id: int = Field(
+        ...,
+        description="The unique ID of the user"
+    )
+    username: str = Field(
+        ...,
+        description="The username of the user"
+    )
+    is_admin: bool = Field(
+        ...,
+        description="Indicates if the user has admin privileges"
+    )
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -0,0 +1,234 @@
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, select, text, union, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+
+from app.models.change_model import ProjectChange
+from app.models.enums_model import ChangeEntityEnum, \
+    InitialRelationshipEnum
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.models.project_model import Project
+from app.models.relationship_model import Relationship
+from app.utils.loader_profiles import SUMMARY, loader_options
+
+logger = logging.getLogger(__name__)
+
+Change = Tuple[ChangeEntityEnum, int]
+
+_RECORD_SELECT_SQL = """
+INSERT INTO project_changes (project_id, entity_type, entity_id, seq,
+                             deleted)
+SELECT :project_id, CAST(:entity_type AS {entity_type}), ids.id, :seq,
+       false
+FROM ({id_query}) AS ids (id)
+ON CONFLICT (project_id, entity_type, entity_id)
+DO UPDATE SET seq = EXCLUDED.seq, deleted = EXCLUDED.deleted
+"""
+
+
+class ChangeFeedService:
+    """
+    Service layer for the per-project change feed.
+
+    Every write bumps the project's `change_seq` and stores the new
+    value on the touched entities in `project_changes`. Clients that
+    remember the last sequence they saw can then fetch only the
+    entities that changed since.
+
+    Recording is done inside the caller's transaction. The sequence
+    bump locks the project row until commit, so sequence numbers
+    become visible in order and no change can be skipped by a reader.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_changes(self, project_id: int,
+                       upserts: Iterable[Change] = (),
+                       deletes: Iterable[Change] = ()) -> Optional[int]:
+        """
+        Records created or updated entities and tombstones for deleted
+        ones. Does not commit.
+
+        Returns:
+            int: The new change sequence, or None if nothing changed.
+        """
+        rows = {(entity_type, entity_id): False
+                for entity_type, entity_id in upserts}
+        rows.update({(entity_type, entity_id): True
+                     for entity_type, entity_id in deletes})
+        if not rows:
+            return None
+
+        seq = self._next_seq(project_id)
+        statement = self._insert()
+        statement = statement.on_conflict_do_update(
+            index_elements=[ProjectChange.project_id,
+                            ProjectChange.entity_type,
+                            ProjectChange.entity_id],
+            set_={"seq": statement.excluded.seq,
+                  "deleted": statement.excluded.deleted})
+        self.db.execute(statement, [
+            {"project_id": project_id, "entity_type": entity_type,
+             "entity_id": entity_id, "seq": seq, "deleted": deleted}
+            for (entity_type, entity_id), deleted in rows.items()])
+        return seq
+
+    def record_select(self, project_id: int,
+                      queries: Iterable[Tuple[ChangeEntityEnum, str]],
+                      params: dict) -> int:
+        """
+        Records upserts for every id returned by SQL queries, one query
+        per entity type, for bulk writes on PostgreSQL. Does not commit.
+
+        Returns:
+            int: The new change sequence.
+        """
+        seq = self._next_seq(project_id)
+        type_name = ProjectChange.__table__.c.entity_type.type.name
+        for entity_type, id_query in queries:
+            self.db.execute(text(_RECORD_SELECT_SQL.format(
+                entity_type=type_name, id_query=id_query)),
+                dict(params, project_id=project_id,
+                     entity_type=entity_type.name, seq=seq))
+        return seq
+
+    def kin_changes(self, individual_ids: Iterable[int]) -> List[Change]:
+        """
+        Returns upserts for the individuals whose kinship lists display
+        any of the given individuals: their relationship counterparts
+        and, through shared parents, their siblings.
+
+        Recording these alongside a name or relationship change bumps
+        the neighbours' sequence, which invalidates their cached detail
+        payloads.
+        """
+        ids = set(individual_ids)
+        if not ids:
+            return []
+        parent_rel = aliased(Relationship)
+        sibling_rel = aliased(Relationship)
+        query = union(
+            select(Relationship.related_id)
+            .where(Relationship.individual_id.in_(ids)),
+            select(Relationship.individual_id)
+            .where(Relationship.related_id.in_(ids)),
+            select(sibling_rel.related_id)
+            .join(parent_rel, and_(
+                parent_rel.individual_id == sibling_rel.individual_id,
+                parent_rel.initial_relationship ==
+                InitialRelationshipEnum.PARENT))
+            .where(parent_rel.related_id.in_(ids),
+                   sibling_rel.initial_relationship ==
+                   InitialRelationshipEnum.PARENT)
+        )
+        kin = set(self.db.execute(query).scalars()) - ids
+        return [(ChangeEntityEnum.INDIVIDUAL, individual_id)
+                for individual_id in sorted(kin)]
+
+    def entity_seq(self, project_id: int, entity_type: ChangeEntityEnum,
+                   entity_id: int) -> int:
+        """
+        Returns the sequence an entity was last changed at, or 0 if it
+        has not changed since the feed was introduced.
+        """
+        return self.db.execute(
+            select(ProjectChange.seq).where(
+                ProjectChange.project_id == project_id,
+                ProjectChange.entity_type == entity_type,
+                ProjectChange.entity_id == entity_id)
+        ).scalar() or 0
+
+    def current_seq(self, project_id: int) -> int:
+        """
+        Returns the current change sequence of a project. A project
+        already loaded in this transaction, e.g. by the access check, is
+        reused instead of being queried again.
+        """
+        project = self.db.get(Project, project_id)
+        return project.change_seq if project else 0
+
+    def get_changes(self, project_id: int, since: int,
+                    limit: Optional[int] = None) -> \
+            Tuple[int, List[ProjectChange]]:
+        """
+        Returns the current change sequence and the changes recorded
+        after `since`. With a limit, at most `limit + 1` changes are
+        returned so callers can detect an overflow.
+        """
+        current = self.current_seq(project_id)
+        query = self.db.query(ProjectChange).filter(
+            ProjectChange.project_id == project_id,
+            ProjectChange.seq > since,
+            ProjectChange.seq <= current
+        ).order_by(ProjectChange.seq)
+        if limit is not None:
+            query = query.limit(limit + 1)
+        return current, query.all()
+
+    def get_changed_entities(self, project_id: int, since: int,
+                             limit: int) -> dict:
+        """
+        Loads the entities changed after `since`, plus the ids of the
+        deleted ones.
+
+        If `since` is ahead of the project or more than `limit` entities
+        changed, only `reset` is set and the client should reload fully.
+        """
+        current, changes = self.get_changes(project_id, since, limit)
+        if since > current or len(changes) > limit:
+            return {"change_seq": current, "reset": True}
+
+        upserts = {entity_type: [] for entity_type in ChangeEntityEnum}
+        deleted = {entity_type: [] for entity_type in ChangeEntityEnum}
+        for change in changes:
+            target = deleted if change.deleted else upserts
+            target[change.entity_type].append(change.entity_id)
+
+        individuals = self.db.query(Individual).filter(
+            Individual.project_id == project_id,
+            Individual.id.in_(upserts[ChangeEntityEnum.INDIVIDUAL])
+        ).options(*loader_options(Individual, SUMMARY)).all() \
+            if upserts[ChangeEntityEnum.INDIVIDUAL] else []
+        identities = self.db.query(Identity).join(Individual).filter(
+            Individual.project_id == project_id,
+            Identity.id.in_(upserts[ChangeEntityEnum.IDENTITY])
+        ).all() if upserts[ChangeEntityEnum.IDENTITY] else []
+        relationships = self.db.query(Relationship).filter(
+            Relationship.project_id == project_id,
+            Relationship.id.in_(upserts[ChangeEntityEnum.RELATIONSHIP])
+        ).all() if upserts[ChangeEntityEnum.RELATIONSHIP] else []
+
+        return {
+            "change_seq": current,
+            "reset": False,
+            "individuals": individuals,
+            "identities": identities,
+            "relationships": relationships,
+            "deleted": {
+                "individuals": deleted[ChangeEntityEnum.INDIVIDUAL],
+                "identities": deleted[ChangeEntityEnum.IDENTITY],
+                "relationships": deleted[ChangeEntityEnum.RELATIONSHIP]
+            }
+        }
+
+    def _next_seq(self, project_id: int) -> int:
+        """
+        Increments and returns the change sequence of a project.
+        """
+        return self.db.execute(
+            update(Project).where(Project.id == project_id)
+            .values(change_seq=Project.change_seq + 1)
+            .returning(Project.change_seq)
+        ).scalar_one()
+
+    def _insert(self):
+        """
+        Returns a dialect-specific INSERT supporting ON CONFLICT.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(ProjectChange)
+        return sqlite.insert(ProjectChange)
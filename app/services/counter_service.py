@@ -0,0 +1,79 @@
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.counter_model import NumberCounter
+from app.models.enums_model import CounterScopeEnum
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.models.project_model import Project
+
+# The numbered column and its owner column per scope.
+_SCOPE_COLUMNS = {
+    CounterScopeEnum.PROJECT_NUMBER:
+        (Project.project_number, Project.user_id),
+    CounterScopeEnum.INDIVIDUAL_NUMBER:
+        (Individual.individual_number, Individual.project_id),
+    CounterScopeEnum.IDENTITY_NUMBER:
+        (Identity.identity_number, Identity.individual_id),
+}
+
+
+class CounterService:
+    """
+    Service layer for allocating project, individual and identity
+    numbers.
+
+    Each allocation is a single upsert on `number_counters` that
+    returns the new value, instead of a `max(...) + 1` query that races
+    with concurrent writers. The counter row stays locked until the
+    caller commits, so concurrent writers in the same scope wait for
+    each other instead of failing on the unique constraints.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def next_number(self, scope: CounterScopeEnum, scope_id: int) -> int:
+        """
+        Allocates the next number in a scope.
+        """
+        return self.reserve(scope, scope_id, 1)
+
+    def reserve(self, scope: CounterScopeEnum, scope_id: int,
+                count: int) -> int:
+        """
+        Allocates a block of `count` consecutive numbers in a scope, for
+        bulk inserts.
+
+        The counter never falls behind the numbers already stored, so
+        rows written without it, e.g. by a clone or restore, are
+        skipped rather than duplicated.
+
+        Returns:
+            int: The first number of the block.
+
+        Raises:
+            ValueError: If `count` is not positive.
+        """
+        if count < 1:
+            raise ValueError("At least one number must be reserved.")
+        column, owner = _SCOPE_COLUMNS[scope]
+        stored = select(func.coalesce(func.max(column), 0)).where(
+            owner == scope_id).scalar_subquery()
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            statement = postgresql.insert(NumberCounter)
+        else:
+            statement = sqlite.insert(NumberCounter)
+        statement = statement.values(scope=scope, scope_id=scope_id,
+                                     last_value=stored + count)
+        floor = statement.excluded.last_value - count
+        statement = statement.on_conflict_do_update(
+            index_elements=[NumberCounter.scope, NumberCounter.scope_id],
+            set_={"last_value": case(
+                (NumberCounter.last_value > floor,
+                 NumberCounter.last_value),
+                else_=floor) + count}
+        ).returning(NumberCounter.last_value)
+        return self.db.execute(statement).scalar_one() - count + 1
@@ -0,0 +1,148 @@
+import logging
+from typing import Dict, Iterable, List
+
+from sqlalchemy import and_, case, func, literal, or_, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+
+from app.models.display_model import IndividualDisplay
+from app.models.enums_model import InitialRelationshipEnum
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.models.relationship_model import Relationship
+
+logger = logging.getLogger(__name__)
+
+KINSHIP_KEYS = ("parents", "children", "partners", "siblings")
+
+
+class DisplayNameService:
+    """
+    Service layer for the `individual_display` name table.
+
+    Writers call `refresh` for individuals whose primary identity may
+    have changed, or `refresh_project` after bulk inserts, before
+    committing. Readers resolve names and kinship lists with a single
+    join on the table.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh(self, individual_ids: Iterable[int]):
+        """
+        Rebuilds the display rows of the given individuals. Does not
+        commit.
+        """
+        ids = sorted(set(individual_ids))
+        if ids:
+            self._upsert(Individual.id.in_(ids))
+
+    def refresh_project(self, project_id: int):
+        """
+        Rebuilds the display rows of every individual in a project.
+        Does not commit.
+        """
+        self._upsert(Individual.project_id == project_id)
+        logger.info(f"Refreshed display names for project {project_id}")
+
+    def get_names(self, individual_ids: Iterable[int]) -> Dict[int, dict]:
+        """
+        Returns {individual_id: {"id", "first_name", "last_name"}} for
+        the given individuals.
+        """
+        ids = set(individual_ids)
+        if not ids:
+            return {}
+        rows = self.db.execute(select(
+            IndividualDisplay.individual_id, IndividualDisplay.first_name,
+            IndividualDisplay.last_name).where(
+            IndividualDisplay.individual_id.in_(ids))).all()
+        return {individual_id: {"id": individual_id,
+                                "first_name": first_name,
+                                "last_name": last_name}
+                for individual_id, first_name, last_name in rows}
+
+    def get_kinship(self, individual_id: int) -> Dict[str, List[dict]]:
+        """
+        Returns the parents, children, partners and siblings of an
+        individual in the shape of the `Individual` kinship properties.
+        """
+        parent = InitialRelationshipEnum.PARENT
+        partner = InitialRelationshipEnum.PARTNER
+        to_parent = aliased(Relationship)
+        to_sibling = aliased(Relationship)
+
+        kin = union_all(
+            select(literal(0).label("kind"),
+                   Relationship.individual_id.label("kin_id"),
+                   Relationship.id.label("relationship_id")).where(
+                Relationship.related_id == individual_id,
+                Relationship.initial_relationship == parent),
+            select(literal(1), Relationship.related_id,
+                   Relationship.id).where(
+                Relationship.individual_id == individual_id,
+                Relationship.initial_relationship == parent),
+            select(literal(2),
+                   case((Relationship.individual_id == individual_id,
+                         Relationship.related_id),
+                        else_=Relationship.individual_id),
+                   Relationship.id).where(
+                or_(Relationship.individual_id == individual_id,
+                    Relationship.related_id == individual_id),
+                Relationship.initial_relationship == partner),
+            select(literal(3), to_sibling.related_id,
+                   to_sibling.id).select_from(to_parent).join(
+                to_sibling, and_(
+                    to_sibling.individual_id == to_parent.individual_id,
+                    to_sibling.initial_relationship == parent,
+                    to_sibling.related_id != individual_id)).where(
+                to_parent.related_id == individual_id,
+                to_parent.initial_relationship == parent)
+        ).subquery()
+        rows = self.db.execute(
+            select(kin.c.kind, kin.c.kin_id, kin.c.relationship_id,
+                   IndividualDisplay.first_name,
+                   IndividualDisplay.last_name).outerjoin(
+                IndividualDisplay,
+                IndividualDisplay.individual_id == kin.c.kin_id).order_by(
+                kin.c.kind, kin.c.relationship_id)).all()
+
+        kinship = {key: [] for key in KINSHIP_KEYS}
+        seen = {key: set() for key in KINSHIP_KEYS}
+        for kind, kin_id, relationship_id, first_name, last_name in rows:
+            key = KINSHIP_KEYS[kind]
+            if kin_id in seen[key]:
+                continue
+            seen[key].add(kin_id)
+            entry = {"id": kin_id, "first_name": first_name,
+                     "last_name": last_name}
+            if key != "siblings":
+                entry["relationship_id"] = relationship_id
+            kinship[key].append(entry)
+        return kinship
+
+    def _upsert(self, condition):
+        self.db.flush()
+        query = select(
+            Individual.id, Individual.project_id, Identity.first_name,
+            Identity.last_name, Identity.gender,
+            func.lower(func.concat_ws(" ", Identity.last_name,
+                                      Identity.first_name))
+        ).outerjoin(Identity, and_(Identity.individual_id == Individual.id,
+                                   Identity.is_primary.is_(True),
+                                   Identity.deleted_at.is_(None))).where(
+            condition)
+        if self.db.get_bind().dialect.name == "postgresql":
+            statement = postgresql.insert(IndividualDisplay)
+        else:
+            statement = sqlite.insert(IndividualDisplay)
+        statement = statement.from_select(
+            ["individual_id", "project_id", "first_name", "last_name",
+             "gender", "sort_key"], query)
+        statement = statement.on_conflict_do_update(
+            index_elements=[IndividualDisplay.individual_id],
+            set_={column: statement.excluded[column] for column in
+                  ("project_id", "first_name", "last_name", "gender",
+                   "sort_key")})
+        self.db.execute(statement)
@@ -0,0 +1,165 @@
+import json
+import logging
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Sequence
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from werkzeug.http import http_date
+
+from app.models.fragment_model import IndividualFragment
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.schemas.identity_schema import IdentityIdOut
+from app.schemas.individual_schema import IndividualOut
+from app.utils.db_routing import read_from_primary
+from app.utils.loader_profiles import SUMMARY, loader_options
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(o):
+    """
+    Encodes dates the way Flask's default JSON provider does, so
+    fragments match what `jsonify` would have produced.
+    """
+    if isinstance(o, date):
+        return http_date(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON "
+                    f"serializable")
+
+
+def dump_fragment(data: dict) -> str:
+    """
+    Serialises a payload in the compact, key-sorted form used for
+    fragments.
+    """
+    return json.dumps(data, default=_json_default, sort_keys=True,
+                      separators=(",", ":"))
+
+
+class FragmentService:
+    """
+    Service layer for the pre-serialised list fragments of individuals.
+
+    Each individual's `IndividualOut` JSON is stored once per change
+    instead of being validated and encoded on every list call. Writers
+    call `refresh` before committing; fragments that are missing, e.g.
+    after an import, or whose age went stale are rebuilt on read.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh(self, individual_ids: Iterable[int]) -> int:
+        """
+        Rebuilds the fragments of the given individuals. Does not
+        commit. The individuals are read from the primary, so a
+        lagging replica cannot overwrite newer fragments.
+
+        Returns:
+            int: The number of fragments written.
+        """
+        ids = sorted(set(individual_ids))
+        if not ids:
+            return 0
+        read_from_primary(self.db)
+        self.db.flush()
+        individuals = self.db.query(Individual).filter(
+            Individual.id.in_(ids)).options(
+            *loader_options(Individual, SUMMARY)).all()
+        self._store([self._build(individual)
+                     for individual in individuals])
+        return len(individuals)
+
+    def get_project_fragments(self, user_id: int, project_id: int,
+                              search_query: Optional[str] = None,
+                              exclude_ids: Sequence[int] = ()) -> \
+            List[str]:
+        """
+        Returns the fragments of a project's individuals, most recently
+        updated first, optionally filtered like
+        `IndividualService.get_individuals_by_project`. Missing or
+        expired fragments are rebuilt and committed.
+        """
+        query = select(Individual.id, IndividualFragment.payload,
+                       IndividualFragment.expires_on).outerjoin(
+            IndividualFragment,
+            IndividualFragment.individual_id == Individual.id).where(
+            Individual.user_id == user_id,
+            Individual.project_id == project_id)
+        if search_query:
+            search = f"%{search_query}%"
+            query = query.where(or_(
+                Individual.identities.any(or_(
+                    Identity.first_name.ilike(search),
+                    Identity.last_name.ilike(search))),
+                Individual.birth_place.ilike(search)))
+        if exclude_ids:
+            query = query.where(Individual.id.notin_(exclude_ids))
+        rows = self.db.execute(
+            query.order_by(Individual.updated_at.desc(),
+                           Individual.id)).all()
+
+        today = date.today()
+        stale = [individual_id for individual_id, payload, expires_on
+                 in rows if payload is None or
+                 (expires_on is not None and expires_on <= today)]
+        if not stale:
+            return [payload for _, payload, _ in rows]
+
+        self.refresh(stale)
+        self.db.commit()
+        logger.info(f"Rebuilt {len(stale)} fragments for project "
+                    f"{project_id}")
+        payloads = dict(self.db.execute(
+            select(IndividualFragment.individual_id,
+                   IndividualFragment.payload).where(
+                IndividualFragment.individual_id.in_(stale))).all())
+        return [payloads.get(individual_id, payload)
+                for individual_id, payload, _ in rows]
+
+    def _build(self, individual: Individual) -> dict:
+        individual_out = IndividualOut.model_validate(
+            individual, from_attributes=True)
+        individual_out.identities = [IdentityIdOut(id=identity.id)
+                                     for identity in
+                                     individual.identities]
+        return {
+            "individual_id": individual.id,
+            "project_id": individual.project_id,
+            "payload": dump_fragment(individual_out.model_dump()),
+            "expires_on": self._next_birthday(individual.birth_date)
+            if not individual.death_date else None,
+        }
+
+    def _store(self, rows: List[dict]):
+        if not rows:
+            return
+        if self.db.get_bind().dialect.name == "postgresql":
+            statement = postgresql.insert(IndividualFragment)
+        else:
+            statement = sqlite.insert(IndividualFragment)
+        statement = statement.on_conflict_do_update(
+            index_elements=[IndividualFragment.individual_id],
+            set_={"payload": statement.excluded.payload,
+                  "expires_on": statement.excluded.expires_on})
+        self.db.execute(statement, rows)
+
+    @staticmethod
+    def _next_birthday(birth_date: Optional[date]) -> Optional[date]:
+        """
+        Returns the first day after today on which the age changes.
+        """
+        if not birth_date:
+            return None
+        today = date.today()
+        for year in (today.year, today.year + 1):
+            try:
+                birthday = birth_date.replace(year=year)
+            except ValueError:
+                birthday = date(year, 3, 1)
+            if birthday > today:
+                return birthday
+        return today + timedelta(days=1)
@@ -1,19 +1,48 @@
 import logging
-from datetime import date, timedelta
-from typing import List, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, List, Optional
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy.sql import func
 
+from app.models.enums_model import ChangeEntityEnum, CounterScopeEnum
 from app.models.identity_model import Identity
 from app.models.individual_model import Individual
 from app.schemas.identity_schema import IdentityCreate, \
     IdentityUpdate
+from app.services.change_feed_service import ChangeFeedService
+from app.services.counter_service import CounterService
+from app.services.display_service import DisplayNameService
+from app.services.fragment_service import FragmentService
+from app.utils.statement_cache import cached_statement
 
 logger = logging.getLogger(__name__)
 
 
+def _identity_by_id():
+    """
+    Returns the cached statement loading one identity.
+    """
+    return cached_statement(
+        "identity_by_id",
+        lambda: select(Identity).where(
+            Identity.id == bindparam("identity_id")).limit(1))
+
+
+def _identities_by_project():
+    """
+    Returns the cached statement listing the identities of a project
+    with their individuals.
+    """
+    return cached_statement(
+        "identities_by_project",
+        lambda: select(Identity).join(Individual).where(
+            Identity.project_id == bindparam("project_id"),
+            Individual.project_id == bindparam("project_id")
+        ).options(joinedload(Identity.individual)))
+
+
 class IdentityService:
     """
     Service layer for managing identities associated with individuals.
@@ -43,26 +72,22 @@ class IdentityService:
             SQLAlchemyError: For any database-related errors.
         """
         try:
-            max_identity_number = self.db.query(
-                func.max(Identity.identity_number)
-            ).filter(
-                Identity.individual_id == identity_create.individual_id
-            ).scalar()
-            next_identity_number = 1 if max_identity_number is None else max_identity_number + 1
+            individual_id = identity_create.individual_id
+            identities = self._lock_identities(individual_id)
+            current_primary = self._primary_of(identities)
 
             # Create new identity (defaulting to non-primary)
             new_identity = Identity(**identity_create.model_dump(),
                                     is_primary=False)
-            new_identity.identity_number = next_identity_number
-
+            new_identity.project_id = select(
+                Individual.project_id).where(
+                Individual.id == individual_id).scalar_subquery()
+            new_identity.identity_number = CounterService(
+                self.db).next_number(CounterScopeEnum.IDENTITY_NUMBER,
+                                     individual_id)
             self.db.add(new_identity)
             self.db.flush()  # Flush to generate an ID for the new identity
-
-            # Retrieve the current primary identity, if any
-            current_primary = self.db.query(Identity).filter(
-                Identity.individual_id == identity_create.individual_id,
-                Identity.is_primary == True
-            ).first()
+            changed = [new_identity.id]
 
             # If requested or if the new valid_from is later than the current primary's valid_from,
             # assign the new identity as primary.
@@ -71,14 +96,12 @@ class IdentityService:
                     identity_create.valid_from and current_primary.valid_from and
                     identity_create.valid_from > current_primary.valid_from
             ):
-                self.assign_primary_identity(
-                    identity_create.individual_id,
-                    new_identity.id,
-                    identity_create.valid_from
-                )
-
-            self.db.commit()
-            self.db.refresh(new_identity)
+                changed += self._assign_primary(
+                    current_primary, new_identity,
+                    identity_create.valid_from)
+
+            self._record_changes(individual_id, upserts=changed)
+            self._commit(individual_id)
             logger.info(f"Created identity: ID={new_identity.id}")
             return new_identity
 
@@ -100,9 +123,9 @@ class IdentityService:
         Retrieves an identity by its unique identifier.
         """
         try:
-            identity = self.db.query(Identity).filter(
-                Identity.id == identity_id
-            ).first()
+            identity = self.db.execute(
+                _identity_by_id(),
+                {"identity_id": identity_id}).scalars().first()
             if not identity:
                 logger.warning(
                     f"Identity not found: ID={identity_id}")
@@ -117,10 +140,9 @@ class IdentityService:
         Retrieves all identities associated with a specific project.
         """
         try:
-            identities = self.db.query(Identity).join(
-                Individual).filter(
-                Individual.project_id == project_id
-            ).options(joinedload(Identity.individual)).all()
+            identities = self.db.execute(
+                _identities_by_project(),
+                {"project_id": project_id}).scalars().all()
             logger.info(
                 f"Retrieved {len(identities)} identities for project {project_id}")
             return identities
@@ -135,41 +157,39 @@ class IdentityService:
         Identity]:
         """
         Updates the details of an existing identity.
-        If the identity is set to become primary, assigns it accordingly.
+        If the identity is set to become primary, assigns it accordingly;
+        if the primary is demoted, the latest other identity takes over.
         """
         try:
-            identity = self.get_identity_by_id(identity_id)
+            identities = self._lock_identities(
+                self._individual_of(identity_id))
+            identity = next((i for i in identities if i.id == identity_id),
+                            None)
             if not identity:
                 logger.warning(
                     f"Identity not found for update: ID={identity_id}")
                 return None
 
             updates = identity_update.model_dump(exclude_unset=True)
-            is_being_set_primary = updates.get("is_primary",
+            is_being_set_primary = updates.pop("is_primary",
                                                identity.is_primary)
-
-            if identity.is_primary and is_being_set_primary:
-                for field, value in updates.items():
-                    setattr(identity, field, value)
-                self.db.commit()
-                self.db.refresh(identity)
-                logger.info(f"Updated identity: ID={identity_id}")
-                return identity
-
-            if is_being_set_primary:
-                new_valid_from = updates.get("valid_from",
-                                             identity.valid_from)
-                self.assign_primary_identity(
-                    individual_id=identity.individual_id,
-                    new_identity_id=identity_id,
-                    new_valid_from=new_valid_from
-                )
+            changed = [identity_id]
+
+            if is_being_set_primary and not identity.is_primary:
+                changed += self._assign_primary(
+                    self._primary_of(identities), identity,
+                    updates.get("valid_from", identity.valid_from))
+            elif identity.is_primary and not is_being_set_primary:
+                successor = self._latest_of(
+                    [i for i in identities if i is not identity])
+                if successor:
+                    changed += self._assign_primary(identity, successor)
 
             for field, value in updates.items():
                 setattr(identity, field, value)
 
-            self.db.commit()
-            self.db.refresh(identity)
+            self._record_changes(identity.individual_id, upserts=changed)
+            self._commit(identity.individual_id)
             logger.info(f"Updated identity: ID={identity_id}")
             return identity
 
@@ -184,45 +204,39 @@ class IdentityService:
 
     def delete_identity(self, identity_id: int) -> bool:
         """
-        Deletes an identity by its unique identifier.
-        If the deleted identity was primary, sets the next suitable identity as primary.
+        Deletes an identity by its unique identifier, by setting its
+        tombstone. If the deleted identity was primary, the identity with the latest
+        valid_from becomes primary in the same transaction.
         """
         try:
-            identity = self.get_identity_by_id(identity_id)
+            identities = self._lock_identities(
+                self._individual_of(identity_id))
+            identity = next((i for i in identities if i.id == identity_id),
+                            None)
             if not identity:
                 logger.warning(
                     f"Identity not found for deletion: ID={identity_id}")
                 return False
 
             individual_id = identity.individual_id
-            was_primary = identity.is_primary
-
-            self.db.delete(identity)
-            self.db.commit()
-            logger.info(f"Deleted identity: ID={identity_id}")
-
-            if was_primary:
-                new_primary = self.db.query(Identity).filter(
-                    Identity.individual_id == individual_id
-                ).order_by(
-                    Identity.valid_from.desc().nullslast()).first()
-
+            upserts = []
+            identity.deleted_at = datetime.now(timezone.utc)
+            if identity.is_primary:
+                new_primary = self._latest_of(
+                    [i for i in identities if i is not identity])
                 if new_primary:
+                    # The old primary must be tombstoned before the
+                    # partial unique index accepts a new one.
+                    self.db.flush()
                     new_primary.is_primary = True
-
-                    next_identity = self.db.query(Identity).filter(
-                        Identity.individual_id == individual_id,
-                        Identity.valid_from > new_primary.valid_from
-                    ).order_by(Identity.valid_from.asc()).first()
-
-                    if next_identity:
-                        new_primary.valid_until = next_identity.valid_from - timedelta(
-                            days=1)
-
-                    self.db.commit()
+                    upserts.append(new_primary.id)
                     logger.info(
                         f"Set identity ID={new_primary.id} as primary for individual ID={individual_id}")
 
+            self._record_changes(individual_id, upserts=upserts,
+                                 deletes=[identity_id])
+            self._commit(individual_id)
+            logger.info(f"Deleted identity: ID={identity_id}")
             return True
 
         except SQLAlchemyError as e:
@@ -230,58 +244,99 @@ class IdentityService:
             logger.error(f"Error deleting identity: {e}")
             return False
 
-    def assign_primary_identity(self, individual_id: int,
-                                new_identity_id: Optional[
-                                    int] = None,
-                                new_valid_from: Optional[
-                                    date] = None):
+    def _lock_identities(self, individual_id) -> List[Identity]:
         """
-        Assigns a primary identity for an individual.
-        Updates the previous primary's valid_until date and marks the new identity as primary.
+        Loads and locks all identities of an individual, so primary
+        changes are computed from a stable set and can never leave the
+        individual with two or zero primaries.
         """
-        try:
-            current_primary = self.db.query(Identity).filter(
-                Identity.individual_id == individual_id,
-                Identity.is_primary == True
-            ).first()
-
-            if new_identity_id and current_primary and current_primary.id != new_identity_id:
-                new_primary = self.db.query(Identity).filter(
-                    Identity.id == new_identity_id
-                ).first()
-                if new_primary:
-                    new_primary.is_primary = True
+        return self.db.query(Identity).filter(
+            Identity.individual_id == individual_id
+        ).order_by(Identity.id).with_for_update().all()
 
-                    if new_valid_from:
-                        new_valid_until = new_valid_from - timedelta(
-                            days=1)
-                        if current_primary.valid_from and new_valid_until <= current_primary.valid_from:
-                            raise ValueError(
-                                "New valid_from date must be at least one day after the current primary's valid_from date.")
-                        current_primary.valid_until = new_valid_until
+    @staticmethod
+    def _individual_of(identity_id: int):
+        """
+        Returns a subquery for the individual of an identity, so it can
+        be locked with the same statement.
+        """
+        return select(Identity.individual_id).where(
+            Identity.id == identity_id).scalar_subquery()
 
-                    current_primary.is_primary = False
+    @staticmethod
+    def _primary_of(identities: List[Identity]) -> Optional[Identity]:
+        return next((i for i in identities if i.is_primary), None)
 
-            elif new_identity_id and current_primary and current_primary.id == new_identity_id:
-                # Already primary, no changes needed.
-                pass
+    @staticmethod
+    def _latest_of(identities: List[Identity]) -> Optional[Identity]:
+        """
+        Returns the identity with the latest valid_from, preferring
+        identities with a valid_from over those without.
+        """
+        return max(identities, default=None,
+                   key=lambda i: (i.valid_from is not None,
+                                  i.valid_from or date.min, i.id))
+
+    def _assign_primary(self, current_primary: Optional[Identity],
+                        new_primary: Identity,
+                        new_valid_from: Optional[date] = None) -> \
+            List[int]:
+        """
+        Makes `new_primary` the primary identity, ending the previous
+        primary's validity the day before `new_valid_from`. Does not
+        commit.
 
-            elif not current_primary and new_identity_id:
-                new_primary = self.db.query(Identity).filter(
-                    Identity.id == new_identity_id
-                ).first()
-                if new_primary:
-                    new_primary.is_primary = True
+        Returns:
+            list: The ids of the identities that changed.
 
-            self.db.commit()
-            logger.info(
-                f"Assigned primary identity for individual ID={individual_id}")
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            logger.error(f"Error assigning primary identity: {e}")
-            raise
-        except ValueError as ve:
-            self.db.rollback()
-            logger.error(
-                f"Validation error assigning primary identity: {ve}")
-            raise ve
+        Raises:
+            ValueError: If the new primary would start less than a day
+            after the current one.
+        """
+        changed = [new_primary.id]
+        if current_primary and current_primary is not new_primary:
+            if new_valid_from:
+                new_valid_until = new_valid_from - timedelta(days=1)
+                if current_primary.valid_from and new_valid_until <= current_primary.valid_from:
+                    raise ValueError(
+                        "New valid_from date must be at least one day after the current primary's valid_from date.")
+                current_primary.valid_until = new_valid_until
+            current_primary.is_primary = False
+            changed.append(current_primary.id)
+            # The partial unique index allows one primary at a time.
+            self.db.flush()
+        new_primary.is_primary = True
+        logger.info(
+            f"Assigned primary identity for individual ID={new_primary.individual_id}")
+        return changed
+
+    def _commit(self, individual_id: int):
+        """
+        Refreshes the individual's display name and list fragment,
+        which embed its primary identity, and commits.
+        """
+        DisplayNameService(self.db).refresh([individual_id])
+        FragmentService(self.db).refresh([individual_id])
+        self.db.commit()
+
+    def _record_changes(self, individual_id: int,
+                        upserts: Iterable[int] = (),
+                        deletes: Iterable[int] = ()):
+        """
+        Records identity changes in the project's change feed. The
+        individual is recorded as well, since it embeds its primary
+        identity, and so is its kin, whose kinship lists show its name.
+        """
+        project_id = self.db.query(Individual.project_id).filter(
+            Individual.id == individual_id).scalar()
+        if project_id is None:
+            return
+        feed = ChangeFeedService(self.db)
+        feed.record_changes(
+            project_id,
+            upserts=[(ChangeEntityEnum.IDENTITY, identity_id)
+                     for identity_id in upserts] +
+                    [(ChangeEntityEnum.INDIVIDUAL, individual_id)] +
+                    feed.kin_changes([individual_id]),
+            deletes=[(ChangeEntityEnum.IDENTITY, identity_id)
+                     for identity_id in deletes])
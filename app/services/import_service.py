@@ -0,0 +1,544 @@
+import csv
+import logging
+from datetime import datetime
+from typing import Callable, Dict, IO, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.models.enums_model import (
+    ChangeEntityEnum,
+    CounterScopeEnum,
+    GenderEnum,
+    InitialRelationshipEnum,
+    HorizontalRelationshipTypeEnum,
+    VerticalRelationshipTypeEnum
+)
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.models.relationship_model import Relationship
+from app.services.change_feed_service import ChangeFeedService
+from app.services.counter_service import CounterService
+from app.services.display_service import DisplayNameService
+
+logger = logging.getLogger(__name__)
+
+INDIVIDUAL_COLUMNS = (
+    "ref", "first_name", "last_name", "gender", "birth_date",
+    "birth_place", "death_date", "death_place", "notes"
+)
+RELATIONSHIP_COLUMNS = (
+    "individual_ref", "related_ref", "initial_relationship",
+    "relationship_detail", "union_date", "union_place",
+    "dissolution_date", "notes"
+)
+
+_CREATE_STAGING_SQL = """
+CREATE TEMP TABLE import_individuals (
+    ord bigserial,
+    ref text, first_name text, last_name text, gender text,
+    birth_date text, birth_place text, death_date text,
+    death_place text, notes text
+) ON COMMIT DROP;
+CREATE TEMP TABLE import_relationships (
+    ord bigserial,
+    individual_ref text, related_ref text,
+    initial_relationship text, relationship_detail text,
+    union_date text, union_place text, dissolution_date text,
+    notes text
+) ON COMMIT DROP;
+"""
+
+_DUPLICATE_REFS_SQL = """
+SELECT count(*) FROM (
+    SELECT trim(ref) FROM import_individuals
+    GROUP BY trim(ref) HAVING count(*) > 1 OR trim(ref) IS NULL
+      OR trim(ref) = ''
+) dup
+"""
+
+# `::date` would also accept locale-dependent forms such as 01-02-1950,
+# so dates are checked against the ISO format used by the API first.
+_INVALID_DATES_SQL = """
+SELECT count(*) FROM {table}
+WHERE {conditions}
+"""
+
+_CREATE_MAP_SQL = """
+CREATE TEMP TABLE import_individual_map ON COMMIT DROP AS
+SELECT s.ord,
+       trim(s.ref) AS ref,
+       nextval(pg_get_serial_sequence('individuals', 'id'))::integer
+           AS individual_id,
+       (:base_number + row_number() OVER (ORDER BY s.ord))::integer
+           AS individual_number
+FROM import_individuals s;
+CREATE UNIQUE INDEX ON import_individual_map (ref);
+"""
+
+_MERGE_INDIVIDUALS_SQL = """
+INSERT INTO individuals (id, individual_number, user_id, project_id,
+                         birth_date, birth_place, death_date,
+                         death_place, notes)
+SELECT m.individual_id, m.individual_number, :user_id, :project_id,
+       NULLIF(trim(s.birth_date), '')::date,
+       NULLIF(trim(s.birth_place), ''),
+       NULLIF(trim(s.death_date), '')::date,
+       NULLIF(trim(s.death_place), ''),
+       NULLIF(s.notes, '')
+FROM import_individuals s
+JOIN import_individual_map m ON m.ord = s.ord
+"""
+
+_MERGE_IDENTITIES_SQL = """
+INSERT INTO identities (individual_id, project_id, identity_number,
+                        first_name, last_name, gender, valid_from,
+                        is_primary)
+SELECT m.individual_id, :project_id, 1,
+       NULLIF(trim(s.first_name), ''),
+       NULLIF(trim(s.last_name), ''),
+       CAST(upper(replace(NULLIF(trim(s.gender), ''), ' ', '_'))
+            AS {gender_type}),
+       NULLIF(trim(s.birth_date), '')::date,
+       true
+FROM import_individuals s
+JOIN import_individual_map m ON m.ord = s.ord
+"""
+
+_UNRESOLVED_REFS_SQL = """
+SELECT count(*)
+FROM import_relationships s
+LEFT JOIN import_individual_map a ON a.ref = trim(s.individual_ref)
+LEFT JOIN import_individual_map b ON b.ref = trim(s.related_ref)
+WHERE a.individual_id IS NULL OR b.individual_id IS NULL
+"""
+
+# Child rows are stored as parent rows with swapped ids and partner
+# rows are stored with the lower id first, matching
+# RelationshipService.create_relationship. Only the first row per
+# unordered pair is kept.
+_MERGE_RELATIONSHIPS_SQL = """
+INSERT INTO relationships (project_id, individual_id, related_id,
+                           initial_relationship,
+                           relationship_detail_horizontal,
+                           relationship_detail_vertical,
+                           union_date, union_place, dissolution_date,
+                           notes)
+SELECT DISTINCT ON (LEAST(c.individual_id, c.related_id),
+                    GREATEST(c.individual_id, c.related_id))
+       :project_id, c.individual_id, c.related_id,
+       CAST(c.kind AS {relationship_type}),
+       CASE WHEN c.kind = 'PARTNER'
+            THEN CAST(c.detail AS {horizontal_type}) END,
+       CASE WHEN c.kind = 'PARENT'
+            THEN CAST(c.detail AS {vertical_type}) END,
+       c.union_date, c.union_place, c.dissolution_date, c.notes
+FROM (
+    SELECT s.ord,
+           CASE WHEN r.kind = 'CHILD' THEN b.individual_id
+                WHEN r.kind = 'PARTNER'
+                    THEN LEAST(a.individual_id, b.individual_id)
+                ELSE a.individual_id END AS individual_id,
+           CASE WHEN r.kind = 'CHILD' THEN a.individual_id
+                WHEN r.kind = 'PARTNER'
+                    THEN GREATEST(a.individual_id, b.individual_id)
+                ELSE b.individual_id END AS related_id,
+           CASE WHEN r.kind = 'CHILD' THEN 'PARENT'
+                ELSE r.kind END AS kind,
+           upper(replace(NULLIF(trim(s.relationship_detail), ''),
+                         ' ', '_')) AS detail,
+           NULLIF(trim(s.union_date), '')::date AS union_date,
+           NULLIF(trim(s.union_place), '') AS union_place,
+           NULLIF(trim(s.dissolution_date), '')::date
+               AS dissolution_date,
+           NULLIF(s.notes, '') AS notes
+    FROM import_relationships s
+    CROSS JOIN LATERAL (
+        SELECT upper(trim(s.initial_relationship)) AS kind
+    ) r
+    JOIN import_individual_map a ON a.ref = trim(s.individual_ref)
+    JOIN import_individual_map b ON b.ref = trim(s.related_ref)
+) c
+WHERE c.individual_id <> c.related_id
+ORDER BY LEAST(c.individual_id, c.related_id),
+         GREATEST(c.individual_id, c.related_id), c.ord
+"""
+
+
+class ImportService:
+    """
+    Service layer for bulk importing individuals, their primary
+    identities and relationships from CSV files.
+
+    On PostgreSQL the files are streamed into temporary tables with
+    `COPY ... FROM STDIN` and merged with set-based SQL. Other engines
+    fall back to building ORM objects in a single transaction.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def import_csv(self, user_id: int, project_id: int,
+                   individuals_csv: IO[str],
+                   relationships_csv: Optional[IO[str]] = None,
+                   progress: Optional[Callable[[str], None]] = None) -> \
+            Dict[str, int]:
+        """
+        Imports individuals and (optionally) relationships into a project.
+
+        `individuals_csv` must have a header row with a unique `ref`
+        column plus any of the other INDIVIDUAL_COLUMNS.
+        `relationships_csv` references individuals by their `ref`.
+        `progress` is called with a description of each import stage.
+
+        Returns:
+            dict: Number of imported individuals, identities and
+            relationships.
+
+        Raises:
+            ValueError: If the files are malformed or violate constraints.
+            SQLAlchemyError: For any other database-related errors.
+        """
+        individual_columns = self._read_header(individuals_csv,
+                                               INDIVIDUAL_COLUMNS)
+        if "ref" not in individual_columns:
+            raise ValueError(
+                "Individuals CSV requires a 'ref' column.")
+        relationship_columns = None
+        if relationships_csv is not None:
+            relationship_columns = self._read_header(
+                relationships_csv, RELATIONSHIP_COLUMNS)
+            missing = {"individual_ref", "related_ref",
+                       "initial_relationship"} - set(
+                relationship_columns)
+            if missing:
+                raise ValueError(
+                    f"Relationships CSV is missing columns: "
+                    f"{', '.join(sorted(missing))}.")
+
+        report = progress or _no_progress
+        try:
+            if self.db.get_bind().dialect.name == "postgresql":
+                counts = self._import_with_copy(
+                    user_id, project_id,
+                    individuals_csv, individual_columns,
+                    relationships_csv, relationship_columns, report)
+            else:
+                counts = self._import_with_orm(
+                    user_id, project_id,
+                    individuals_csv, individual_columns,
+                    relationships_csv, relationship_columns, report)
+            DisplayNameService(self.db).refresh_project(project_id)
+            self.db.commit()
+            logger.info(
+                f"Imported CSV into project {project_id}: {counts}")
+            return counts
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Database error during CSV import: {e}")
+            message = str(e).lower()
+            if "chk_individual_dates" in message:
+                raise ValueError(
+                    "Birth date must be before death date.")
+            if "chk_relationship_dates" in message:
+                raise ValueError(
+                    "Union date must be before dissolution date.")
+            if "invalid input" in message or "out of range" in message:
+                raise ValueError(f"Invalid value in CSV: {e.orig}")
+            raise
+        except ValueError as ve:
+            self.db.rollback()
+            logger.error(f"Validation error during CSV import: {ve}")
+            raise ve
+
+    @staticmethod
+    def _read_header(stream: IO[str],
+                     allowed: Tuple[str, ...]) -> List[str]:
+        """
+        Consumes and validates the header row of a CSV stream.
+        """
+        header_line = stream.readline()
+        if not header_line:
+            raise ValueError("CSV file is empty.")
+        columns = [c.strip().lower() for c in
+                   next(csv.reader([header_line]))]
+        unknown = [c for c in columns if c not in allowed]
+        if unknown:
+            raise ValueError(
+                f"Unknown CSV columns: {', '.join(unknown)}.")
+        if len(set(columns)) != len(columns):
+            raise ValueError("Duplicate CSV columns.")
+        return columns
+
+    def _import_with_copy(self, user_id: int, project_id: int,
+                          individuals_csv: IO[str],
+                          individual_columns: List[str],
+                          relationships_csv: Optional[IO[str]],
+                          relationship_columns: Optional[List[str]],
+                          report: Callable[[str], None]) -> \
+            Dict[str, int]:
+        """
+        Stages the CSV files with COPY and merges them with set-based SQL.
+        """
+        report("Reading CSV files")
+        self.db.execute(text(_CREATE_STAGING_SQL))
+        self._copy("import_individuals", individual_columns,
+                   individuals_csv)
+        if relationships_csv is not None:
+            self._copy("import_relationships", relationship_columns,
+                       relationships_csv)
+
+        report("Validating CSV files")
+        self._check_dates("import_individuals",
+                          ("birth_date", "death_date"))
+        if relationships_csv is not None:
+            self._check_dates("import_relationships",
+                              ("union_date", "dissolution_date"))
+        if self.db.execute(text(_DUPLICATE_REFS_SQL)).scalar():
+            raise ValueError(
+                "Every individual needs a unique, non-empty 'ref'.")
+
+        staged = self.db.execute(
+            text("SELECT count(*) FROM import_individuals")).scalar()
+        base_number = CounterService(self.db).reserve(
+            CounterScopeEnum.INDIVIDUAL_NUMBER, project_id,
+            staged) - 1 if staged else 0
+        self.db.execute(text(_CREATE_MAP_SQL),
+                        {"base_number": base_number})
+
+        report("Importing individuals")
+        params = {"user_id": user_id, "project_id": project_id}
+        individuals = self.db.execute(
+            text(_MERGE_INDIVIDUALS_SQL), params).rowcount
+        identities = self.db.execute(text(
+            _MERGE_IDENTITIES_SQL.format(
+                gender_type=Identity.__table__.c.gender.type.name)
+        ), params).rowcount
+
+        changed_ids = [
+            (ChangeEntityEnum.INDIVIDUAL,
+             "SELECT individual_id FROM import_individual_map"),
+            (ChangeEntityEnum.IDENTITY,
+             "SELECT x.id FROM identities x JOIN import_individual_map m "
+             "ON m.individual_id = x.individual_id")]
+
+        relationships = 0
+        if relationships_csv is not None:
+            report("Importing relationships")
+            params["max_relationship_id"] = self.db.query(
+                func.max(Relationship.id)).execution_options(
+                include_deleted=True).scalar() or 0
+            changed_ids.append(
+                (ChangeEntityEnum.RELATIONSHIP,
+                 "SELECT id FROM relationships WHERE project_id = "
+                 ":project_id AND id > :max_relationship_id"))
+            if self.db.execute(text(_UNRESOLVED_REFS_SQL)).scalar():
+                raise ValueError(
+                    "Relationships reference unknown individuals.")
+            columns = Relationship.__table__.c
+            relationships = self.db.execute(text(
+                _MERGE_RELATIONSHIPS_SQL.format(
+                    relationship_type=columns.initial_relationship.type.name,
+                    horizontal_type=columns.relationship_detail_horizontal.type.name,
+                    vertical_type=columns.relationship_detail_vertical.type.name)
+            ), params).rowcount
+
+        ChangeFeedService(self.db).record_select(project_id, changed_ids,
+                                                 params)
+        return {"individuals": individuals,
+                "identities": identities,
+                "relationships": relationships}
+
+    def _check_dates(self, table: str, columns: Tuple[str, ...]):
+        """
+        Rejects staged date values that are not in YYYY-MM-DD format.
+        """
+        conditions = " OR ".join(
+            f"NULLIF(trim({column}), '') !~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}$'"
+            for column in columns)
+        invalid = self.db.execute(text(_INVALID_DATES_SQL.format(
+            table=table, conditions=conditions))).scalar()
+        if invalid:
+            raise ValueError(
+                "Invalid date format in CSV. Expected format is YYYY-MM-DD.")
+
+    def _copy(self, table: str, columns: List[str],
+              stream: IO[str]):
+        """
+        Streams the remainder of a CSV file into a staging table.
+        """
+        raw_connection = self.db.connection().connection
+        dbapi = self.db.get_bind().dialect.dbapi
+        with raw_connection.cursor() as cursor:
+            try:
+                cursor.copy_expert(
+                    f"COPY {table} ({', '.join(columns)}) "
+                    f"FROM STDIN WITH (FORMAT csv)",
+                    stream)
+            except dbapi.Error as e:
+                raise ValueError(f"Could not read CSV: {e}")
+
+    def _import_with_orm(self, user_id: int, project_id: int,
+                         individuals_csv: IO[str],
+                         individual_columns: List[str],
+                         relationships_csv: Optional[IO[str]],
+                         relationship_columns: Optional[List[str]],
+                         report: Callable[[str], None]) -> \
+            Dict[str, int]:
+        """
+        Fallback for engines without COPY support.
+        """
+        report("Importing individuals")
+        by_ref: Dict[str, Individual] = {}
+        for row in csv.DictReader(individuals_csv,
+                                  fieldnames=individual_columns):
+            ref = (row.get("ref") or "").strip()
+            if not ref or ref in by_ref:
+                raise ValueError(
+                    "Every individual needs a unique, non-empty 'ref'.")
+            birth_date = _parse_date(row.get("birth_date"))
+            individual = Individual(
+                user_id=user_id,
+                project_id=project_id,
+                birth_date=birth_date,
+                birth_place=_clean(row.get("birth_place")),
+                death_date=_parse_date(row.get("death_date")),
+                death_place=_clean(row.get("death_place")),
+                notes=row.get("notes") or None
+            )
+            individual.identities.append(Identity(
+                project_id=project_id,
+                identity_number=1,
+                first_name=_clean(row.get("first_name")),
+                last_name=_clean(row.get("last_name")),
+                gender=_parse_enum(GenderEnum, row.get("gender")),
+                valid_from=birth_date,
+                is_primary=True
+            ))
+            by_ref[ref] = individual
+
+        if by_ref:
+            first_number = CounterService(self.db).reserve(
+                CounterScopeEnum.INDIVIDUAL_NUMBER, project_id,
+                len(by_ref))
+            for number, individual in enumerate(by_ref.values(),
+                                                start=first_number):
+                individual.individual_number = number
+        self.db.add_all(by_ref.values())
+        self.db.flush()
+
+        changes = [(ChangeEntityEnum.INDIVIDUAL, individual.id)
+                   for individual in by_ref.values()]
+        changes += [(ChangeEntityEnum.IDENTITY, identity.id)
+                    for individual in by_ref.values()
+                    for identity in individual.identities]
+
+        new_relationships = []
+        if relationships_csv is not None:
+            report("Importing relationships")
+            seen_pairs = set()
+            for row in csv.DictReader(relationships_csv,
+                                      fieldnames=relationship_columns):
+                individual = by_ref.get(
+                    (row.get("individual_ref") or "").strip())
+                related = by_ref.get(
+                    (row.get("related_ref") or "").strip())
+                if individual is None or related is None:
+                    raise ValueError(
+                        "Relationships reference unknown individuals.")
+                kind = _parse_enum(InitialRelationshipEnum,
+                                   row.get("initial_relationship"))
+                if kind is None:
+                    raise ValueError(
+                        "Missing initial_relationship value.")
+                individual_id, related_id = individual.id, related.id
+                if kind == InitialRelationshipEnum.CHILD:
+                    kind = InitialRelationshipEnum.PARENT
+                    individual_id, related_id = related_id, individual_id
+                elif kind == InitialRelationshipEnum.PARTNER and \
+                        related_id < individual_id:
+                    individual_id, related_id = related_id, individual_id
+
+                pair = (min(individual_id, related_id),
+                        max(individual_id, related_id))
+                if individual_id == related_id or pair in seen_pairs:
+                    continue
+                seen_pairs.add(pair)
+
+                new_rel = Relationship(
+                    project_id=project_id,
+                    individual_id=individual_id,
+                    related_id=related_id,
+                    initial_relationship=kind,
+                    union_date=_parse_date(row.get("union_date")),
+                    union_place=_clean(row.get("union_place")),
+                    dissolution_date=_parse_date(
+                        row.get("dissolution_date")),
+                    notes=row.get("notes") or None
+                )
+                if kind == InitialRelationshipEnum.PARTNER:
+                    new_rel.relationship_detail_horizontal = _parse_enum(
+                        HorizontalRelationshipTypeEnum,
+                        row.get("relationship_detail"))
+                else:
+                    new_rel.relationship_detail_vertical = _parse_enum(
+                        VerticalRelationshipTypeEnum,
+                        row.get("relationship_detail"))
+                self.db.add(new_rel)
+                new_relationships.append(new_rel)
+            self.db.flush()
+            changes += [(ChangeEntityEnum.RELATIONSHIP, rel.id)
+                        for rel in new_relationships]
+
+        ChangeFeedService(self.db).record_changes(project_id,
+                                                  upserts=changes)
+
+        return {"individuals": len(by_ref),
+                "identities": len(by_ref),
+                "relationships": len(new_relationships)}
+
+
+def _no_progress(_message: str):
+    """
+    Default progress callback that ignores stage updates.
+    """
+
+
+def _clean(value: Optional[str]) -> Optional[str]:
+    """
+    Strips a CSV value and turns blanks into None.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def _parse_date(value: Optional[str]):
+    """
+    Parses an ISO (YYYY-MM-DD) CSV date value.
+    """
+    value = _clean(value)
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(
+            f"Invalid date format: {value}. Expected format is YYYY-MM-DD.")
+
+
+def _parse_enum(enum_cls, value: Optional[str]):
+    """
+    Parses a CSV enum value by its value or member name.
+    """
+    value = _clean(value)
+    if value is None:
+        return None
+    normalized = value.lower().replace("_", " ")
+    for member in enum_cls:
+        if member.value == normalized:
+            return member
+    raise ValueError(f"Invalid value '{value}' for {enum_cls.__name__}.")
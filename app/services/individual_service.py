@@ -1,19 +1,69 @@
 import logging
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
+from sqlalchemy import bindparam, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy.sql import func
+from sqlalchemy.orm import Session
 
+from app.models.enums_model import ChangeEntityEnum, CounterScopeEnum
 from app.models.identity_model import Identity
 from app.models.individual_model import Individual
 from app.models.relationship_model import Relationship
 from app.schemas.individual_schema import IndividualCreate, \
     IndividualUpdate
+from app.services.change_feed_service import ChangeFeedService
+from app.services.counter_service import CounterService
+from app.services.display_service import DisplayNameService
+from app.services.fragment_service import FragmentService
+from app.utils.loader_profiles import SUMMARY, loader_options
+from app.utils.statement_cache import cached_statement
 
 logger = logging.getLogger(__name__)
 
 
+def _individual_by_id(profile: str):
+    """
+    Returns the cached statement loading one individual of a user's
+    project with a loader profile.
+    """
+    options = loader_options(Individual, profile)
+    return cached_statement(
+        ("individual_by_id", profile),
+        lambda: select(Individual).where(
+            Individual.id == bindparam("individual_id"),
+            Individual.user_id == bindparam("user_id"),
+            Individual.project_id == bindparam("project_id")
+        ).options(*options).limit(1))
+
+
+def _individuals_by_project(profile: str, search: bool):
+    """
+    Returns the cached statement listing the individuals of a user's
+    project with a loader profile, most recently updated first. With
+    `search`, only individuals whose name or birth place matches the
+    `search` pattern are listed.
+    """
+    options = loader_options(Individual, profile)
+
+    def build():
+        statement = select(Individual).where(
+            Individual.user_id == bindparam("user_id"),
+            Individual.project_id == bindparam("project_id"))
+        if search:
+            pattern = bindparam("search")
+            statement = statement.where(
+                Individual.identities.any(
+                    (Identity.first_name.ilike(pattern)) |
+                    (Identity.last_name.ilike(pattern))) |
+                (Individual.birth_place.ilike(pattern)))
+        return statement.options(*options).order_by(
+            Individual.updated_at.desc())
+
+    return cached_statement(("individuals_by_project", profile, search),
+                            build)
+
+
 class IndividualService:
     """
     Service layer for managing individuals within projects.
@@ -31,11 +81,8 @@ class IndividualService:
         Creates a new individual and a primary identity within the project.
         """
         try:
-            max_individual_number = self.db.query(
-                func.max(Individual.individual_number)
-            ).filter_by(user_id=user_id,
-                        project_id=project_id).scalar()
-            next_individual_number = 1 if max_individual_number is None else max_individual_number + 1
+            next_individual_number = CounterService(self.db).next_number(
+                CounterScopeEnum.INDIVIDUAL_NUMBER, project_id)
 
             new_individual = Individual(
                 user_id=user_id,
@@ -49,21 +96,21 @@ class IndividualService:
 
             primary_identity = Identity(
                 individual_id=new_individual.id,
+                project_id=project_id,
                 first_name=individual_create.first_name,
                 last_name=individual_create.last_name,
                 gender=individual_create.gender,
                 valid_from=individual_create.birth_date,
-                is_primary=True
+                is_primary=True,
+                identity_number=1
             )
-
-            max_identity_number = self.db.query(
-                func.max(Identity.identity_number)
-            ).filter(
-                Identity.individual_id == new_individual.id).scalar()
-            next_identity_number = 1 if max_identity_number is None else max_identity_number + 1
-            primary_identity.identity_number = next_identity_number
-
             self.db.add(primary_identity)
+            self.db.flush()
+            ChangeFeedService(self.db).record_changes(project_id, upserts=[
+                (ChangeEntityEnum.INDIVIDUAL, new_individual.id),
+                (ChangeEntityEnum.IDENTITY, primary_identity.id)])
+            DisplayNameService(self.db).refresh([new_individual.id])
+            FragmentService(self.db).refresh([new_individual.id])
             self.db.commit()
             self.db.refresh(new_individual)
             logger.info(
@@ -84,25 +131,18 @@ class IndividualService:
             raise ve
 
     def get_individual_by_id(self, individual_id: int, user_id: int,
-                             project_id: int) -> Optional[
+                             project_id: int,
+                             profile: str = SUMMARY) -> Optional[
         Individual]:
         """
-        Fetches an individual by ID within the specified project.
+        Fetches an individual by ID within the specified project, loading
+        relationships according to the named loader profile.
         """
         try:
-            individual = self.db.query(Individual).filter_by(
-                id=individual_id, user_id=user_id,
-                project_id=project_id
-            ).options(
-                joinedload(Individual.identities),
-                joinedload(Individual.primary_identity),
-                joinedload(
-                    Individual.relationships_as_individual).joinedload(
-                    Relationship.related),
-                joinedload(
-                    Individual.relationships_as_related).joinedload(
-                    Relationship.individual),
-            ).first()
+            individual = self.db.execute(
+                _individual_by_id(profile),
+                {"individual_id": individual_id, "user_id": user_id,
+                 "project_id": project_id}).scalars().first()
             if not individual:
                 logger.warning(
                     f"Individual not found: ID={individual_id}")
@@ -115,33 +155,19 @@ class IndividualService:
     def get_individuals_by_project(self, user_id: int,
                                    project_id: int,
                                    search_query: Optional[
-                                       str] = None) -> List[
+                                       str] = None,
+                                   profile: str = SUMMARY) -> List[
         Individual]:
         """
         Fetches all individuals in a project, optionally filtered by a search query.
         """
         try:
-            query = self.db.query(Individual).filter_by(
-                user_id=user_id, project_id=project_id).options(
-                joinedload(Individual.identities),
-                joinedload(Individual.primary_identity),
-                joinedload(
-                    Individual.relationships_as_individual).joinedload(
-                    Relationship.related),
-                joinedload(
-                    Individual.relationships_as_related).joinedload(
-                    Relationship.individual),
-            )
+            params = {"user_id": user_id, "project_id": project_id}
             if search_query:
-                search = f"%{search_query}%"
-                query = query.join(Individual.identities).filter(
-                    (Identity.first_name.ilike(search)) |
-                    (Identity.last_name.ilike(search)) |
-                    (Individual.birth_place.ilike(search))
-                )
-
-            individuals = query.order_by(
-                Individual.updated_at.desc()).all()
+                params["search"] = f"%{search_query}%"
+            individuals = self.db.execute(
+                _individuals_by_project(profile, bool(search_query)),
+                params).scalars().all()
             logger.info(
                 f"Retrieved {len(individuals)} individuals for project {project_id}")
             return individuals
@@ -187,6 +213,16 @@ class IndividualService:
                     primary_identity.valid_from = updates[
                         "birth_date"]
 
+            feed = ChangeFeedService(self.db)
+            changes = [(ChangeEntityEnum.INDIVIDUAL, individual.id)]
+            if primary_identity:
+                changes.append(
+                    (ChangeEntityEnum.IDENTITY, primary_identity.id))
+                if updates.keys() & {"first_name", "last_name"}:
+                    changes += feed.kin_changes([individual.id])
+            feed.record_changes(project_id, upserts=changes)
+            DisplayNameService(self.db).refresh([individual.id])
+            FragmentService(self.db).refresh([individual.id])
             self.db.commit()
             self.db.refresh(individual)
             logger.info(f"Updated individual: ID={individual_id}")
@@ -200,19 +236,37 @@ class IndividualService:
     def delete_individual(self, individual_id: int, user_id: int,
                           project_id: int) -> bool:
         """
-        Deletes an individual by ID.
+        Deletes an individual by ID, by setting the tombstone of the
+        individual and of its live identities and relationships in one
+        update per table. They can be restored together until purged.
         """
         try:
-            individual = self.db.query(Individual).filter_by(
-                id=individual_id, user_id=user_id,
-                project_id=project_id
-            ).first()
-            if not individual:
+            deleted_at = datetime.now(timezone.utc)
+            found = self.db.execute(
+                update(Individual).where(
+                    Individual.id == individual_id,
+                    Individual.user_id == user_id,
+                    Individual.project_id == project_id,
+                    Individual.deleted_at.is_(None))
+                .values(deleted_at=deleted_at),
+                execution_options={"synchronize_session": False}
+            ).rowcount
+            if not found:
                 logger.warning(
                     f"Individual not found for deletion: ID={individual_id}")
                 return False
 
-            self.db.delete(individual)
+            # Kin are read before the relationships are tombstoned.
+            feed = ChangeFeedService(self.db)
+            kin = feed.kin_changes([individual_id])
+            identity_ids, relationship_ids = self._set_kin_tombstones(
+                individual_id, project_id, None, deleted_at)
+            deleted = [(ChangeEntityEnum.INDIVIDUAL, individual_id)]
+            deleted += [(ChangeEntityEnum.IDENTITY, identity_id)
+                        for identity_id in identity_ids]
+            deleted += [(ChangeEntityEnum.RELATIONSHIP, relationship_id)
+                        for relationship_id in relationship_ids]
+            feed.record_changes(project_id, upserts=kin, deletes=deleted)
             self.db.commit()
             logger.info(f"Deleted individual: ID={individual_id}")
             return True
@@ -221,3 +275,91 @@ class IndividualService:
             self.db.rollback()
             logger.error(f"Error deleting individual: {e}")
             return False
+
+    def restore_individual(self, individual_id: int, user_id: int,
+                           project_id: int) -> Optional[Individual]:
+        """
+        Restores a deleted individual that has not been purged yet,
+        together with the identities and relationships deleted with it.
+        Relationships to individuals that are still deleted stay deleted.
+        """
+        try:
+            deleted_at = self.db.execute(
+                select(Individual.deleted_at).where(
+                    Individual.id == individual_id,
+                    Individual.user_id == user_id,
+                    Individual.project_id == project_id,
+                    Individual.deleted_at.isnot(None)
+                ).with_for_update().execution_options(include_deleted=True)
+            ).scalar()
+            if deleted_at is None:
+                logger.warning(
+                    f"Deleted individual not found for restore: ID={individual_id}")
+                return None
+
+            self.db.execute(
+                update(Individual).where(
+                    Individual.id == individual_id,
+                    Individual.project_id == project_id)
+                .values(deleted_at=None),
+                execution_options={"synchronize_session": False})
+            identity_ids, relationship_ids = self._set_kin_tombstones(
+                individual_id, project_id, deleted_at, None)
+            feed = ChangeFeedService(self.db)
+            upserts = [(ChangeEntityEnum.INDIVIDUAL, individual_id)]
+            upserts += [(ChangeEntityEnum.IDENTITY, identity_id)
+                        for identity_id in identity_ids]
+            upserts += [(ChangeEntityEnum.RELATIONSHIP, relationship_id)
+                        for relationship_id in relationship_ids]
+            upserts += feed.kin_changes([individual_id])
+            feed.record_changes(project_id, upserts=upserts)
+            self.db.commit()
+            logger.info(f"Restored individual: ID={individual_id}")
+            return self.get_individual_by_id(individual_id, user_id,
+                                             project_id)
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error restoring individual: {e}")
+            return None
+
+    def _set_kin_tombstones(self, individual_id: int, project_id: int,
+                            current: Optional[datetime],
+                            deleted_at: Optional[datetime]) -> \
+            Tuple[List[int], List[int]]:
+        """
+        Changes the tombstone of an individual's identities and
+        relationships from `current` to `deleted_at`, None meaning live.
+        Relationships are only restored if both individuals are live.
+
+        Returns:
+            tuple: The ids of the changed identities and relationships.
+        """
+
+        def tombstone_is(column):
+            return column.is_(None) if current is None \
+                else column == current
+
+        identity_ids = self.db.scalars(
+            update(Identity).where(
+                Identity.project_id == project_id,
+                Identity.individual_id == individual_id,
+                tombstone_is(Identity.deleted_at))
+            .values(deleted_at=deleted_at).returning(Identity.id),
+            execution_options={"synchronize_session": False}).all()
+
+        relationships = update(Relationship).where(
+            Relationship.project_id == project_id,
+            or_(Relationship.individual_id == individual_id,
+                Relationship.related_id == individual_id),
+            tombstone_is(Relationship.deleted_at))
+        if deleted_at is None:
+            relationships = relationships.where(~select(Individual.id).where(
+                Individual.id.in_((Relationship.individual_id,
+                                   Relationship.related_id)),
+                Individual.deleted_at.isnot(None)).exists())
+        relationship_ids = self.db.scalars(
+            relationships.values(deleted_at=deleted_at)
+            .returning(Relationship.id),
+            execution_options={"synchronize_session": False}).all()
+        return identity_ids, relationship_ids
@@ -0,0 +1,260 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.enums_model import JobStatusEnum
+from app.models.job_model import Job
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = (JobStatusEnum.COMPLETED, JobStatusEnum.FAILED,
+                     JobStatusEnum.CANCELLED)
+
+
+class JobService:
+    """
+    Service layer for queueing background jobs and tracking their
+    progress. Jobs live in the `jobs` table, which doubles as the queue
+    the worker process claims work from.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue_job(self, user_id: int, job_type: str,
+                    payload: Optional[dict] = None,
+                    project_id: Optional[int] = None) -> Job:
+        """
+        Adds a new job to the queue.
+
+        Raises:
+            SQLAlchemyError: If the job cannot be stored.
+        """
+        try:
+            job = Job(
+                user_id=user_id,
+                project_id=project_id,
+                job_type=job_type,
+                status=JobStatusEnum.QUEUED,
+                payload=payload or {},
+                progress_current=0,
+                cancel_requested=False,
+                attempts=0
+            )
+            self.db.add(job)
+            self.db.commit()
+            self.db.refresh(job)
+            logger.info(
+                f"Enqueued job {job.id} ({job_type}) for user {user_id}")
+            return job
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error enqueuing job {job_type}: {e}")
+            raise
+
+    def get_job(self, job_id: int, user_id: int) -> Optional[Job]:
+        """
+        Retrieves a job owned by the user.
+        """
+        return self.db.query(Job).filter(
+            Job.id == job_id, Job.user_id == user_id
+        ).first()
+
+    def get_jobs(self, user_id: int,
+                 project_id: Optional[int] = None,
+                 limit: int = 50) -> List[Job]:
+        """
+        Retrieves the most recent jobs of a user, optionally for one
+        project only.
+        """
+        query = self.db.query(Job).filter(Job.user_id == user_id)
+        if project_id is not None:
+            query = query.filter(Job.project_id == project_id)
+        return query.order_by(Job.id.desc()).limit(limit).all()
+
+    def cancel_job(self, job_id: int, user_id: int) -> Optional[Job]:
+        """
+        Cancels a queued job immediately, or asks the worker to stop a
+        running one at its next progress update.
+
+        Returns:
+            Job: The updated job, or None if it is not found.
+        """
+        try:
+            job = self.db.query(Job).filter(
+                Job.id == job_id, Job.user_id == user_id
+            ).with_for_update().first()
+            if not job:
+                return None
+            if job.status == JobStatusEnum.QUEUED:
+                job.status = JobStatusEnum.CANCELLED
+                job.finished_at = datetime.now(timezone.utc)
+            elif job.status == JobStatusEnum.RUNNING:
+                job.cancel_requested = True
+            self.db.commit()
+            self.db.refresh(job)
+            return job
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error cancelling job {job_id}: {e}")
+            raise
+
+    def claim_next_job(self, worker_id: str,
+                       stale_after: timedelta) -> Optional[Job]:
+        """
+        Claims the oldest queued job for a worker. Running jobs whose
+        worker stopped sending heartbeats are claimed again.
+
+        The row is locked with SKIP LOCKED so several workers can poll
+        the same table without handing out a job twice.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            job = self.db.query(Job).filter(or_(
+                Job.status == JobStatusEnum.QUEUED,
+                and_(Job.status == JobStatusEnum.RUNNING,
+                     Job.heartbeat_at < now - stale_after)
+            )).order_by(Job.id).with_for_update(
+                skip_locked=True).first()
+            if not job:
+                self.db.rollback()
+                return None
+            job.status = JobStatusEnum.RUNNING
+            job.worker_id = worker_id
+            job.attempts += 1
+            job.started_at = now
+            job.heartbeat_at = now
+            self.db.commit()
+            self.db.refresh(job)
+            logger.info(
+                f"Worker {worker_id} claimed job {job.id} ({job.job_type})")
+            return job
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error claiming job: {e}")
+            raise
+
+    def report_progress(self, job_id: int, current: int,
+                        total: Optional[int] = None,
+                        message: Optional[str] = None) -> bool:
+        """
+        Stores the progress of a running job and refreshes its heartbeat.
+
+        Returns:
+            bool: True if cancellation of the job was requested.
+        """
+        values = {"progress_current": current,
+                  "heartbeat_at": datetime.now(timezone.utc)}
+        if total is not None:
+            values["progress_total"] = total
+        if message is not None:
+            values["progress_message"] = message[:255]
+        try:
+            cancel_requested = self.db.execute(
+                update(Job).where(Job.id == job_id).values(**values)
+                .returning(Job.cancel_requested)
+            ).scalar()
+            self.db.commit()
+            return bool(cancel_requested)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(
+                f"Error reporting progress of job {job_id}: {e}")
+            raise
+
+    def renew_heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """
+        Refreshes the heartbeat of a job the worker is running.
+
+        Returns:
+            bool: False if the job is no longer running on the worker,
+            e.g. because another worker claimed it again.
+        """
+        try:
+            result = self.db.execute(
+                update(Job).where(Job.id == job_id,
+                                  Job.worker_id == worker_id,
+                                  Job.status == JobStatusEnum.RUNNING)
+                .values(heartbeat_at=datetime.now(timezone.utc)))
+            self.db.commit()
+            return bool(result.rowcount)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(
+                f"Error renewing heartbeat of job {job_id}: {e}")
+            raise
+
+    def finish_job(self, job_id: int, status: JobStatusEnum,
+                   result: Optional[dict] = None,
+                   result_file: Optional[str] = None,
+                   error: Optional[str] = None,
+                   worker_id: Optional[str] = None) -> bool:
+        """
+        Marks a job as completed, failed or cancelled. With a
+        `worker_id`, only a job still owned by that worker is changed.
+
+        Returns:
+            bool: False if the job was not changed.
+        """
+        values = {"status": status, "result": result,
+                  "result_file": result_file, "error": error,
+                  "finished_at": datetime.now(timezone.utc)}
+        if status == JobStatusEnum.COMPLETED:
+            values["progress_message"] = None
+        statement = update(Job).where(Job.id == job_id)
+        if worker_id is not None:
+            statement = statement.where(Job.worker_id == worker_id)
+        try:
+            finished = bool(
+                self.db.execute(statement.values(**values)).rowcount)
+            self.db.commit()
+            if finished:
+                logger.info(f"Job {job_id} finished: {status.value}")
+            else:
+                logger.warning(
+                    f"Job {job_id} not finished as {status.value}: "
+                    f"it is no longer owned by worker {worker_id}")
+            return finished
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error finishing job {job_id}: {e}")
+            raise
+
+    def purge_finished_jobs(self, older_than: timedelta) -> List[str]:
+        """
+        Deletes finished jobs older than the given age.
+
+        Returns:
+            list: Paths of the spooled input and result files of the
+            deleted jobs, so callers can remove them.
+        """
+        cutoff = datetime.now(timezone.utc) - older_than
+        try:
+            jobs = self.db.query(Job).filter(
+                Job.status.in_(FINISHED_STATUSES),
+                Job.finished_at < cutoff
+            ).all()
+            paths = []
+            for job in jobs:
+                paths.extend(job_files(job))
+                self.db.delete(job)
+            self.db.commit()
+            return paths
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error purging finished jobs: {e}")
+            raise
+
+
+def job_files(job: Job) -> List[str]:
+    """
+    Returns the spooled files that belong to a job.
+    """
+    paths = list((job.payload or {}).get("files", {}).values())
+    if job.result_file:
+        paths.append(job.result_file)
+    return paths
@@ -1,15 +1,91 @@
 import logging
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
 
+from sqlalchemy import bindparam, select, text, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
 
+from app.models.enums_model import CounterScopeEnum
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
 from app.models.project_model import Project
-from app.schemas.project_schema import ProjectCreate, ProjectUpdate
+from app.models.relationship_model import Relationship
+from app.schemas.project_schema import ProjectCreate, ProjectUpdate, \
+    ProjectClone
+from app.services.counter_service import CounterService
+from app.services.display_service import DisplayNameService
+from app.utils.access_cache import forget_project
+from app.utils.loader_profiles import SUMMARY, loader_options
+from app.utils.statement_cache import cached_statement
 
 logger = logging.getLogger(__name__)
 
+# Individuals copied per batch of clone statements; progress is
+# reported between batches.
+CLONE_BATCH_SIZE = 5000
+
+_CLONE_MAP_SQL = """
+CREATE TEMP TABLE clone_individual_map ON COMMIT DROP AS
+SELECT id AS old_id,
+       nextval(pg_get_serial_sequence('individuals', 'id'))::integer
+           AS new_id
+FROM individuals
+WHERE project_id = :source_id AND deleted_at IS NULL;
+CREATE UNIQUE INDEX ON clone_individual_map (old_id);
+"""
+
+_CLONE_INDIVIDUALS_SQL = """
+INSERT INTO individuals (id, individual_number, user_id, project_id,
+                         birth_date, birth_place, death_date,
+                         death_place, notes)
+SELECT m.new_id, i.individual_number, :user_id, :target_id,
+       i.birth_date, i.birth_place, i.death_date, i.death_place,
+       i.notes
+FROM individuals i
+JOIN clone_individual_map m ON m.old_id = i.id
+WHERE m.old_id > :after AND m.old_id <= :upto
+"""
+
+_CLONE_IDENTITIES_SQL = """
+INSERT INTO identities (individual_id, project_id, identity_number,
+                        first_name, last_name, gender, valid_from,
+                        valid_until, is_primary)
+SELECT m.new_id, :target_id, x.identity_number, x.first_name,
+       x.last_name, x.gender, x.valid_from, x.valid_until, x.is_primary
+FROM identities x
+JOIN clone_individual_map m ON m.old_id = x.individual_id
+WHERE x.project_id = :source_id AND x.deleted_at IS NULL
+  AND m.old_id > :after AND m.old_id <= :upto
+"""
+
+_CLONE_RELATIONSHIPS_SQL = """
+INSERT INTO relationships (project_id, individual_id, related_id,
+                           initial_relationship,
+                           relationship_detail_horizontal,
+                           relationship_detail_vertical,
+                           union_date, union_place, dissolution_date,
+                           notes)
+SELECT :target_id, a.new_id, b.new_id, r.initial_relationship,
+       r.relationship_detail_horizontal,
+       r.relationship_detail_vertical,
+       r.union_date, r.union_place, r.dissolution_date, r.notes
+FROM relationships r
+JOIN clone_individual_map a ON a.old_id = r.individual_id
+JOIN clone_individual_map b ON b.old_id = r.related_id
+WHERE r.project_id = :source_id AND r.deleted_at IS NULL
+  AND a.old_id > :after AND a.old_id <= :upto
+"""
+
+
+def _projects_by_user():
+    """
+    Returns the cached statement listing the projects of a user.
+    """
+    return cached_statement(
+        "projects_by_user",
+        lambda: select(Project).where(
+            Project.user_id == bindparam("user_id")))
 
 class ProjectService:
     """
@@ -27,15 +103,10 @@ class ProjectService:
         Creates a new project for a user.
         """
         try:
-            max_project_number = self.db.query(
-                func.max(Project.project_number)).filter(
-                Project.user_id == user_id
-            ).scalar()
-            next_project_number = 1 if max_project_number is None else max_project_number + 1
-
             new_project = Project(
                 user_id=user_id,
-                project_number=next_project_number,
+                project_number=CounterService(self.db).next_number(
+                    CounterScopeEnum.PROJECT_NUMBER, user_id),
                 name=project_create.name
             )
             self.db.add(new_project)
@@ -55,8 +126,9 @@ class ProjectService:
         Fetches all projects for a specific user.
         """
         try:
-            projects = self.db.query(Project).filter(
-                Project.user_id == user_id).all()
+            projects = self.db.execute(
+                _projects_by_user(),
+                {"user_id": user_id}).scalars().all()
             logger.info(
                 f"Retrieved {len(projects)} projects for user {user_id}")
             return projects
@@ -72,8 +144,7 @@ class ProjectService:
         Fetches a project by its ID.
         """
         try:
-            project = self.db.query(Project).filter(
-                Project.id == project_id).first()
+            project = self.db.get(Project, project_id)
             if not project:
                 logger.warning(f"Project not found: ID={project_id}")
             return project
@@ -111,21 +182,168 @@ class ProjectService:
                 f"Error updating project for user {user_id}: {e}")
             return None
 
-    def delete_project(self, project_id: int, user_id: int) -> bool:
+    def clone_project(self, project_id: int, user_id: int,
+                      project_clone: ProjectClone,
+                      progress: Optional[
+                          Callable[[int, int], None]] = None) -> \
+            Optional[Project]:
         """
-        Deletes a project by its ID.
+        Copies a project with all its individuals, identities and
+        relationships into a new project for the same user.
+
+        On PostgreSQL the rows are copied inside the database with
+        INSERT ... SELECT statements and an id-mapping temp table, in
+        batches of CLONE_BATCH_SIZE individuals. `progress` is called
+        with the number of batches done and their total.
+
+        Returns None if the user has no such project. Database errors
+        are rolled back and re-raised.
         """
         try:
-            project = self.db.query(Project).filter(
+            source = self.db.query(Project).filter(
                 Project.id == project_id, Project.user_id == user_id
             ).first()
-            if not project:
+            if not source:
+                logger.warning(
+                    f"Project not found for clone: ID={project_id}, User={user_id}")
+                return None
+
+            new_project = Project(
+                user_id=user_id,
+                project_number=CounterService(self.db).next_number(
+                    CounterScopeEnum.PROJECT_NUMBER, user_id),
+                name=project_clone.name or f"{source.name} (copy)"[:100]
+            )
+            self.db.add(new_project)
+            self.db.flush()
+
+            if self.db.get_bind().dialect.name == "postgresql":
+                params = {"source_id": source.id,
+                          "target_id": new_project.id,
+                          "user_id": user_id}
+                self.db.execute(text(_CLONE_MAP_SQL), params)
+                self._clone_rows_in_batches(params, progress)
+            else:
+                self._clone_rows_with_orm(source, new_project)
+
+            DisplayNameService(self.db).refresh_project(new_project.id)
+            self.db.commit()
+            self.db.refresh(new_project)
+            logger.info(
+                f"Project cloned: ID={project_id} -> ID={new_project.id}")
+            return new_project
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(
+                f"Error cloning project {project_id} for user {user_id}: {e}")
+            raise
+
+    def _clone_rows_in_batches(self, params: dict, progress=None):
+        """
+        Runs the clone statements for consecutive ranges of the mapped
+        individual ids. Relationships are copied once all individuals
+        exist, since both ends must be present.
+        """
+        old_ids = self.db.execute(text(
+            "SELECT old_id FROM clone_individual_map ORDER BY old_id"
+        )).scalars().all()
+        ranges = []
+        after = 0
+        for start in range(0, len(old_ids), CLONE_BATCH_SIZE):
+            upto = old_ids[min(start + CLONE_BATCH_SIZE, len(old_ids)) - 1]
+            ranges.append(dict(params, after=after, upto=upto))
+            after = upto
+        steps = [(statements, bounds)
+                 for statements in ((_CLONE_INDIVIDUALS_SQL,
+                                     _CLONE_IDENTITIES_SQL),
+                                    (_CLONE_RELATIONSHIPS_SQL,))
+                 for bounds in ranges]
+        for done, (statements, bounds) in enumerate(steps, 1):
+            for statement in statements:
+                self.db.execute(text(statement), bounds)
+            if progress:
+                progress(done, len(steps))
+
+    def _clone_rows_with_orm(self, source: Project,
+                             target: Project):
+        """
+        Fallback for engines without sequences: copies the rows through
+        the ORM.
+        """
+        id_map = {}
+        individuals = self.db.query(Individual).filter(
+            Individual.project_id == source.id).options(
+            *loader_options(Individual, SUMMARY)).all()
+        for individual in individuals:
+            copy = Individual(
+                individual_number=individual.individual_number,
+                user_id=target.user_id,
+                project_id=target.id,
+                birth_date=individual.birth_date,
+                birth_place=individual.birth_place,
+                death_date=individual.death_date,
+                death_place=individual.death_place,
+                notes=individual.notes
+            )
+            for identity in individual.identities:
+                copy.identities.append(Identity(
+                    project_id=target.id,
+                    identity_number=identity.identity_number,
+                    first_name=identity.first_name,
+                    last_name=identity.last_name,
+                    gender=identity.gender,
+                    valid_from=identity.valid_from,
+                    valid_until=identity.valid_until,
+                    is_primary=identity.is_primary
+                ))
+            self.db.add(copy)
+            id_map[individual.id] = copy
+        self.db.flush()
+
+        for rel in source.relationships:
+            self.db.add(Relationship(
+                project_id=target.id,
+                individual_id=id_map[rel.individual_id].id,
+                related_id=id_map[rel.related_id].id,
+                initial_relationship=rel.initial_relationship,
+                relationship_detail_horizontal=rel.relationship_detail_horizontal,
+                relationship_detail_vertical=rel.relationship_detail_vertical,
+                union_date=rel.union_date,
+                union_place=rel.union_place,
+                dissolution_date=rel.dissolution_date,
+                notes=rel.notes
+            ))
+        self.db.flush()
+
+    def delete_project(self, project_id: int, user_id: int,
+                       invalidate_cache: bool = True) -> bool:
+        """
+        Deletes a project by its ID, as a single update setting its
+        tombstone. Its individuals, identities and relationships are
+        hidden with it and removed by the purger, unless the project is
+        restored first.
+
+        Callers on an event loop pass `invalidate_cache=False` and call
+        `forget_project` from a thread pool, since the cache may do
+        file I/O.
+        """
+        try:
+            result = self.db.execute(
+                update(Project).where(Project.id == project_id,
+                                      Project.user_id == user_id,
+                                      Project.deleted_at.is_(None))
+                .values(deleted_at=datetime.now(timezone.utc)),
+                execution_options={"synchronize_session": False})
+            if not result.rowcount:
+                self.db.rollback()
                 logger.warning(
                     f"Project not found for deletion: ID={project_id}, User={user_id}")
                 return False
 
-            self.db.delete(project)
             self.db.commit()
+            if invalidate_cache:
+                forget_project(project_id)
             logger.info(f"Project deleted: ID={project_id}")
             return True
 
@@ -134,3 +352,31 @@ class ProjectService:
             logger.error(
                 f"Error deleting project for user {user_id}: {e}")
             return False
+
+    def restore_project(self, project_id: int, user_id: int) -> \
+            Optional[Project]:
+        """
+        Restores a deleted project that has not been purged yet.
+        """
+        try:
+            result = self.db.execute(
+                update(Project).where(Project.id == project_id,
+                                      Project.user_id == user_id,
+                                      Project.deleted_at.isnot(None))
+                .values(deleted_at=None),
+                execution_options={"synchronize_session": False})
+            if not result.rowcount:
+                self.db.rollback()
+                logger.warning(
+                    f"Deleted project not found for restore: ID={project_id}, User={user_id}")
+                return None
+
+            self.db.commit()
+            logger.info(f"Project restored: ID={project_id}")
+            return self.db.get(Project, project_id)
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(
+                f"Error restoring project for user {user_id}: {e}")
+            return None
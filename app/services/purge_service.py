@@ -0,0 +1,118 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.models.project_model import Project
+from app.models.relationship_model import Relationship
+
+logger = logging.getLogger(__name__)
+
+PURGE_BATCH_SIZE = 500
+
+
+class PurgeService:
+    """
+    Service layer that physically deletes tombstoned rows once they can
+    no longer be restored.
+
+    Rows are deleted in batches, each in its own transaction, so locks
+    are held briefly and memory use stays constant however many rows
+    are waiting. The database cascades from a row to its dependants.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def purge_deleted(self, older_than: timedelta,
+                      batch_size: int = PURGE_BATCH_SIZE,
+                      keep_going: Optional[Callable[[], bool]] = None
+                      ) -> Dict[str, int]:
+        """
+        Deletes the projects, individuals, identities and relationships
+        tombstoned longer than `older_than` ago.
+
+        Args:
+            keep_going (callable, optional): Checked before each batch;
+                the purge stops early once it returns False.
+
+        Returns:
+            dict: The number of rows deleted per table. Rows removed by
+            a cascade are counted with the row they belonged to.
+
+        Raises:
+            SQLAlchemyError: If a batch cannot be deleted. Batches
+            committed before stay deleted.
+        """
+        cutoff = datetime.now(timezone.utc) - older_than
+        keep_going = keep_going or (lambda: True)
+        counts = {"projects": 0, "individuals": 0, "identities": 0,
+                  "relationships": 0}
+
+        while keep_going():
+            project_id = self.db.execute(
+                select(Project.id).where(Project.deleted_at < cutoff)
+                .limit(1).execution_options(include_deleted=True)
+            ).scalar()
+            if project_id is None:
+                break
+            counts["individuals"] += self.purge_project(
+                project_id, batch_size, keep_going)
+            counts["projects"] += 1
+
+        for model, key in ((Individual, "individuals"),
+                           (Identity, "identities"),
+                           (Relationship, "relationships")):
+            counts[key] += self._purge_rows(
+                model, model.deleted_at < cutoff, batch_size, keep_going)
+        if any(counts.values()):
+            logger.info(f"Purged deleted rows: {counts}")
+        return counts
+
+    def purge_project(self, project_id: int,
+                      batch_size: int = PURGE_BATCH_SIZE,
+                      keep_going: Optional[Callable[[], bool]] = None
+                      ) -> int:
+        """
+        Deletes a project in batches of individuals and then the project
+        row itself, unless stopped early.
+
+        Returns:
+            int: The number of individuals deleted.
+        """
+        deleted = self._purge_rows(
+            Individual, Individual.project_id == project_id, batch_size,
+            keep_going)
+        if keep_going is None or keep_going():
+            self.db.execute(
+                delete(Project).where(Project.id == project_id),
+                execution_options={"synchronize_session": False})
+            self.db.commit()
+        return deleted
+
+    def _purge_rows(self, model, condition, batch_size: int,
+                    keep_going: Optional[Callable[[], bool]]) -> int:
+        """
+        Deletes the rows of a model matching a condition, one committed
+        batch at a time.
+
+        Returns:
+            int: The number of rows deleted.
+        """
+        batch = select(model.id).where(condition).limit(
+            batch_size).scalar_subquery()
+        deleted = 0
+        while keep_going is None or keep_going():
+            count = self.db.execute(
+                delete(model).where(condition, model.id.in_(batch)),
+                execution_options={"synchronize_session": False}
+            ).rowcount
+            self.db.commit()
+            if not count:
+                break
+            deleted += count
+        return deleted
@@ -1,44 +1,68 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import Dict, List
+
+from app.models.enums_model import InitialRelationshipEnum
 from app.models.individual_model import Individual
-from app.models.relationship import Relationship
-from datetime import date
+from app.models.relationship_model import Relationship
 
 
 class RegisterNumberingService:
-    def __init__(self, SessionLocal: Session):
-        self.SessionLocal = SessionLocal
+    """
+    Assigns register numbers to the descendants of an individual.
 
-    def compute_register_numbers(self, root_individual_id: int) -> \
-    Dict[int, int]:
-        register_map = {}
-        next_number = 2  # The root gets #1, children start at #2
+    The root gets #1 and descendants are numbered depth-first, siblings
+    ordered by birth date. All descendants are fetched with a single
+    recursive query instead of one query per generation; UNION keeps
+    the recursion finite if the data contains a cycle.
+    """
 
-        def assign_numbers(individual_id: int, current_number: int):
-            register_map[individual_id] = current_number
+    def __init__(self, db: Session):
+        self.db = db
 
-            children = self._get_children(individual_id)
-            children.sort(
-                key=lambda c: (c.birth_date or date.min, c.id))
-
-            nonlocal next_number
-            for child in children:
-                assign_numbers(child.id, next_number)
-                next_number += 1
+    def compute_register_numbers(self, root_individual_id: int) -> \
+    Dict[int, int]:
+        children = defaultdict(list)
+        for parent_id, child_id, birth_date in self._get_descendants(
+                root_individual_id):
+            children[parent_id].append((birth_date or date.min,
+                                        child_id))
 
-        assign_numbers(root_individual_id, 1)
+        register_map = {}
+        stack = [root_individual_id]
+        while stack:
+            individual_id = stack.pop()
+            if individual_id in register_map:
+                continue
+            register_map[individual_id] = len(register_map) + 1
+            stack.extend(child_id for _, child_id in sorted(
+                set(children[individual_id]), reverse=True))
         return register_map
 
-    def _get_children(self, parent_id: int) -> List[Individual]:
-        rels = (self.SessionLocal.query(Relationship)
-                .filter(Relationship.individual_id == parent_id,
-                        Relationship.relationship_type == 'parent')
-                .all())
-
-        child_ids = [r.related_id for r in rels]
-        if not child_ids:
-            return []
-
-        children = self.SessionLocal.query(Individual).filter(
-            Individual.id.in_(child_ids)).all()
-        return children
+    def _get_descendants(self, root_individual_id: int) -> \
+    List[Tuple[int, int, date]]:
+        """
+        Returns (parent_id, child_id, child_birth_date) for every parent
+        relationship below the root.
+        """
+        parent = InitialRelationshipEnum.PARENT
+        tree = select(
+            Relationship.individual_id.label("parent_id"),
+            Relationship.related_id.label("child_id")
+        ).where(
+            Relationship.individual_id == root_individual_id,
+            Relationship.initial_relationship == parent
+        ).cte("descendants", recursive=True)
+        tree = tree.union(
+            select(Relationship.individual_id,
+                   Relationship.related_id).join(
+                tree, Relationship.individual_id == tree.c.child_id
+            ).where(Relationship.initial_relationship == parent)
+        )
+        return self.db.execute(
+            select(tree.c.parent_id, tree.c.child_id,
+                   Individual.birth_date).select_from(tree).join(
+                Individual, Individual.id == tree.c.child_id)).all()
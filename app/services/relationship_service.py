@@ -1,20 +1,52 @@
 import logging
-from typing import Optional, List
+from datetime import datetime, timezone
+from typing import Iterable, Optional, List
 
-from sqlalchemy import and_, or_
+from sqlalchemy import bindparam, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.models.enums_model import InitialRelationshipEnum
+from app.models.enums_model import ChangeEntityEnum, \
+    InitialRelationshipEnum
 from app.models.individual_model import Individual
 from app.models.relationship_model import Relationship
 from app.schemas.relationship_schema import RelationshipCreate, \
     RelationshipUpdate
+from app.services.change_feed_service import Change, ChangeFeedService
+from app.utils.loader_profiles import SUMMARY, loader_options
+from app.utils.statement_cache import cached_statement
 from app.utils.validators import ValidationUtils
 
 logger = logging.getLogger(__name__)
 
 
+def _relationship_by_id(profile: str):
+    """
+    Returns the cached statement loading one relationship with a loader
+    profile.
+    """
+    options = loader_options(Relationship, profile)
+    return cached_statement(
+        ("relationship_by_id", profile),
+        lambda: select(Relationship).where(
+            Relationship.id == bindparam("relationship_id")
+        ).options(*options).limit(1))
+
+
+def _relationships_by_project(profile: str):
+    """
+    Returns the cached statement listing the relationships of a project
+    with a loader profile.
+    """
+    options = loader_options(Relationship, profile)
+    return cached_statement(
+        ("relationships_by_project", profile),
+        lambda: select(Relationship).where(
+            Relationship.project_id == bindparam("project_id")
+        ).options(*options))
+
+
 class RelationshipService:
     """
     Service layer for managing relationships between individuals.
@@ -43,34 +75,6 @@ class RelationshipService:
                 raise ValueError(
                     "Cannot create a self-relationship.")
 
-            primary_individual = self.db.query(Individual).filter_by(
-                id=individual_id, project_id=project_id
-            ).first()
-            related_individual = self.db.query(Individual).filter_by(
-                id=related_id, project_id=project_id
-            ).first()
-            if not primary_individual or not related_individual:
-                raise ValueError(
-                    "Both individuals must belong to the same project.")
-
-            existing_any_rel = self.db.query(Relationship).filter(
-                Relationship.project_id == project_id
-            ).filter(
-                or_(
-                    and_(
-                        Relationship.individual_id == individual_id,
-                        Relationship.related_id == related_id
-                    ),
-                    and_(
-                        Relationship.individual_id == related_id,
-                        Relationship.related_id == individual_id
-                    )
-                )
-            ).first()
-            if existing_any_rel:
-                raise ValueError(
-                    "These two individuals already have a relationship. Multiple relationship types are not allowed.")
-
             if rel_type == InitialRelationshipEnum.CHILD:
                 # For child, store as a parent relationship with reversed IDs.
                 parent_id = related_id
@@ -84,26 +88,6 @@ class RelationshipService:
                 if related_id < individual_id:
                     individual_id, related_id = related_id, individual_id
 
-            existing = self.db.query(Relationship).filter(
-                Relationship.project_id == project_id
-            ).filter(
-                or_(
-                    and_(
-                        Relationship.individual_id == individual_id,
-                        Relationship.related_id == related_id,
-                        Relationship.initial_relationship == rel_type
-                    ),
-                    and_(
-                        Relationship.individual_id == related_id,
-                        Relationship.related_id == individual_id,
-                        Relationship.initial_relationship == rel_type
-                    )
-                )
-            ).first()
-
-            if existing:
-                raise ValueError("This relationship already exists.")
-
             # Validate the dates using the utility function.
             ValidationUtils.validate_date_order([
                 (relationship_create.union_date,
@@ -111,28 +95,32 @@ class RelationshipService:
                  "Union date must be before dissolution date.")
             ])
 
-            new_rel = Relationship(
-                project_id=project_id,
-                individual_id=individual_id,
-                related_id=related_id,
-                initial_relationship=rel_type,
-                union_date=relationship_create.union_date,
-                union_place=relationship_create.union_place,
-                dissolution_date=relationship_create.dissolution_date,
-                notes=relationship_create.notes,
-            )
-
-            # Set relationship detail on the appropriate column.
-            if rel_type == InitialRelationshipEnum.PARTNER:
-                new_rel.relationship_detail_horizontal = detail
-                new_rel.relationship_detail_vertical = None
-            else:
-                new_rel.relationship_detail_vertical = detail
-                new_rel.relationship_detail_horizontal = None
+            values = {
+                "project_id": project_id,
+                "individual_id": individual_id,
+                "related_id": related_id,
+                "initial_relationship": rel_type,
+                "union_date": relationship_create.union_date,
+                "union_place": relationship_create.union_place,
+                "dissolution_date": relationship_create.dissolution_date,
+                "notes": relationship_create.notes,
+                # Set relationship detail on the appropriate column.
+                "relationship_detail_horizontal": detail
+                if rel_type == InitialRelationshipEnum.PARTNER else None,
+                "relationship_detail_vertical": detail
+                if rel_type != InitialRelationshipEnum.PARTNER else None,
+            }
+            new_rel = self._insert_relationship(values)
+            if new_rel is None:
+                if self._pair_exists(project_id, individual_id,
+                                     related_id):
+                    raise ValueError(
+                        "These two individuals already have a relationship. Multiple relationship types are not allowed.")
+                raise ValueError(
+                    "Both individuals must belong to the same project.")
 
-            self.db.add(new_rel)
+            self._record_changes(project_id, new_rel)
             self.db.commit()
-            self.db.refresh(new_rel)
             logger.info(
                 f"Created canonical relationship: ID={new_rel.id}")
             return new_rel
@@ -162,12 +150,15 @@ class RelationshipService:
             relationship = self.get_relationship_by_id(
                 relationship_id)
             if not relationship or relationship.project_id != project_id:
-                raise ValueError(
-                    "Relationship not found or unauthorized project access.")
+                logger.warning(
+                    f"Relationship not found for update: ID={relationship_id}")
+                return None
 
             original_ids = (
             relationship.individual_id, relationship.related_id)
             original_type = relationship.initial_relationship
+            original_kin = ChangeFeedService(self.db).kin_changes(
+                original_ids)
 
             updates = relationship_update.model_dump(
                 exclude_unset=True, exclude={"relationship_detail"})
@@ -204,46 +195,45 @@ class RelationshipService:
                  "Union date must be before dissolution date.")
             ])
 
-            existing = self.db.query(Relationship).filter(
-                Relationship.project_id == project_id
-            ).filter(
-                or_(
-                    and_(
-                        Relationship.individual_id == relationship.individual_id,
-                        Relationship.related_id == relationship.related_id,
-                        Relationship.initial_relationship == relationship.initial_relationship
-                    ),
-                    and_(
-                        Relationship.individual_id == relationship.related_id,
-                        Relationship.related_id == relationship.individual_id,
-                        Relationship.initial_relationship == relationship.initial_relationship
-                    )
-                )
-            ).first()
-
-            if existing and existing.id != relationship_id:
-                raise ValueError(
-                    "This relationship already exists with the new parameters.")
-
+            # Checked before the flush; the pair index would otherwise
+            # reject the row with an IntegrityError.
+            with self.db.no_autoflush:
+                if self._pair_exists(project_id,
+                                     relationship.individual_id,
+                                     relationship.related_id,
+                                     exclude_id=relationship_id):
+                    raise ValueError(
+                        "This relationship already exists with the new parameters.")
+
+            self._record_changes(project_id, relationship,
+                                 extra_individuals=original_ids,
+                                 extra_changes=original_kin)
             self.db.commit()
             self.db.refresh(relationship)
             logger.info(
                 f"Updated relationship: ID={relationship_id}")
             return relationship
 
-        except (ValueError, SQLAlchemyError) as e:
+        except SQLAlchemyError as e:
             self.db.rollback()
             logger.error(f"Error updating relationship: {e}")
             return None
+        except ValueError as ve:
+            self.db.rollback()
+            logger.error(f"ValueError in update_relationship: {ve}")
+            raise ve
 
-    def get_relationship_by_id(self, relationship_id: int) -> \
+    def get_relationship_by_id(self, relationship_id: int,
+                               profile: str = SUMMARY) -> \
     Optional[Relationship]:
         """
-        Retrieves a relationship by its unique ID.
+        Retrieves a relationship by its unique ID, loading the individuals
+        according to the named loader profile.
         """
         try:
-            rel = self.db.query(Relationship).filter(
-                Relationship.id == relationship_id).first()
+            rel = self.db.execute(
+                _relationship_by_id(profile),
+                {"relationship_id": relationship_id}).scalars().first()
             if not rel:
                 logger.warning(
                     f"Relationship not found: ID={relationship_id}")
@@ -252,14 +242,17 @@ class RelationshipService:
             logger.error(f"Error retrieving relationship: {e}")
             return None
 
-    def list_relationships(self, project_id: int) -> List[
+    def list_relationships(self, project_id: int,
+                           profile: str = SUMMARY) -> List[
         Relationship]:
         """
-        Retrieves all relationships for a given project.
+        Retrieves all relationships for a given project, loading the
+        individuals according to the named loader profile.
         """
         try:
-            rels = self.db.query(Relationship).filter(
-                Relationship.project_id == project_id).all()
+            rels = self.db.execute(
+                _relationships_by_project(profile),
+                {"project_id": project_id}).scalars().all()
             logger.info(
                 f"Retrieved {len(rels)} relationships for project {project_id}")
             return rels
@@ -271,7 +264,7 @@ class RelationshipService:
     def delete_relationship(self, relationship_id: int,
                             project_id: int) -> bool:
         """
-        Deletes a relationship by its ID.
+        Deletes a relationship by its ID, by setting its tombstone.
         """
         try:
             rel = self.get_relationship_by_id(relationship_id)
@@ -279,7 +272,8 @@ class RelationshipService:
                 raise ValueError(
                     "Relationship not found or unauthorized project access.")
 
-            self.db.delete(rel)
+            self._record_changes(project_id, rel, deleted=True)
+            rel.deleted_at = datetime.now(timezone.utc)
             self.db.commit()
             logger.info(
                 f"Deleted relationship: ID={relationship_id}")
@@ -288,3 +282,77 @@ class RelationshipService:
             self.db.rollback()
             logger.error(f"Error deleting relationship: {e}")
             return False
+
+    def _insert_relationship(self, values: dict) -> Optional[
+        Relationship]:
+        """
+        Inserts a relationship in one statement, provided both live
+        individuals belong to its project and the pair has no live
+        relationship yet; the unique index on the unordered pair makes
+        the check race-free.
+
+        Returns:
+            Relationship: The new row, or None if nothing was inserted.
+        """
+        in_project = select(func.count()).where(
+            Individual.id.in_((values["individual_id"],
+                               values["related_id"])),
+            Individual.project_id == values["project_id"],
+            Individual.deleted_at.is_(None)
+        ).scalar_subquery()
+        columns = list(values)
+        source = select(*(
+            literal(value, Relationship.__table__.c[column].type)
+            for column, value in values.items())).where(in_project == 2)
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            statement = postgresql.insert(Relationship)
+        else:
+            statement = sqlite.insert(Relationship)
+        statement = statement.from_select(
+            columns, source).on_conflict_do_nothing().returning(
+            Relationship)
+        return self.db.scalars(statement).first()
+
+    def _pair_exists(self, project_id: int, individual_id: int,
+                     related_id: int,
+                     exclude_id: Optional[int] = None) -> bool:
+        """
+        Returns True if the two individuals are already related in any
+        direction and of any type, as the pair index enforces.
+        """
+        query = self.db.query(Relationship.id).filter(
+            Relationship.project_id == project_id,
+            func.least(Relationship.individual_id,
+                       Relationship.related_id) ==
+            min(individual_id, related_id),
+            func.greatest(Relationship.individual_id,
+                          Relationship.related_id) ==
+            max(individual_id, related_id)
+        )
+        if exclude_id is not None:
+            query = query.filter(Relationship.id != exclude_id)
+        return query.first() is not None
+
+    def _record_changes(self, project_id: int, relationship: Relationship,
+                        deleted: bool = False,
+                        extra_individuals: Iterable[int] = (),
+                        extra_changes: Iterable[Change] = ()):
+        """
+        Records a relationship change in the project's change feed,
+        together with both individuals and their kin, whose kinship
+        lists display the relationship.
+        """
+        feed = ChangeFeedService(self.db)
+        individual_ids = {relationship.individual_id,
+                          relationship.related_id, *extra_individuals}
+        change = (ChangeEntityEnum.RELATIONSHIP, relationship.id)
+        upserts = [(ChangeEntityEnum.INDIVIDUAL, individual_id)
+                   for individual_id in individual_ids]
+        upserts += feed.kin_changes(individual_ids)
+        upserts += extra_changes
+        if deleted:
+            feed.record_changes(project_id, upserts=upserts,
+                                deletes=[change])
+        else:
+            feed.record_changes(project_id, upserts=upserts + [change])
@@ -0,0 +1,285 @@
+import logging
+from typing import Callable, Dict, IO, Optional, Union
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.enums_model import (
+    CounterScopeEnum,
+    GenderEnum,
+    InitialRelationshipEnum,
+    HorizontalRelationshipTypeEnum,
+    VerticalRelationshipTypeEnum
+)
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.models.project_model import Project
+from app.models.relationship_model import Relationship
+from app.services.counter_service import CounterService
+from app.services.display_service import DisplayNameService
+from app.utils.snapshot_format import SnapshotReader, SnapshotWriter, \
+    SnapshotFormatError
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip while exporting; progress is reported
+# after each batch.
+EXPORT_BATCH_SIZE = 10000
+
+INDIVIDUAL_COLUMNS = ("id", "individual_number", "birth_date",
+                      "birth_place", "death_date", "death_place",
+                      "notes")
+IDENTITY_COLUMNS = ("individual_id", "identity_number", "first_name",
+                    "last_name", "gender", "valid_from", "valid_until",
+                    "is_primary")
+RELATIONSHIP_COLUMNS = ("individual_id", "related_id",
+                        "initial_relationship",
+                        "relationship_detail_horizontal",
+                        "relationship_detail_vertical", "union_date",
+                        "union_place", "dissolution_date", "notes")
+
+_ENUM_COLUMNS = {
+    "gender": GenderEnum,
+    "initial_relationship": InitialRelationshipEnum,
+    "relationship_detail_horizontal": HorizontalRelationshipTypeEnum,
+    "relationship_detail_vertical": VerticalRelationshipTypeEnum,
+}
+
+
+class SnapshotService:
+    """
+    Service layer for exporting projects to compact binary snapshots and
+    restoring them. See app.utils.snapshot_format for the file layout.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def export_project(self, project_id: int, user_id: int,
+                       fileobj: IO[bytes],
+                       progress: Optional[Callable[
+                           [int, int, Optional[str]], None]] = None) \
+            -> Optional[Dict[str, int]]:
+        """
+        Writes a snapshot of a project to `fileobj`. `progress` is
+        called with the number of rows read, the total and, when an
+        export stage starts, its description.
+
+        Returns:
+            dict: Number of exported rows per table, or None if the
+            project is not found or not owned by the user.
+        """
+        try:
+            project = self.db.query(Project).filter(
+                Project.id == project_id, Project.user_id == user_id
+            ).first()
+            if not project:
+                logger.warning(
+                    f"Project not found for snapshot: ID={project_id}, User={user_id}")
+                return None
+
+            statements = {
+                "individuals": select(*(getattr(Individual, c)
+                                        for c in INDIVIDUAL_COLUMNS))
+                .where(Individual.project_id == project_id)
+                .order_by(Individual.id),
+                "identities": select(*(getattr(Identity, c)
+                                       for c in IDENTITY_COLUMNS))
+                .join(Individual, Identity.individual_id == Individual.id)
+                .where(Individual.project_id == project_id)
+                .order_by(Identity.individual_id, Identity.id),
+                "relationships": select(*(getattr(Relationship, c)
+                                          for c in RELATIONSHIP_COLUMNS))
+                .where(Relationship.project_id == project_id)
+                .order_by(Relationship.id),
+            }
+            total = sum(self.db.execute(select(*(
+                select(func.count()).select_from(
+                    statement.order_by(None).subquery()).scalar_subquery()
+                for statement in statements.values()))).one())
+            read = 0
+
+            def report(rows: int, message: Optional[str] = None):
+                nonlocal read
+                read += rows
+                if progress:
+                    progress(read, total, message)
+
+            report(0, "Reading individuals")
+            individuals = self._columns(statements["individuals"],
+                                        INDIVIDUAL_COLUMNS, report)
+            report(0, "Reading identities")
+            identities = self._columns(statements["identities"],
+                                       IDENTITY_COLUMNS, report)
+            report(0, "Reading relationships")
+            relationships = self._columns(statements["relationships"],
+                                          RELATIONSHIP_COLUMNS, report)
+
+            counts = {"individuals": len(individuals["id"]),
+                      "identities": len(identities["individual_id"]),
+                      "relationships": len(
+                          relationships["individual_id"])}
+
+            report(0, "Writing snapshot")
+            writer = SnapshotWriter(fileobj)
+            writer.add_meta({"project_name": project.name,
+                             "counts": counts})
+            writer.add_ints("individuals.id", individuals["id"],
+                            delta=True)
+            writer.add_ints("individuals.individual_number",
+                            individuals["individual_number"], "i")
+            for column in ("birth_date", "death_date"):
+                writer.add_dates(f"individuals.{column}",
+                                 individuals[column])
+            for column in ("birth_place", "death_place", "notes"):
+                writer.add_strings(f"individuals.{column}",
+                                   individuals[column])
+
+            writer.add_ints("identities.individual_id",
+                            identities["individual_id"], delta=True)
+            writer.add_ints("identities.identity_number",
+                            identities["identity_number"], "i")
+            for column in ("first_name", "last_name", "gender"):
+                writer.add_strings(f"identities.{column}",
+                                   identities[column])
+            for column in ("valid_from", "valid_until"):
+                writer.add_dates(f"identities.{column}",
+                                 identities[column])
+            writer.add_bools("identities.is_primary",
+                             identities["is_primary"])
+
+            for column in ("individual_id", "related_id"):
+                writer.add_ints(f"relationships.{column}",
+                                relationships[column])
+            for column in ("initial_relationship",
+                           "relationship_detail_horizontal",
+                           "relationship_detail_vertical",
+                           "union_place", "notes"):
+                writer.add_strings(f"relationships.{column}",
+                                   relationships[column])
+            for column in ("union_date", "dissolution_date"):
+                writer.add_dates(f"relationships.{column}",
+                                 relationships[column])
+            writer.close()
+
+            logger.info(
+                f"Exported snapshot of project {project_id}: {counts}")
+            return counts
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(
+                f"Error exporting snapshot of project {project_id}: {e}")
+            return None
+
+    def restore_project(self, user_id: int,
+                        source: Union[str, bytes],
+                        name: Optional[str] = None) -> Optional[Project]:
+        """
+        Restores a snapshot (file path or bytes) into a new project for
+        the user, using bulk inserts and fresh ids.
+
+        Raises:
+            ValueError: If the snapshot is malformed.
+        """
+        try:
+            with SnapshotReader(source) as reader:
+                individuals = reader.table("individuals",
+                                           INDIVIDUAL_COLUMNS)
+                identities = reader.table("identities",
+                                          IDENTITY_COLUMNS)
+                relationships = reader.table("relationships",
+                                             RELATIONSHIP_COLUMNS)
+                project_name = name or reader.meta.get(
+                    "project_name") or "Restored project"
+        except SnapshotFormatError as e:
+            raise ValueError(str(e))
+
+        try:
+            new_project = Project(
+                user_id=user_id,
+                project_number=CounterService(self.db).next_number(
+                    CounterScopeEnum.PROJECT_NUMBER, user_id),
+                name=project_name[:100]
+            )
+            self.db.add(new_project)
+            self.db.flush()
+
+            id_map = {}
+            individual_rows = self._rows(individuals, exclude={"id"})
+            if individual_rows:
+                for row in individual_rows:
+                    row.update(user_id=user_id,
+                               project_id=new_project.id)
+                new_ids = self.db.execute(
+                    insert(Individual.__table__).returning(
+                        Individual.__table__.c.id,
+                        sort_by_parameter_order=True),
+                    individual_rows).scalars().all()
+                id_map = dict(zip(individuals["id"], new_ids))
+
+            identity_rows = self._rows(identities)
+            for row in identity_rows:
+                row.update(project_id=new_project.id,
+                           individual_id=id_map[row["individual_id"]])
+            if identity_rows:
+                self.db.execute(insert(Identity.__table__),
+                                identity_rows)
+
+            relationship_rows = self._rows(relationships)
+            for row in relationship_rows:
+                row.update(project_id=new_project.id,
+                           individual_id=id_map[row["individual_id"]],
+                           related_id=id_map[row["related_id"]])
+            if relationship_rows:
+                self.db.execute(insert(Relationship.__table__),
+                                relationship_rows)
+
+            DisplayNameService(self.db).refresh_project(new_project.id)
+            self.db.commit()
+            self.db.refresh(new_project)
+            logger.info(
+                f"Restored snapshot into project {new_project.id}")
+            return new_project
+        except KeyError:
+            self.db.rollback()
+            raise ValueError("Snapshot references unknown individuals.")
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(
+                f"Error restoring snapshot for user {user_id}: {e}")
+            return None
+
+    def _columns(self, statement, columns,
+                 on_rows: Callable[[int], None]) -> Dict[str, list]:
+        """
+        Executes a select in batches of EXPORT_BATCH_SIZE rows and
+        transposes the rows into columns, storing enum columns by value.
+        `on_rows` is called with the size of each batch.
+        """
+        result = {column: [] for column in columns}
+        for rows in self.db.execute(statement.execution_options(
+                yield_per=EXPORT_BATCH_SIZE)).partitions():
+            for i, column in enumerate(columns):
+                result[column].extend(row[i] for row in rows)
+            on_rows(len(rows))
+        for column in _ENUM_COLUMNS:
+            if column in result:
+                result[column] = [v.value if v is not None else None
+                                  for v in result[column]]
+        return result
+
+    @staticmethod
+    def _rows(columns: Dict[str, list], exclude=frozenset()) -> list:
+        """
+        Transposes snapshot columns back into insert parameter rows.
+        """
+        names = [n for n in columns if n not in exclude]
+        count = len(next(iter(columns.values()), []))
+        rows = [{n: columns[n][i] for n in names} for i in range(count)]
+        for name, enum_cls in _ENUM_COLUMNS.items():
+            if name in names:
+                for row in rows:
+                    if row[name] is not None:
+                        row[name] = enum_cls(row[name])
+        return rows
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.models.user_model import User
 from app.schemas.user_schema import UserCreate, UserUpdate
+from app.utils.access_cache import forget_user, forget_user_projects
 from app.utils.exceptions import UserAlreadyExistsError
 
 logger = logging.getLogger(__name__)
@@ -98,6 +99,7 @@ class UserService:
 
             self.db.commit()
             self.db.refresh(user)
+            forget_user(user_id)
             logger.info(f"User updated successfully: ID={user_id}")
             return user
         except SQLAlchemyError as e:
@@ -121,6 +123,8 @@ class UserService:
 
             self.db.delete(user)
             self.db.commit()
+            forget_user(user_id)
+            forget_user_projects(user_id)
             logger.info(f"User deleted successfully: ID={user_id}")
             return True
         except SQLAlchemyError as e:
@@ -18,6 +18,11 @@ document.addEventListener('DOMContentLoaded', () => {
     // Left side list
     const leftIndividualsList = document.getElementById('leftIndividualsList');
 
+    // Individuals shown on the left, most recently updated first, and the
+    // project change sequence they reflect
+    let individualsById = new Map();
+    let changeSeq = null;
+
     /**
      * Fetch all individuals and populate the left column
      */
@@ -34,49 +39,100 @@ document.addEventListener('DOMContentLoaded', () => {
             }
 
             const data = await response.json();
-            const individuals = data.individuals || [];
+            individualsById = new Map((data.individuals || []).map(ind => [ind.id, ind]));
+            changeSeq = data.change_seq;
+            renderIndividuals();
+        } catch (error) {
+            console.error('Error fetching individuals:', error);
+            alert('Failed to load individuals.');
+        }
+    }
+
+    /**
+     * Apply the changes made since the last fetch to the left column,
+     * falling back to a full reload when the server asks for it
+     */
+    async function syncIndividuals() {
+        if (changeSeq === null || changeSeq === undefined) {
+            await fetchAllIndividuals();
+            return;
+        }
+
+        try {
+            const response = await fetch(`/api/projects/${projectId}/changes?since=${changeSeq}`, {
+                method: 'GET',
+                credentials: 'include',
+                headers: { 'Content-Type': 'application/json' }
+            });
 
-            // Clear existing list
-            leftIndividualsList.innerHTML = '';
+            if (!response.ok) {
+                throw new Error(`Failed to fetch changes. Status: ${response.status}`);
+            }
 
-            if (individuals.length === 0) {
-                leftIndividualsList.innerHTML = '<li class="list-group-item text-muted">No individuals found.</li>';
+            const data = await response.json();
+            if (data.reset) {
+                await fetchAllIndividuals();
                 return;
             }
 
-            individuals.forEach(ind => {
-                const li = document.createElement('li');
-                li.className = 'list-group-item d-flex align-items-center';
-                li.setAttribute('draggable', 'true');
-                li.style.cursor = 'pointer';
-                li.dataset.individualId = ind.id;
-
-                // Display name
-                let displayName = 'Unknown';
-                if (ind.primary_identity && ind.primary_identity.first_name) {
-                    displayName = `${ind.primary_identity.first_name} ${ind.primary_identity.last_name || ''}`.trim();
-                }
-                li.textContent = displayName;
-
-                // Click event to select individual
-                li.addEventListener('click', () => {
-                    window.location.href = `/individuals/?project_id=${projectId}&individual_id=${ind.id}`;
-                });
-
-                // Drag event to create relationship
-                li.addEventListener('dragstart', (e) => {
-                    e.dataTransfer.setData('text/plain', ind.id);
-                    e.dataTransfer.effectAllowed = 'move';
-                });
-
-                leftIndividualsList.appendChild(li);
-            });
+            data.deleted.individuals.forEach(id => individualsById.delete(id));
+            if (data.individuals.length > 0) {
+                // Updated individuals move to the top, like in the full list
+                data.individuals.forEach(ind => individualsById.delete(ind.id));
+                individualsById = new Map([
+                    ...data.individuals.map(ind => [ind.id, ind]),
+                    ...individualsById
+                ]);
+            }
+            changeSeq = data.change_seq;
+            renderIndividuals();
         } catch (error) {
-            console.error('Error fetching individuals:', error);
-            alert('Failed to load individuals.');
+            console.error('Error syncing individuals:', error);
+            await fetchAllIndividuals();
         }
     }
 
+    /**
+     * Render the individuals in the left column
+     */
+    function renderIndividuals() {
+        // Clear existing list
+        leftIndividualsList.innerHTML = '';
+
+        if (individualsById.size === 0) {
+            leftIndividualsList.innerHTML = '<li class="list-group-item text-muted">No individuals found.</li>';
+            return;
+        }
+
+        individualsById.forEach(ind => {
+            const li = document.createElement('li');
+            li.className = 'list-group-item d-flex align-items-center';
+            li.setAttribute('draggable', 'true');
+            li.style.cursor = 'pointer';
+            li.dataset.individualId = ind.id;
+
+            // Display name
+            let displayName = 'Unknown';
+            if (ind.primary_identity && ind.primary_identity.first_name) {
+                displayName = `${ind.primary_identity.first_name} ${ind.primary_identity.last_name || ''}`.trim();
+            }
+            li.textContent = displayName;
+
+            // Click event to select individual
+            li.addEventListener('click', () => {
+                window.location.href = `/individuals/?project_id=${projectId}&individual_id=${ind.id}`;
+            });
+
+            // Drag event to create relationship
+            li.addEventListener('dragstart', (e) => {
+                e.dataTransfer.setData('text/plain', ind.id);
+                e.dataTransfer.effectAllowed = 'move';
+            });
+
+            leftIndividualsList.appendChild(li);
+        });
+    }
+
     /**
      * Fetch selected individual's relationships and populate the right column
      */
@@ -319,7 +375,7 @@ document.addEventListener('DOMContentLoaded', () => {
             alert('Relationship created successfully!');
 
             // Re-fetch and re-render lists
-            await fetchAllIndividuals();
+            await syncIndividuals();
             await fetchAndRenderRelationships();
 
         } catch (error) {
@@ -363,7 +419,7 @@ document.addEventListener('DOMContentLoaded', () => {
             }
 
             alert('Relationship updated successfully!');
-            await fetchAllIndividuals();
+            await syncIndividuals();
             await fetchAndRenderRelationships();
 
         } catch (error) {
@@ -392,7 +448,7 @@ document.addEventListener('DOMContentLoaded', () => {
             alert('Relationship deleted successfully.');
 
             // Re-fetch and re-render lists
-            await fetchAllIndividuals();
+            await syncIndividuals();
             await fetchAndRenderRelationships();
 
         } catch (error) {
@@ -420,7 +476,7 @@ document.addEventListener('DOMContentLoaded', () => {
             }
 
             alert('Relationship updated successfully!');
-            await fetchAllIndividuals();
+            await syncIndividuals();
             await fetchAndRenderRelationships();
 
         } catch (error) {
@@ -0,0 +1,72 @@
+from typing import Callable, Optional
+
+from app.cache import CLAIMS, INDIVIDUAL_DETAILS, PROJECT_ACCESS, USERS, \
+    get_cache
+from app.schemas.user_schema import UserSnapshot
+
+
+def is_cached_project_owner(user_id: int, project_id: int) -> bool:
+    """
+    Returns True if the user was recently verified to own the project.
+    """
+    return get_cache(PROJECT_ACCESS).get((user_id, project_id)) is True
+
+
+def remember_project_owner(user_id: int, project_id: int):
+    """
+    Caches a successful ownership check. Only positive results are
+    cached, so newly created projects are visible immediately.
+    """
+    get_cache(PROJECT_ACCESS).set(
+        (user_id, project_id), True,
+        tags=(f"project:{project_id}", f"user:{user_id}"))
+
+
+def forget_project(project_id: int):
+    """
+    Drops cached ownership and payloads of a project, e.g. after it was
+    deleted or moved to another user.
+    """
+    get_cache(PROJECT_ACCESS).invalidate_tag(f"project:{project_id}")
+    get_cache(INDIVIDUAL_DETAILS).invalidate_tag(f"project:{project_id}")
+
+
+def forget_user_projects(user_id: int):
+    """
+    Drops cached ownership of all projects of a user.
+    """
+    get_cache(PROJECT_ACCESS).invalidate_tag(f"user:{user_id}")
+
+
+def get_cached_user(user_id: int) -> Optional[UserSnapshot]:
+    """
+    Returns the cached snapshot of a user, if any.
+    """
+    return get_cache(USERS).get(user_id)
+
+
+def remember_user(snapshot: UserSnapshot):
+    """
+    Caches a user snapshot.
+    """
+    get_cache(USERS).set(snapshot.id, snapshot)
+
+
+def forget_user(user_id: int):
+    """
+    Drops the cached snapshot and JWT claims of a user, e.g. after it
+    was updated or deleted.
+    """
+    get_cache(USERS).delete(user_id)
+    get_cache(CLAIMS).delete(user_id)
+
+
+def get_user_claims(user_id: int,
+                    loader: Callable[[int], dict]) -> dict:
+    """
+    Returns the additional JWT claims of a user, loading them with
+    `loader` on a miss. Claims loaded while the user was invalidated
+    are not cached.
+    """
+    return get_cache(CLAIMS).get_or_set(user_id,
+                                        lambda: loader(user_id))
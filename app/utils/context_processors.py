@@ -1,31 +1,67 @@
-from flask import current_app
+from flask import current_app, g
 from flask_jwt_extended import verify_jwt_in_request, \
     get_jwt_identity
 from jwt.exceptions import ExpiredSignatureError, DecodeError
 
-from app.extensions import SessionLocal
+from app.extensions import get_db_session
+from app.schemas.user_schema import UserSnapshot
 from app.services.user_service import UserService
+from app.utils.access_cache import get_cached_user, remember_user
 
 
 def inject_current_user():
     """
     Injects the current user into the template context if a valid JWT exists.
 
+    The user is memoized on `g` for the rest of the request and served
+    from a short-lived snapshot cache across requests, so rendering
+    templates and partials does not query the database each time.
+
     Returns:
-        dict: Dictionary containing the current user or None.
+        dict: Dictionary containing the current user snapshot or None.
+    """
+    user_id = _current_user_id()
+    memo = g.get("current_user_memo")
+    if memo is None or memo[0] != user_id:
+        memo = g.current_user_memo = (user_id, _load_user(user_id))
+    return dict(current_user=memo[1])
+
+
+def _current_user_id():
+    """
+    Returns the user ID from the request's JWT, or None if there is no
+    valid token.
     """
-    user = None
     try:
         verify_jwt_in_request(optional=True)
         user_id = get_jwt_identity()
-        if user_id:
-            with SessionLocal() as session:
-                service = UserService(db=session)
-                user = service.get_user_by_id(user_id=int(user_id))
+        return int(user_id) if user_id else None
     except (ExpiredSignatureError, DecodeError):
         pass
     except Exception as e:
         current_app.logger.warning(
             f"Failed to inject current user: {e}")
-    finally:
-        return dict(current_user=user)
+    return None
+
+
+def _load_user(user_id):
+    """
+    Returns a snapshot of the user, preferring the snapshot cache.
+    """
+    if user_id is None:
+        return None
+    snapshot = get_cached_user(user_id)
+    if snapshot is not None:
+        return snapshot
+    try:
+        user = UserService(db=get_db_session()).get_user_by_id(
+            user_id=user_id)
+    except Exception as e:
+        current_app.logger.warning(
+            f"Failed to inject current user: {e}")
+        return None
+    if user is None:
+        return None
+    snapshot = UserSnapshot.model_validate(user)
+    remember_user(snapshot)
+    return snapshot
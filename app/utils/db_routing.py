@@ -0,0 +1,171 @@
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Sequence
+
+from flask import current_app, request
+from sqlalchemy import Select, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_PIN_COOKIE = "read_primary"
+
+_read_engine: ContextVar[Optional[Engine]] = ContextVar(
+    "read_engine", default=None)
+_wrote: ContextVar[bool] = ContextVar("wrote", default=False)
+
+
+class ReplicaPool:
+    """
+    Round-robin selection over read replicas.
+
+    A replica that fails with a disconnect or cannot be reached is
+    skipped until `retry_interval` has passed and a `SELECT 1` probe
+    succeeds again. When no replica is healthy, reads fall back to the
+    primary.
+    """
+
+    def __init__(self, engines: Sequence[Engine],
+                 retry_interval: float = 30.0):
+        self.engines = list(engines)
+        self._retry_interval = retry_interval
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._down = {}
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def __len__(self):
+        return len(self.engines)
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Returns the next healthy replica, or None to use the primary.
+        """
+        for _ in range(len(self.engines)):
+            engine = self.engines[next(self._counter) % len(self.engines)]
+            if self._is_healthy(engine):
+                return engine
+        return None
+
+    def mark_down(self, engine: Engine):
+        """
+        Takes a replica out of rotation until its next health check.
+        """
+        with self._lock:
+            self._down[engine] = time.monotonic() + self._retry_interval
+        logger.warning(f"Read replica {engine.url!r} marked down.")
+
+    def _is_healthy(self, engine: Engine) -> bool:
+        with self._lock:
+            retry_at = self._down.get(engine)
+            if retry_at is None:
+                return True
+            if time.monotonic() < retry_at:
+                return False
+            # Only one caller probes; the others keep skipping it.
+            self._down[engine] = time.monotonic() + self._retry_interval
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except SQLAlchemyError as e:
+            logger.warning(f"Read replica {engine.url!r} still down: {e}")
+            return False
+        with self._lock:
+            self._down.pop(engine, None)
+        logger.info(f"Read replica {engine.url!r} is back in rotation.")
+        return True
+
+    def _on_error(self, context):
+        if context.is_disconnect or context.connection is None:
+            self.mark_down(context.engine)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to the replica chosen for the
+    current request or job, and everything else to the primary.
+
+    Once a session has written, its reads stay on the primary until it
+    is closed, so a request always sees its own changes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or \
+                clause is not None and not isinstance(clause, Select):
+            self.info["wrote"] = True
+            _wrote.set(True)
+        replica = _read_engine.get()
+        if replica is not None and not self.info.get("wrote") and \
+                isinstance(clause, Select) and \
+                clause._for_update_arg is None:
+            return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+    def close(self):
+        self.info.pop("wrote", None)
+        super().close()
+
+
+def read_from_primary(session: Session):
+    """
+    Routes the remaining reads of a session to the primary, as if it
+    had written, e.g. before reading rows that are written back.
+    """
+    session.info["wrote"] = True
+
+
+@contextmanager
+def use_replica(replicas: Optional[ReplicaPool]):
+    """
+    Routes the reads of sessions used in this context to a replica,
+    e.g. for read-only background jobs.
+    """
+    token = _read_engine.set(replicas.choose() if replicas else None)
+    try:
+        yield
+    finally:
+        _read_engine.reset(token)
+
+
+def init_read_routing(app, replicas: ReplicaPool):
+    """
+    Serves reads of safe requests from a replica.
+
+    After a request that wrote to the primary, the client gets a
+    short-lived cookie that pins its reads to the primary for
+    READ_YOUR_WRITES_SECONDS, so it does not read data the replica has
+    not replayed yet.
+    """
+    app.extensions["replicas"] = replicas
+
+    @app.before_request
+    def _route_reads():
+        _wrote.set(False)
+        pool = current_app.extensions["replicas"]
+        if pool and request.method in SAFE_METHODS and \
+                PRIMARY_PIN_COOKIE not in request.cookies:
+            _read_engine.set(pool.choose())
+
+    @app.after_request
+    def _pin_to_primary(response):
+        window = int(current_app.config.get("READ_YOUR_WRITES_SECONDS", 0))
+        if current_app.extensions["replicas"] and window > 0 and \
+                _wrote.get() and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE, "1", max_age=window, httponly=True,
+                samesite="Lax",
+                secure=current_app.config.get("JWT_COOKIE_SECURE", False))
+        return response
+
+    @app.teardown_request
+    def _reset_read_engine(_exception=None):
+        _read_engine.set(None)
+        _wrote.set(False)
@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Optional
+
+from app.cache import INDIVIDUAL_DETAILS, get_cache
+
+
+def get_individual_detail(project_id: int, individual_id: int,
+                          version: int) -> Optional[dict]:
+    """
+    Returns the cached detail payload of an individual if it was built
+    at the given change sequence, today, since the payload holds an age.
+    """
+    entry = get_cache(INDIVIDUAL_DETAILS).get((project_id, individual_id))
+    if entry is None or entry[0] != version or \
+            entry[1] != date.today().isoformat():
+        return None
+    return entry[2]
+
+
+def remember_individual_detail(project_id: int, individual_id: int,
+                               version: int, data: dict):
+    """
+    Caches the detail payload of an individual built at a change
+    sequence, replacing any older version. The payload must not be
+    mutated afterwards.
+    """
+    get_cache(INDIVIDUAL_DETAILS).set(
+        (project_id, individual_id),
+        (version, date.today().isoformat(), data),
+        tags=(f"project:{project_id}",))
+
+
+def clear_detail_cache():
+    """
+    Drops all cached detail payloads.
+    """
+    get_cache(INDIVIDUAL_DETAILS).clear()
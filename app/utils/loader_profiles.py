@@ -0,0 +1,85 @@
+from typing import Tuple
+
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.models.individual_model import Individual
+from app.models.relationship_model import Relationship
+
+SUMMARY = "summary"
+DETAIL = "detail"
+GRAPH = "graph"
+
+_INDIVIDUAL_SUMMARY = (
+    selectinload(Individual.identities),
+    selectinload(Individual.primary_identity),
+)
+
+# Relationship endpoints only need the id and name of each individual.
+_RELATIONSHIP_ENDPOINTS = (
+    selectinload(Relationship.individual).load_only(
+        Individual.id, Individual.project_id).selectinload(
+        Individual.primary_identity),
+    selectinload(Relationship.related).load_only(
+        Individual.id, Individual.project_id).selectinload(
+        Individual.primary_identity),
+)
+
+PROFILES = {
+    Individual: {
+        # Columns, identity ids and the primary identity, as shown in
+        # list responses.
+        SUMMARY: _INDIVIDUAL_SUMMARY,
+        # Adds the individual's own relationship rows.
+        DETAIL: _INDIVIDUAL_SUMMARY + (
+            selectinload(Individual.relationships_as_individual),
+            selectinload(Individual.relationships_as_related),
+        ),
+        # Adds the named individuals on the other side of each
+        # relationship and their children, as needed by the kinship
+        # properties of `Individual`.
+        GRAPH: _INDIVIDUAL_SUMMARY + (
+            selectinload(Individual.relationships_as_individual)
+            .selectinload(Relationship.related)
+            .selectinload(Individual.primary_identity),
+            selectinload(Individual.relationships_as_related)
+            .selectinload(Relationship.individual)
+            .options(
+                selectinload(Individual.primary_identity),
+                selectinload(Individual.relationships_as_individual)
+                .selectinload(Relationship.related)
+                .selectinload(Individual.primary_identity)),
+        ),
+    },
+    Relationship: {
+        # Only the relationship row; names come from individual_display.
+        SUMMARY: (),
+        DETAIL: _RELATIONSHIP_ENDPOINTS,
+        # Both individuals in full, e.g. for drawing a tree.
+        GRAPH: (
+            selectinload(Relationship.individual).selectinload(
+                Individual.primary_identity),
+            selectinload(Relationship.related).selectinload(
+                Individual.primary_identity),
+        ),
+    },
+}
+
+
+def loader_options(model, profile: str) -> Tuple[LoaderOption, ...]:
+    """
+    Returns the loader options of a named profile for a model.
+
+    Relationships are lazy by default; endpoints pick the profile that
+    matches what they serialise, so no query loads more rows than the
+    response needs.
+
+    Raises:
+        ValueError: If the model has no such profile.
+    """
+    try:
+        return PROFILES[model][profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown loader profile '{profile}' for "
+            f"{getattr(model, '__name__', model)}.")
@@ -0,0 +1,56 @@
+import os
+import stat
+
+
+def ensure_private_dir(path: str) -> str:
+    """
+    Creates a directory that only the process user can access, or
+    checks that an existing one belongs to that user.
+
+    Args:
+        path (str): The directory to create or check.
+
+    Returns:
+        str: The directory path.
+
+    Raises:
+        PermissionError: If the path is not a directory owned by the
+            process user, e.g. one created first by another local user.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.geteuid():
+        raise PermissionError(
+            f"{path} must be a directory owned by the application user.")
+    if stat.S_IMODE(info.st_mode) & 0o077:
+        os.chmod(path, 0o700)
+    return path
+
+
+def create_private_file(path: str, truncate: bool = False) -> int:
+    """
+    Opens a file for writing with mode 0600, creating it if missing.
+    Symbolic links are not followed.
+
+    Args:
+        path (str): The file to open.
+        truncate (bool): Whether to empty an existing file.
+
+    Returns:
+        int: The open file descriptor.
+
+    Raises:
+        PermissionError: If the file is owned by another user.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        if os.fstat(fd).st_uid != os.geteuid():
+            raise PermissionError(
+                f"{path} must be owned by the application user.")
+        os.fchmod(fd, 0o600)
+        if truncate:
+            os.ftruncate(fd, 0)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
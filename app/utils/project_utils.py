@@ -1,6 +1,8 @@
 from flask import abort
 
 from app.services.project_service import ProjectService
+from app.utils.access_cache import is_cached_project_owner, \
+    remember_project_owner
 
 
 def get_valid_project(user_id: int, project_id: int,
@@ -11,7 +13,8 @@ def get_valid_project(user_id: int, project_id: int,
     Args:
         user_id (int): The ID of the current user.
         project_id (int): The ID of the project to retrieve.
-        db_session (Session, optional): The database session to use. Defaults to None.
+        db_session (Session, optional): The database session to use.
+            Defaults to the request-scoped session.
 
     Returns:
         Project: The retrieved project object.
@@ -20,12 +23,29 @@ def get_valid_project(user_id: int, project_id: int,
         HTTPException: If the project is not found or not owned by the user.
     """
     if db_session is None:
-        from app.extensions import SessionLocal
-        db_session = SessionLocal()
+        from app.extensions import get_db_session
+        db_session = get_db_session()
     service_project = ProjectService(db=db_session)
     project = service_project.get_project_by_id(
         project_id=project_id)
     if not project or project.user_id != user_id:
         abort(404,
               description="Project not found or not owned by the user.")
+    remember_project_owner(user_id, project_id)
     return project
+
+
+def ensure_project_access(user_id: int, project_id: int):
+    """
+    Verifies that the user owns the project, skipping the database when
+    ownership was confirmed recently.
+
+    Returns:
+        Project: The project if it had to be loaded, otherwise None.
+
+    Raises:
+        HTTPException: If the project is not found or not owned by the user.
+    """
+    if not is_cached_project_owner(user_id, project_id):
+        return get_valid_project(user_id=user_id, project_id=project_id)
+    return None
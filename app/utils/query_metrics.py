@@ -0,0 +1,201 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+_captures: ContextVar[tuple] = ContextVar("query_captures", default=())
+
+_PARAM_RE = re.compile(r"%\([^)]*\)s|%s|\?")
+_PARAM_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalises a SQL statement so executions that only differ in their
+    parameters, including the length of IN lists, share one shape.
+    """
+    shape = _PARAM_RE.sub("?", statement)
+    shape = _PARAM_LIST_RE.sub("?", shape)
+    return _SPACE_RE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """
+    Statements executed during one request or `capture_queries` block.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.rows = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, duration: float, rows: int):
+        self.count += 1
+        self.rows += rows
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    @property
+    def max_repeats(self) -> int:
+        """
+        Returns how often the most frequent statement shape ran.
+        """
+        return max(self.shapes.values(), default=0)
+
+    def repeated(self, threshold: int) -> list:
+        """
+        Returns (shape, count) pairs that ran at least `threshold` times.
+        """
+        return [(shape, count) for shape, count
+                in self.shapes.most_common() if count >= threshold]
+
+    def report(self) -> str:
+        lines = [f"{self.count} queries, {self.rows} rows, "
+                 f"{self.duration * 1000:.1f} ms"]
+        lines += [f"  {count}x {shape[:200]}"
+                  for shape, count in self.shapes.most_common(10)]
+        return "\n".join(lines)
+
+
+class QueryMetrics:
+    """
+    Per-endpoint query totals of this worker process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def add(self, endpoint: str, stats: QueryStats, repeated: list):
+        with self._lock:
+            entry = self._endpoints.setdefault(endpoint, {
+                "requests": 0, "queries": 0, "rows": 0,
+                "db_time_ms": 0.0, "max_queries": 0,
+                "repeated_requests": 0, "repeated_shapes": {}})
+            entry["requests"] += 1
+            entry["queries"] += stats.count
+            entry["rows"] += stats.rows
+            entry["db_time_ms"] += stats.duration * 1000
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            if repeated:
+                entry["repeated_requests"] += 1
+                for shape, count in repeated:
+                    shapes = entry["repeated_shapes"]
+                    shapes[shape] = max(shapes.get(shape, 0), count)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {endpoint: {
+                **entry,
+                "db_time_ms": round(entry["db_time_ms"], 3),
+                "avg_queries": round(entry["queries"] /
+                                     entry["requests"], 2),
+                "repeated_shapes": dict(entry["repeated_shapes"])}
+                for endpoint, entry in self._endpoints.items()}
+
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+METRICS = QueryMetrics()
+
+
+@contextmanager
+def capture_queries():
+    """
+    Collects the statements executed in this context, e.g. to check a
+    query budget in a test.
+
+    Yields:
+        QueryStats: Filled in while the block runs.
+    """
+    stats = QueryStats()
+    token = _captures.set(_captures.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _captures.reset(token)
+
+
+def query_metrics() -> dict:
+    """
+    Returns the per-endpoint query totals of this worker process.
+    """
+    return METRICS.snapshot()
+
+
+def init_query_metrics(app, *engines):
+    """
+    Records the statements of every request: count, rows, database
+    time and how often each statement shape repeats.
+
+    Shapes that repeat at least QUERY_REPEAT_THRESHOLD times in one
+    request are logged as likely N+1 queries. With QUERY_METRICS_HEADERS
+    the numbers are returned as X-Query-* and Server-Timing headers;
+    otherwise they are only added to the per-endpoint totals.
+    """
+    if not app.config.get("QUERY_METRICS_ENABLED", True):
+        return
+    threshold = app.config.get("QUERY_REPEAT_THRESHOLD", 5)
+    headers = app.config.get("QUERY_METRICS_HEADERS", False)
+
+    # The start time lives on the execution context, so a statement
+    # that fails leaves nothing behind on the pooled connection.
+    def _before_cursor_execute(conn, cursor, statement, parameters,
+                               context, executemany):
+        context._query_metrics_start = time.perf_counter()
+
+    def _after_cursor_execute(conn, cursor, statement, parameters,
+                              context, executemany):
+        duration = time.perf_counter() - context._query_metrics_start
+        collectors = list(_captures.get())
+        if has_request_context() and "query_stats" in g:
+            collectors.append(g.query_stats)
+        if not collectors:
+            return
+        rows = cursor.rowcount if cursor.description is not None \
+            and cursor.rowcount > 0 else 0
+        for stats in collectors:
+            stats.record(statement, duration, rows)
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute",
+                     _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute",
+                     _after_cursor_execute)
+
+    @app.before_request
+    def _start_query_stats():
+        g.query_stats = QueryStats()
+
+    @app.after_request
+    def _finish_query_stats(response):
+        stats = g.pop("query_stats", None)
+        if stats is None:
+            return response
+        endpoint = request.endpoint or "unknown"
+        repeated = stats.repeated(threshold)
+        for shape, count in repeated:
+            logger.warning(f"Possible N+1 in {endpoint}: statement ran "
+                           f"{count} times: {shape[:200]}")
+        METRICS.add(endpoint, stats, repeated)
+        if headers:
+            response.headers["X-Query-Count"] = str(stats.count)
+            response.headers["X-Query-Rows"] = str(stats.rows)
+            response.headers["X-Query-Time"] = \
+                f"{stats.duration * 1000:.2f}"
+            response.headers["X-Query-Repeats"] = str(stats.max_repeats)
+            response.headers["Server-Timing"] = \
+                f"db;dur={stats.duration * 1000:.2f}"
+        return response
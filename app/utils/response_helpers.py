@@ -1,4 +1,4 @@
-from flask import jsonify
+from flask import Response, current_app, jsonify
 
 
 def success_response(message, data=None, status_code=200):
@@ -19,6 +19,31 @@ def success_response(message, data=None, status_code=200):
     return jsonify(response), status_code
 
 
+def fragment_response(message, data, key, fragments, status_code=200):
+    """
+    Build a successful JSON response around pre-serialised fragments.
+
+    The envelope is encoded as usual and the fragments are spliced in
+    as a JSON array under `key`, without decoding them again.
+
+    Args:
+        message (str): Success message.
+        data (dict): Additional data to include in the response.
+        key (str): Name of the array holding the fragments.
+        fragments (list[str]): JSON-encoded array items.
+        status_code (int, optional): HTTP status code.
+
+    Returns:
+        tuple: Flask Response object and status code.
+    """
+    envelope = {"message": message}
+    envelope.update(data)
+    body = current_app.json.dumps(envelope).rstrip()[:-1].rstrip()
+    body += f',{current_app.json.dumps(key)}:[{",".join(fragments)}]}}'
+    return Response(body + "\n", mimetype=current_app.json.mimetype), \
+        status_code
+
+
 def error_response(error, status_code=400):
     """
     Standardize error JSON responses.
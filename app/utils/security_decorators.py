@@ -5,7 +5,7 @@ from flask_jwt_extended import get_jwt, jwt_required
 from werkzeug.exceptions import BadRequest
 
 from app.utils.auth_utils import get_current_user_id
-from app.utils.project_utils import get_valid_project
+from app.utils.project_utils import ensure_project_access
 
 
 def admin_required(fn):
@@ -37,6 +37,8 @@ def require_project_access(fn):
       2) Retrieves the current user ID.
       3) Ensures the user has access to the project specified by 'project_id'.
       4) Stores user_id and project_id in Flask's 'g' object.
+    A project loaded by the check is kept in 'g.project', so later
+    lookups in the request session reuse it instead of querying again.
     """
 
     @wraps(fn)
@@ -46,6 +48,7 @@ def require_project_access(fn):
         g.project_id = request.args.get('project_id', type=int)
         if not g.project_id:
             raise BadRequest("Project ID is required.")
-        get_valid_project(user_id=g.user_id, project_id=g.project_id)
+        g.project = ensure_project_access(user_id=g.user_id,
+                                          project_id=g.project_id)
         return fn(*args, **kwargs)
     return wrapper
@@ -0,0 +1,51 @@
+from app.schemas.identity_schema import IdentityIdOut
+from app.schemas.individual_schema import IndividualOut
+from app.services.display_service import DisplayNameService
+
+
+def individual_dict(individual) -> dict:
+    """
+    Serialises an individual like the list endpoint, with its
+    identities as ids.
+    """
+    individual_out = IndividualOut.model_validate(individual,
+                                                  from_attributes=True)
+    individual_out.identities = [IdentityIdOut(id=i.id)
+                                 for i in individual.identities]
+    return individual_out.model_dump()
+
+
+def relationship_names(session, rels) -> dict:
+    """
+    Looks up the display names of all individuals in the given
+    relationships with one query.
+    """
+    return DisplayNameService(db=session).get_names(
+        {rel.individual_id for rel in rels} |
+        {rel.related_id for rel in rels})
+
+
+def short_relationship_dict(rel, names: dict) -> dict:
+    """
+    Returns a compact dictionary representation of a relationship.
+    Individual names are taken from `names`, as returned by
+    `relationship_names`.
+    """
+    return {
+        "id": rel.id,
+        "initial_relationship": rel.initial_relationship,
+        "relationship_detail": (
+                    rel.relationship_detail_horizontal or rel.relationship_detail_vertical),
+        "notes": rel.notes,
+        "union_date": rel.union_date,
+        "union_place": rel.union_place,
+        "dissolution_date": rel.dissolution_date,
+        "created_at": rel.created_at,
+        "updated_at": rel.updated_at,
+        "individual": names.get(rel.individual_id, {
+            "id": rel.individual_id, "first_name": None,
+            "last_name": None}),
+        "related": names.get(rel.related_id, {
+            "id": rel.related_id, "first_name": None,
+            "last_name": None})
+    }
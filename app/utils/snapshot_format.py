@@ -0,0 +1,335 @@
+import json
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+MAGIC = b"GAISNAP1"
+FORMAT_VERSION = 1
+_FOOTER = struct.Struct("<QI8s")
+
+NULL_DATE = 0
+NULL_STRING = -1
+
+_INT_TYPECODES = frozenset("bBhHiIlLqQ")
+_ENTRY_INTS = ("count", "offset", "length")
+
+
+class SnapshotFormatError(ValueError):
+    """
+    Exception raised when a snapshot file is malformed or unsupported.
+    """
+
+
+class SnapshotWriter:
+    """
+    Writes a snapshot as a sequence of independently zlib-compressed
+    column blocks followed by a block index and a fixed-size footer.
+
+    Integer columns are stored as little-endian arrays (optionally
+    delta-encoded), dates as day ordinals and strings as indexes into a
+    single shared string dictionary.
+    """
+
+    def __init__(self, fileobj, compression_level: int = 6):
+        self._file = fileobj
+        self._level = compression_level
+        self._index: List[dict] = []
+        self._strings: Dict[str, int] = {}
+        self._offset = len(MAGIC)
+        self._file.write(MAGIC)
+
+    def add_meta(self, meta: dict):
+        """
+        Stores a small JSON metadata block, tagged with the format version.
+        """
+        meta = dict(meta, format=FORMAT_VERSION)
+        self._write_block("meta", "json", None, 1,
+                          json.dumps(meta).encode("utf-8"))
+
+    def add_ints(self, name: str, values: Iterable[int],
+                 typecode: str = "q", delta: bool = False):
+        """
+        Stores an integer column; `delta` suits sorted id columns.
+        """
+        data = array(typecode, values)
+        if delta and data:
+            previous = 0
+            for i, value in enumerate(data):
+                data[i], previous = value - previous, value
+        self._write_array(name, "delta" if delta else "ints", data)
+
+    def add_bools(self, name: str, values: Iterable[bool]):
+        """
+        Stores a boolean column as one byte per value.
+        """
+        self._write_array(name, "bools",
+                          array("b", (1 if v else 0 for v in values)))
+
+    def add_dates(self, name: str, values: Iterable[Optional[date]]):
+        """
+        Stores a date column as day ordinals, 0 meaning NULL.
+        """
+        self._write_array(name, "dates", array(
+            "i", (v.toordinal() if v else NULL_DATE for v in values)))
+
+    def add_strings(self, name: str, values: Iterable[Optional[str]]):
+        """
+        Stores a string column as indexes into the string dictionary.
+        """
+        strings = self._strings
+        indexes = array("i")
+        for value in values:
+            if value is None:
+                indexes.append(NULL_STRING)
+                continue
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            indexes.append(index)
+        self._write_array(name, "strings", indexes)
+
+    def close(self):
+        """
+        Writes the string dictionary, the block index and the footer.
+        """
+        encoded = [s.encode("utf-8") for s in self._strings]
+        offsets = array("q", [0])
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+        self._write_array("__strings__.offsets", "ints", offsets)
+        self._write_block("__strings__.data", "bytes", None,
+                          len(encoded), b"".join(encoded))
+
+        index = zlib.compress(json.dumps(self._index).encode("utf-8"),
+                              self._level)
+        self._file.write(index)
+        self._file.write(_FOOTER.pack(self._offset, len(index), MAGIC))
+
+    def _write_array(self, name: str, kind: str, data: array):
+        if sys.byteorder != "little":
+            data.byteswap()
+        self._write_block(name, kind, data.typecode, len(data),
+                          data.tobytes())
+
+    def _write_block(self, name: str, kind: str,
+                     typecode: Optional[str], count: int, raw: bytes):
+        payload = zlib.compress(raw, self._level)
+        self._file.write(payload)
+        self._index.append({
+            "name": name, "kind": kind, "typecode": typecode,
+            "count": count, "offset": self._offset,
+            "length": len(payload)
+        })
+        self._offset += len(payload)
+
+
+class SnapshotReader:
+    """
+    Reads a snapshot written by SnapshotWriter.
+
+    Accepts a file path (memory-mapped) or any bytes-like buffer. Blocks
+    are only decompressed when a column is requested, so analytics can
+    load just the columns they need.
+    """
+
+    def __init__(self, source: Union[str, bytes, bytearray, memoryview]):
+        self._mmap = None
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                try:
+                    self._mmap = mmap.mmap(f.fileno(), 0,
+                                           access=mmap.ACCESS_READ)
+                except ValueError:
+                    # An empty file cannot be mapped.
+                    raise SnapshotFormatError("Not a project snapshot.")
+            self._buffer = memoryview(self._mmap)
+        else:
+            self._buffer = memoryview(source)
+        try:
+            self._load()
+        except BaseException:
+            self.close()
+            raise
+
+    def _load(self):
+        """
+        Checks the footer and reads the block index and metadata.
+        """
+        if len(self._buffer) < len(MAGIC) + _FOOTER.size or \
+                bytes(self._buffer[:len(MAGIC)]) != MAGIC:
+            raise SnapshotFormatError("Not a project snapshot.")
+        index_offset, index_length, magic = _FOOTER.unpack(
+            self._buffer[-_FOOTER.size:])
+        if magic != MAGIC:
+            raise SnapshotFormatError("Truncated project snapshot.")
+        try:
+            entries = json.loads(zlib.decompress(
+                self._buffer[index_offset:index_offset + index_length]))
+        except (zlib.error, ValueError) as e:
+            raise SnapshotFormatError(f"Corrupt snapshot index: {e}")
+        self._index = _parse_index(entries)
+        self._strings: Optional[List[str]] = None
+
+        try:
+            self.meta = json.loads(self._raw("meta")) \
+                if "meta" in self._index else {}
+        except ValueError as e:
+            raise SnapshotFormatError(f"Corrupt snapshot metadata: {e}")
+        if not isinstance(self.meta, dict) or \
+                self.meta.get("format") != FORMAT_VERSION:
+            raise SnapshotFormatError(
+                "Unsupported snapshot format version.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Releases the memory map, if any.
+        """
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def names(self) -> List[str]:
+        """
+        Returns the names of all column blocks.
+        """
+        return [n for n in self._index if not n.startswith("__")]
+
+    def column(self, name: str) -> list:
+        """
+        Returns any column, decoded according to its stored kind.
+        """
+        kind = self._entry(name)["kind"]
+        if kind == "dates":
+            return self.dates(name)
+        if kind == "strings":
+            return self.strings(name)
+        if kind == "bools":
+            return self.bools(name)
+        return list(self.ints(name))
+
+    def table(self, table: str,
+              columns: Sequence[str]) -> Dict[str, list]:
+        """
+        Returns several columns of one table, keyed by column name.
+        """
+        return {column: self.column(f"{table}.{column}")
+                for column in columns}
+
+    def ints(self, name: str) -> array:
+        """
+        Returns an integer or boolean column, undoing delta encoding.
+        """
+        entry = self._entry(name)
+        data = self._array(entry)
+        if entry["kind"] == "delta":
+            total = 0
+            for i, value in enumerate(data):
+                total += value
+                data[i] = total
+        return data
+
+    def bools(self, name: str) -> List[bool]:
+        """
+        Returns a boolean column.
+        """
+        return [bool(v) for v in self._array(self._entry(name))]
+
+    def dates(self, name: str) -> List[Optional[date]]:
+        """
+        Returns a date column with NULLs as None.
+        """
+        try:
+            return [date.fromordinal(v) if v != NULL_DATE else None
+                    for v in self._array(self._entry(name))]
+        except (ValueError, OverflowError):
+            raise SnapshotFormatError(f"Corrupt snapshot block {name}.")
+
+    def strings(self, name: str) -> List[Optional[str]]:
+        """
+        Returns a string column resolved through the string dictionary.
+        """
+        strings = self._string_table()
+        try:
+            return [strings[i] if i != NULL_STRING else None
+                    for i in self._array(self._entry(name))]
+        except IndexError:
+            raise SnapshotFormatError(f"Corrupt snapshot block {name}.")
+
+    def _string_table(self) -> List[str]:
+        if self._strings is None:
+            offsets = self._array(self._entry("__strings__.offsets"))
+            data = self._raw("__strings__.data")
+            try:
+                self._strings = [
+                    data[offsets[i]:offsets[i + 1]].decode("utf-8")
+                    for i in range(len(offsets) - 1)]
+            except UnicodeDecodeError:
+                raise SnapshotFormatError(
+                    "Corrupt snapshot string dictionary.")
+        return self._strings
+
+    def _entry(self, name: str) -> dict:
+        entry = self._index.get(name)
+        if entry is None:
+            raise SnapshotFormatError(f"Missing snapshot column: {name}")
+        return entry
+
+    def _raw(self, name: str) -> bytes:
+        entry = self._entry(name)
+        try:
+            return zlib.decompress(
+                self._buffer[entry["offset"]:
+                             entry["offset"] + entry["length"]])
+        except zlib.error as e:
+            raise SnapshotFormatError(f"Corrupt snapshot block {name}: {e}")
+
+    def _array(self, entry: dict) -> array:
+        if entry["typecode"] not in _INT_TYPECODES:
+            raise SnapshotFormatError(
+                f"Corrupt snapshot block {entry['name']}.")
+        data = array(entry["typecode"])
+        try:
+            data.frombytes(self._raw(entry["name"]))
+        except ValueError:
+            raise SnapshotFormatError(
+                f"Corrupt snapshot block {entry['name']}.")
+        if sys.byteorder != "little":
+            data.byteswap()
+        if len(data) != entry["count"]:
+            raise SnapshotFormatError(
+                f"Corrupt snapshot block {entry['name']}.")
+        return data
+
+
+def _parse_index(entries) -> Dict[str, dict]:
+    """
+    Keys the block index by name after checking that every entry has
+    the fields the reader relies on.
+    """
+    if not isinstance(entries, list):
+        raise SnapshotFormatError("Corrupt snapshot index.")
+    index = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or \
+                not isinstance(entry.get("name"), str) or \
+                not isinstance(entry.get("kind"), str) or \
+                not all(isinstance(entry.get(key), int)
+                        for key in _ENTRY_INTS):
+            raise SnapshotFormatError("Corrupt snapshot index entry.")
+        typecode = entry.get("typecode")
+        if typecode is not None and (not isinstance(typecode, str) or
+                                     typecode not in _INT_TYPECODES):
+            raise SnapshotFormatError(
+                f"Unknown typecode in snapshot block {entry['name']}.")
+        index[entry["name"]] = entry
+    return index
@@ -0,0 +1,36 @@
+import threading
+from typing import Callable, Dict, Hashable
+
+from sqlalchemy.sql import Executable
+
+_statements: Dict[Hashable, Executable] = {}
+_lock = threading.Lock()
+
+
+def cached_statement(key: Hashable,
+                     build: Callable[[], Executable]) -> Executable:
+    """
+    Returns the statement stored under a key, building it on first use.
+
+    SQLAlchemy finds compiled SQL by a cache key that it derives from
+    the whole statement tree, loader options included. A statement that
+    is rebuilt on every call pays for construction and for that key each
+    time; one built once with `bindparam` placeholders keeps both, so a
+    call only binds its parameters.
+
+    Args:
+        key (Hashable): Identifies the statement, e.g. its name and
+            loader profile.
+        build (callable): Builds the statement. Values that differ
+            between calls must be bound parameters.
+
+    Returns:
+        Executable: The statement to execute with its parameters.
+    """
+    statement = _statements.get(key)
+    if statement is None:
+        with _lock:
+            statement = _statements.get(key)
+            if statement is None:
+                statement = _statements[key] = build()
+    return statement
@@ -0,0 +1,211 @@
+"""
+Runs EXPLAIN ANALYZE on the statements of the hot service queries, with
+the composite and covering indexes of migration c5f0e8a2d6b3 and with
+the single-column indexes they replaced.
+
+A synthetic project, and a larger one of the same user that the
+queries must skip, are created inside a transaction that is rolled back
+afterwards. The previous indexes are restored inside a savepoint, which
+locks the tables until the script ends, so point it at a development
+database:
+
+    python -m benchmarks.indexes --individuals 20000
+"""
+import argparse
+import json
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app import create_app
+from app.models.individual_model import Individual
+from app.services.change_feed_service import ChangeFeedService
+from app.services.display_service import DisplayNameService
+from app.services.fragment_service import FragmentService
+from app.services.identity_service import IdentityService
+from app.services.register_numbering_service import \
+    RegisterNumberingService
+from app.services.relationship_service import RelationshipService
+from benchmarks.loader_profiles import seed
+
+# Recreates the indexes as they were before c5f0e8a2d6b3.
+PREVIOUS_INDEXES = """
+DROP INDEX ix_individuals_user_project_updated;
+DROP INDEX ix_relationships_individual_type;
+DROP INDEX ix_relationships_related_type;
+DROP INDEX uix_individual_primary_identity;
+CREATE UNIQUE INDEX uix_individual_primary_identity
+    ON identities (individual_id) WHERE is_primary = true;
+CREATE INDEX ix_individuals_user_id ON individuals (user_id);
+CREATE INDEX ix_individuals_project_id ON individuals (project_id);
+CREATE INDEX ix_identities_individual_id ON identities (individual_id);
+CREATE INDEX ix_relationships_individual_id
+    ON relationships (individual_id);
+CREATE INDEX ix_relationships_related_id ON relationships (related_id);
+CREATE INDEX ix_relationships_project_id ON relationships (project_id);
+ANALYZE individuals, identities, relationships;
+"""
+
+# Individuals with one identity each in another project of the user.
+OTHER_PROJECT = """
+WITH project AS (
+    INSERT INTO projects (name, user_id, project_number)
+    VALUES ('Other benchmark project', :user_id, 2) RETURNING id
+), people AS (
+    INSERT INTO individuals (user_id, project_id, individual_number)
+    SELECT :user_id, project.id, n
+    FROM project, generate_series(1, :individuals) n
+    RETURNING id, individual_number
+)
+INSERT INTO identities (individual_id, project_id, identity_number,
+                        first_name, last_name, is_primary)
+SELECT people.id, project.id, 1, 'Other' || individual_number, 'Last' || individual_number,
+       true
+FROM people, project
+"""
+
+
+class StatementRecorder:
+    """
+    Records the statements and parameters executed on an engine while
+    a service call runs.
+    """
+
+    def __init__(self, engine):
+        self.statements = None
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context,
+                executemany):
+        if self.statements is not None and not executemany:
+            self.statements.append((statement, parameters))
+
+    def record(self, call):
+        self.statements = []
+        try:
+            call()
+            return self.statements
+        finally:
+            self.statements = None
+
+
+def explain(session, statement, parameters, repeat):
+    """
+    Returns the best execution time in ms and the scans of the plan.
+    """
+    best, scans = None, []
+    for _ in range(repeat):
+        plan = session.connection().exec_driver_sql(
+            f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}",
+            parameters).scalar()
+        plan = plan if isinstance(plan, list) else json.loads(plan)
+        elapsed = plan[0]["Execution Time"]
+        if best is None or elapsed < best:
+            best, scans = elapsed, _scans(plan[0]["Plan"])
+    return best, scans
+
+
+def _scans(node):
+    scans = []
+    if "Scan" in node["Node Type"]:
+        scans.append(f"{node['Node Type']}"
+                     f"({node.get('Index Name') or node['Relation Name']})"
+                     if node.get("Relation Name") or node.get("Index Name")
+                     else node["Node Type"])
+    for child in node.get("Plans", []):
+        scans.extend(_scans(child))
+    return scans
+
+
+def service_queries(session, project):
+    """
+    Returns (label, call) pairs for the service queries to measure.
+    """
+    user_id, project_id = project.user_id, project.id
+    ids = session.query(Individual.id).filter_by(
+        project_id=project_id).order_by(Individual.id).limit(3).all()
+    root_id, middle_id, leaf_id = (row.id for row in ids)
+    fragments = FragmentService(session)
+    # Builds the fragments, so the listings below only read them.
+    fragments.get_project_fragments(user_id, project_id)
+
+    return [
+        ("list individuals", lambda: fragments.get_project_fragments(
+            user_id, project_id)),
+        ("search individuals", lambda: fragments.get_project_fragments(
+            user_id, project_id, search_query="Last12")),
+        ("kinship", lambda: DisplayNameService(session).get_kinship(
+            middle_id)),
+        ("display refresh", lambda: DisplayNameService(session).refresh(
+            [middle_id])),
+        ("kin changes", lambda: ChangeFeedService(session).kin_changes(
+            [middle_id])),
+        ("lock identities", lambda: IdentityService(
+            session)._lock_identities(leaf_id)),
+        ("register numbers", lambda: RegisterNumberingService(
+            session).compute_register_numbers(root_id)),
+        ("list relationships", lambda: RelationshipService(
+            session).list_relationships(project_id)),
+    ]
+
+
+def measure(session, queries, repeat):
+    results = {}
+    for label, statements in queries:
+        total, scans = 0.0, []
+        for statement, parameters in statements:
+            elapsed, plan_scans = explain(session, statement,
+                                          parameters, repeat)
+            total += elapsed
+            scans += plan_scans
+        results[label] = (total, scans)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip()
+                                     .splitlines()[0])
+    parser.add_argument("--individuals", type=int, default=20000)
+    parser.add_argument("--other-individuals", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--env", default="development")
+    args = parser.parse_args()
+
+    app = create_app(args.env)
+    engine = app.extensions["engine"]
+    with app.app_context(), engine.connect() as connection:
+        recorder = StatementRecorder(engine)
+        transaction = connection.begin()
+        # Commits of the services only release savepoints, so the seed
+        # is rolled back with the outer transaction.
+        session = Session(bind=connection,
+                          join_transaction_mode="create_savepoint")
+        try:
+            project = seed(session, args.individuals)
+            session.execute(text(OTHER_PROJECT), {
+                "user_id": project.user_id,
+                "individuals": args.other_individuals})
+            session.execute(text(
+                "ANALYZE individuals, identities, relationships"))
+            queries = [(label, recorder.record(call)) for label, call
+                       in service_queries(session, project)]
+
+            savepoint = session.begin_nested()
+            session.execute(text(PREVIOUS_INDEXES))
+            before = measure(session, queries, args.repeat)
+            savepoint.rollback()
+            after = measure(session, queries, args.repeat)
+        finally:
+            session.close()
+            transaction.rollback()
+
+    print(f"{'query':<22}{'before ms':>11}{'after ms':>11}")
+    for label, _ in queries:
+        print(f"{label:<22}{before[label][0]:>11.2f}"
+              f"{after[label][0]:>11.2f}")
+        print(f"  before: {', '.join(before[label][1])}")
+        print(f"  after:  {', '.join(after[label][1])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Compares the statements and rows fetched per endpoint with the former
+`lazy='joined'` defaults and with the named loader profiles.
+
+A synthetic project is created inside a transaction that is rolled back
+afterwards, so the script can be pointed at any database:
+
+    python -m benchmarks.loader_profiles --individuals 2000
+"""
+import argparse
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import joinedload
+
+from app import create_app
+from app.extensions import SessionLocal
+from app.models.enums_model import GenderEnum, InitialRelationshipEnum
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.models.project_model import Project
+from app.models.relationship_model import Relationship
+from app.models.user_model import User
+from app.services.display_service import DisplayNameService
+from app.services.individual_service import IndividualService
+from app.services.relationship_service import RelationshipService
+from app.utils.loader_profiles import DETAIL
+
+# What the removed lazy='joined' declarations loaded implicitly.
+LEGACY_INDIVIDUAL = (
+    joinedload(Individual.identities),
+    joinedload(Individual.primary_identity),
+    joinedload(Individual.relationships_as_individual)
+    .joinedload(Relationship.related).joinedload(Individual.identities),
+    joinedload(Individual.relationships_as_related)
+    .joinedload(Relationship.individual).joinedload(Individual.identities),
+)
+LEGACY_RELATIONSHIP = (
+    joinedload(Relationship.individual).joinedload(Individual.identities),
+    joinedload(Relationship.related).joinedload(Individual.identities),
+)
+
+
+class QueryCounter:
+    """
+    Counts statements and fetched rows on an engine.
+    """
+
+    def __init__(self, engine):
+        self.statements = 0
+        self.rows = 0
+        event.listen(engine, "after_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context,
+               executemany):
+        self.statements += 1
+        if cursor.description is not None and cursor.rowcount > 0:
+            self.rows += cursor.rowcount
+
+    @contextmanager
+    def measure(self, results, label):
+        statements, rows = self.statements, self.rows
+        yield
+        results.append((label, self.statements - statements,
+                        self.rows - rows))
+
+
+def seed(session, individuals: int) -> Project:
+    """
+    Adds a project with a binary family tree of `individuals` people,
+    three identities each and a partner for every parent.
+    """
+    user = User(username="benchmark-loader", email="loader@benchmark")
+    user.set_password("benchmark")
+    session.add(user)
+    session.flush()
+    project = Project(name="Loader benchmark", user_id=user.id,
+                      project_number=1)
+    session.add(project)
+    session.flush()
+
+    people = []
+    for number in range(1, individuals + 1):
+        person = Individual(user_id=user.id, project_id=project.id,
+                            individual_number=number)
+        for identity_number in (1, 2, 3):
+            person.identities.append(Identity(
+                project_id=project.id, identity_number=identity_number,
+                first_name=f"First{number}-{identity_number}",
+                last_name=f"Last{number}", gender=GenderEnum.UNKNOWN,
+                is_primary=identity_number == 3))
+        people.append(person)
+    session.add_all(people)
+    session.flush()
+
+    for index, person in enumerate(people[1:], start=1):
+        parent = people[(index - 1) // 2]
+        session.add(Relationship(
+            project_id=project.id, individual_id=parent.id,
+            related_id=person.id,
+            initial_relationship=InitialRelationshipEnum.PARENT))
+        if index % 2 and index + 1 < len(people):
+            session.add(Relationship(
+                project_id=project.id, individual_id=person.id,
+                related_id=people[index + 1].id,
+                initial_relationship=InitialRelationshipEnum.PARTNER))
+    DisplayNameService(session).refresh_project(project.id)
+    session.flush()
+    session.expunge_all()
+    return project
+
+
+def run(session, counter, project):
+    user_id, project_id = project.user_id, project.id
+    middle_id = session.query(Individual.id).filter_by(
+        project_id=project_id).order_by(Individual.id).offset(
+        1).limit(1).scalar()
+    results = []
+
+    def touch_summary(individual):
+        return ([i.id for i in individual.identities],
+                individual.primary_identity)
+
+    with counter.measure(results, "list individuals (before)"):
+        for individual in session.query(Individual).filter_by(
+                user_id=user_id, project_id=project_id).options(
+                *LEGACY_INDIVIDUAL).all():
+            touch_summary(individual)
+    session.expunge_all()
+    with counter.measure(results, "list individuals (summary)"):
+        for individual in IndividualService(
+                session).get_individuals_by_project(user_id, project_id):
+            touch_summary(individual)
+    session.expunge_all()
+
+    with counter.measure(results, "individual detail (before)"):
+        individual = session.query(Individual).filter_by(
+            id=middle_id).options(*LEGACY_INDIVIDUAL).one()
+        touch_summary(individual)
+        _ = (individual.parents, individual.children,
+             individual.partners, individual.siblings)
+    session.expunge_all()
+    with counter.measure(results, "individual detail (summary)"):
+        individual = IndividualService(session).get_individual_by_id(
+            middle_id, user_id, project_id)
+        touch_summary(individual)
+        DisplayNameService(session).get_kinship(middle_id)
+    session.expunge_all()
+
+    with counter.measure(results, "list relationships (before)"):
+        for rel in session.query(Relationship).filter_by(
+                project_id=project_id).options(
+                *LEGACY_RELATIONSHIP).all():
+            _ = rel.individual.first_name, rel.related.first_name
+    session.expunge_all()
+    with counter.measure(results, "list relationships (summary)"):
+        rels = RelationshipService(session).list_relationships(project_id)
+        DisplayNameService(session).get_names(
+            {r.individual_id for r in rels} | {r.related_id for r in rels})
+    session.expunge_all()
+    with counter.measure(results, "list relationships (detail)"):
+        for rel in RelationshipService(session).list_relationships(
+                project_id, profile=DETAIL):
+            _ = rel.individual.first_name, rel.related.first_name
+    session.expunge_all()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip()
+                                     .splitlines()[0])
+    parser.add_argument("--individuals", type=int, default=1000)
+    parser.add_argument("--env", default="development")
+    args = parser.parse_args()
+
+    app = create_app(args.env)
+    with app.app_context():
+        counter = QueryCounter(app.extensions["engine"])
+        session = SessionLocal()
+        try:
+            project = seed(session, args.individuals)
+            results = run(session, counter, project)
+        finally:
+            session.rollback()
+            session.close()
+
+    print(f"{'endpoint':<32}{'statements':>12}{'rows':>12}")
+    for label, statements, rows in results:
+        print(f"{label:<32}{statements:>12}{rows:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Times the hot service reads per call, statement construction, cache key
+and compilation included, with the statements rebuilt on every call as
+before and with the cached statements the services use now.
+
+A synthetic project is created inside a transaction that is rolled back
+afterwards, so the script can be pointed at any database:
+
+    python -m benchmarks.statements --calls 2000
+"""
+import argparse
+import logging
+import time
+
+from sqlalchemy.orm import joinedload
+
+from app import create_app
+from app.extensions import SessionLocal
+from app.models.identity_model import Identity
+from app.models.individual_model import Individual
+from app.models.project_model import Project
+from app.models.relationship_model import Relationship
+from app.services.identity_service import IdentityService
+from app.services.individual_service import IndividualService
+from app.services.project_service import ProjectService
+from app.services.relationship_service import RelationshipService
+from app.utils.loader_profiles import DETAIL, SUMMARY, loader_options
+from benchmarks.loader_profiles import seed
+
+
+def reads(session, project):
+    """
+    Returns (label, rebuilt, cached) tuples of callables for each hot
+    read; the rebuilt variant is the query the service ran before.
+    """
+    user_id, project_id = project.user_id, project.id
+    individual_id = session.query(Individual.id).filter_by(
+        project_id=project_id).order_by(Individual.id).offset(
+        1).limit(1).scalar()
+    identity_id = session.query(Identity.id).filter_by(
+        individual_id=individual_id).limit(1).scalar()
+    relationship_id = session.query(Relationship.id).filter_by(
+        project_id=project_id).limit(1).scalar()
+    individuals = IndividualService(session)
+    identities = IdentityService(session)
+    relationships = RelationshipService(session)
+    projects = ProjectService(session)
+
+    return [
+        ("individual detail",
+         lambda: session.query(Individual).filter_by(
+             id=individual_id, user_id=user_id, project_id=project_id
+         ).options(*loader_options(Individual, DETAIL)).first(),
+         lambda: individuals.get_individual_by_id(
+             individual_id, user_id, project_id, profile=DETAIL)),
+        ("individual search",
+         lambda: session.query(Individual).filter_by(
+             user_id=user_id, project_id=project_id).options(
+             *loader_options(Individual, SUMMARY)).filter(
+             Individual.identities.any(
+                 Identity.first_name.ilike("%First2-%") |
+                 Identity.last_name.ilike("%First2-%")) |
+             Individual.birth_place.ilike("%First2-%")).order_by(
+             Individual.updated_at.desc()).all(),
+         lambda: individuals.get_individuals_by_project(
+             user_id, project_id, search_query="First2-")),
+        ("identity",
+         lambda: session.query(Identity).filter(
+             Identity.id == identity_id).first(),
+         lambda: identities.get_identity_by_id(identity_id)),
+        ("relationship detail",
+         lambda: session.query(Relationship).filter(
+             Relationship.id == relationship_id).options(
+             *loader_options(Relationship, DETAIL)).first(),
+         lambda: relationships.get_relationship_by_id(
+             relationship_id, profile=DETAIL)),
+        ("projects of user",
+         lambda: session.query(Project).filter(
+             Project.user_id == user_id).all(),
+         lambda: projects.get_projects_by_user(user_id)),
+        ("identities of project",
+         lambda: session.query(Identity).join(Individual).filter(
+             Identity.project_id == project_id,
+             Individual.project_id == project_id
+         ).options(joinedload(Identity.individual)).all(),
+         lambda: identities.get_all_identities(project_id)),
+    ]
+
+
+def per_call(session, read, calls: int) -> float:
+    """
+    Returns the mean time of a read in microseconds, after warming the
+    compiled cache. The identity map is cleared between calls, so every
+    call loads its rows again.
+    """
+    for _ in range(min(calls, 50)):
+        read()
+        session.expunge_all()
+    start = time.perf_counter()
+    for _ in range(calls):
+        read()
+        session.expunge_all()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip()
+                                     .splitlines()[0])
+    parser.add_argument("--individuals", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--env", default="development")
+    args = parser.parse_args()
+
+    app = create_app(args.env)
+    # Echoed SQL and service logging would dominate the timings.
+    app.extensions["engine"].echo = False
+    logging.disable(logging.INFO)
+    results = []
+    with app.app_context():
+        session = SessionLocal()
+        try:
+            project = seed(session, args.individuals)
+            for label, rebuilt, cached in reads(session, project):
+                results.append((label,
+                                per_call(session, rebuilt, args.calls),
+                                per_call(session, cached, args.calls)))
+        finally:
+            session.rollback()
+            session.close()
+
+    print(f"{'read':<24}{'rebuilt us':>12}{'cached us':>12}"
+          f"{'saved':>8}")
+    for label, rebuilt, cached in results:
+        print(f"{label:<24}{rebuilt:>12.0f}{cached:>12.0f}"
+              f"{1 - cached / rebuilt:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,20 @@
 #!/bin/bash
 set -e
 
-# 1) Run migrations
-alembic upgrade head
+# 1) Run migrations. Databases partitioned through the opt-in branch set
+#    ALEMBIC_NAME=partitioning, whose section also knows that branch.
+if [ "${ALEMBIC_NAME:-alembic}" = "partitioning" ]; then
+  alembic --name partitioning upgrade heads
+else
+  alembic --name "${ALEMBIC_NAME:-alembic}" upgrade head
+fi
 
-# 2) Start the Gunicorn server
-gunicorn run:app --bind 0.0.0.0:$PORT --workers 3
+# 2) Start the background job worker
+python worker.py &
+
+# 3) Start the Gunicorn server, or Uvicorn for the asyncio API
+if [ "$ASYNC_API" = "true" ]; then
+  uvicorn asgi:app --host 0.0.0.0 --port $PORT
+else
+  gunicorn run:app --bind 0.0.0.0:$PORT --workers 3
+fi
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import pytest
 from sqlalchemy import text
 
@@ -5,6 +7,7 @@ from app import create_app
 from app.create_tables import create_tables
 from app.extensions import SessionLocal
 from app.models.base_model import Base
+from app.utils.query_metrics import capture_queries
 
 
 @pytest.fixture(scope='session')
@@ -60,6 +63,56 @@ def db_session():
         session.close()
 
 
+@pytest.fixture(scope='function')
+def login():
+    """
+    Fixture to log a test client in as the test user.
+
+    Usage:
+        login(client)
+
+    Returns:
+        Function taking a Flask or async API test client; the client
+        keeps the auth cookies.
+    """
+    def log_in(client):
+        resp = client.post("/api/auth/login", json={
+            "email": "testuser@example.com",
+            "password": "TestPass123!"
+        })
+        assert resp.status_code == 200
+
+    return log_in
+
+
+@pytest.fixture(scope='function')
+def query_budget():
+    """
+    Fixture to assert how many SQL statements a block may execute.
+
+    Usage:
+        with query_budget(4, repeats=1):
+            client.get(...)
+
+    Returns:
+        Context manager factory taking the maximum number of
+        statements and, optionally, how often a single statement shape
+        may repeat.
+    """
+    @contextmanager
+    def budget(queries, repeats=None):
+        with capture_queries() as stats:
+            yield stats
+        assert stats.count <= queries, \
+            f"Query budget of {queries} exceeded:\n{stats.report()}"
+        if repeats is not None:
+            assert stats.max_repeats <= repeats, \
+                f"Statement repeated more than {repeats} times:\n" \
+                f"{stats.report()}"
+
+    return budget
+
+
 @pytest.fixture(scope='function', autouse=True)
 def setup_test_data(db_session):
     """
@@ -78,9 +131,14 @@ def setup_test_data(db_session):
     from app.models.relationship_model import Relationship
     from app.models.identity_model import Identity
 
+    from app.cache import clear_caches
+    from app.services.display_service import DisplayNameService
+
     db_session.rollback()
     Base.metadata.drop_all(bind=db_session.bind)
     Base.metadata.create_all(bind=db_session.bind)
+    # Ids and change sequences restart with every test.
+    clear_caches()
 
     user = User(id=1, username="testuser",
                 email="testuser@example.com")
@@ -121,6 +179,7 @@ def setup_test_data(db_session):
     identity_1 = Identity(
         id=1,
         individual_id=1,
+        project_id=1,
         first_name="Ind1First",
         last_name="Ind1Last",
         gender="male",
@@ -131,6 +190,7 @@ def setup_test_data(db_session):
     identity_2 = Identity(
         id=2,
         individual_id=2,
+        project_id=1,
         first_name="Ind2First",
         last_name="Ind2Last",
         gender="female",
@@ -141,6 +201,7 @@ def setup_test_data(db_session):
     identity_3 = Identity(
         id=3,
         individual_id=3,
+        project_id=1,
         first_name="Ind3First",
         last_name="Ind3Last",
         gender="unknown",
@@ -160,6 +221,9 @@ def setup_test_data(db_session):
         initial_relationship="parent"
     )
     db_session.add(relationship)
+    # Rows inserted directly need their display names, as a migration
+    # backfill would provide.
+    DisplayNameService(db_session).refresh_project(project.id)
     db_session.commit()
 
     db_session.execute(text(
@@ -0,0 +1,154 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.async_api import create_async_app
+
+
+@pytest.fixture
+def async_client(app):
+    """
+    Fixture to provide a test client for the async API, sharing the
+    configuration of the Flask test app.
+
+    Yields:
+        TestClient instance.
+    """
+    with TestClient(create_async_app(flask_app=app)) as client:
+        yield client
+
+
+def test_async_api_requires_login(async_client, login):
+    """
+    Test that async endpoints reject requests without an access token,
+    and project-scoped ones without a project.
+    """
+    resp = async_client.get("/api/individuals/?project_id=1")
+    assert resp.status_code == 401
+    assert resp.json() == {"error": "Authorization token required."}
+
+    login(async_client)
+    resp = async_client.get("/api/individuals/")
+    assert resp.status_code == 400
+    assert "Project ID is required." in resp.json()["error"]
+
+
+def test_async_api_matches_flask(client, async_client, login):
+    """
+    Test that the async endpoints return the bodies of the Flask app.
+    """
+    login(client)
+    login(async_client)
+    for path in ("/api/projects/",
+                 "/api/projects/1/changes?since=0",
+                 "/api/individuals/?project_id=1",
+                 "/api/individuals/2?project_id=1",
+                 "/api/identities/?project_id=1",
+                 "/api/relationships/1?project_id=1"):
+        expected = client.get(path)
+        resp = async_client.get(path)
+        assert resp.status_code == expected.status_code == 200, path
+        assert resp.json() == expected.json, path
+
+
+def test_async_api_cors_matches_flask(client, async_client):
+    """
+    Test that both apps let the allowed origins send their cookies.
+    """
+    origin = "http://localhost:3000"
+    expected = client.get("/api/projects/", headers={"Origin": origin})
+    resp = async_client.get("/api/projects/", headers={"Origin": origin})
+    for headers in (expected.headers, resp.headers):
+        assert headers["Access-Control-Allow-Origin"] == origin
+        assert headers["Access-Control-Allow-Credentials"] == "true"
+
+
+def test_async_api_writes(async_client, login):
+    """
+    Test creating an individual and relating it, including the
+    validation errors of the relationship service.
+    """
+    login(async_client)
+    resp = async_client.post("/api/individuals/?project_id=1", json={
+        "first_name": "Async",
+        "last_name": "Child",
+        "gender": "female",
+        "birth_date": "2000-05-05"
+    })
+    assert resp.status_code == 201
+    individual_id = resp.json()["individual"]["id"]
+
+    payload = {
+        "individual_id": 2,
+        "related_id": individual_id,
+        "initial_relationship": "parent"
+    }
+    resp = async_client.post("/api/relationships/?project_id=1",
+                             json=payload)
+    assert resp.status_code == 201
+    assert resp.json()["data"]["related"]["first_name"] == "Async"
+
+    resp = async_client.post("/api/relationships/?project_id=1",
+                             json=payload)
+    assert resp.status_code == 400
+
+    resp = async_client.get(f"/api/individuals/{individual_id}"
+                            f"?project_id=1")
+    assert resp.status_code == 200
+    assert [p["id"] for p in resp.json()["data"]["parents"]] == [2]
+
+
+def test_async_api_delete_project_forgets_access(async_client, login):
+    """
+    Test that a project deleted through the async API is no longer
+    accessible, although its ownership was cached before.
+    """
+    login(async_client)
+    assert async_client.get(
+        "/api/individuals/?project_id=1").status_code == 200
+    assert async_client.delete("/api/projects/1").status_code == 200
+    resp = async_client.get("/api/individuals/?project_id=1")
+    assert resp.status_code == 404
+
+
+def test_async_api_etag(async_client, login):
+    """
+    Test that project reads honour If-None-Match like the Flask app.
+    """
+    login(async_client)
+    resp = async_client.get("/api/relationships/?project_id=1")
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    resp = async_client.get("/api/relationships/?project_id=1",
+                            headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+
+
+def test_async_api_concurrent_requests(app):
+    """
+    Test that one event loop serves more concurrent requests than the
+    connection pool holds.
+    """
+    api = create_async_app(flask_app=app)
+
+    async def run():
+        transport = httpx.ASGITransport(app=api)
+        async with httpx.AsyncClient(transport=transport,
+                                     base_url="http://test") as http:
+            await http.post("/api/auth/login", json={
+                "email": "testuser@example.com",
+                "password": "TestPass123!"
+            })
+            try:
+                return await asyncio.gather(*(
+                    http.get("/api/relationships/?project_id=1")
+                    for _ in range(50)))
+            finally:
+                await api.state.engine.dispose()
+
+    responses = asyncio.run(run())
+    assert all(resp.status_code == 200 for resp in responses)
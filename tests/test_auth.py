@@ -72,3 +72,4 @@ def test_logout(client):
     logout_resp = client.post("/api/auth/logout")
     assert logout_resp.status_code == 200
     assert "Logged out successfully." in logout_resp.json["message"]
+
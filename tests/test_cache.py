@@ -0,0 +1,127 @@
+import os
+import pickle
+import stat
+import time
+
+import pytest
+
+from app.cache import SQLiteStore, TieredCache
+from app.schemas.user_schema import UserSnapshot
+
+
+def _worker_caches(tmp_path, **kwargs):
+    """
+    Returns two caches sharing one store, like two gunicorn workers.
+    """
+    store = SQLiteStore(str(tmp_path / "cache.sqlite"))
+    return (TieredCache("test", store=store, sync_interval=0, **kwargs),
+            TieredCache("test", store=store, sync_interval=0, **kwargs))
+
+
+def test_shared_tier_and_invalidation(tmp_path):
+    """
+    Test that entries are shared between processes and that deletes
+    and tag invalidations reach the other process's local tier.
+    """
+    first, second = _worker_caches(tmp_path)
+    first.set("a", {"value": 1}, tags=["project:1"])
+    first.set("b", {"value": 2}, tags=["project:2"])
+    assert second.get("a") == {"value": 1}
+    assert second.get("a") == {"value": 1}
+    assert second.info()["shared_hits"] == 1
+    assert second.info()["local_hits"] == 1
+
+    first.delete("a")
+    assert second.get("a") is None
+
+    assert second.get("b") == {"value": 2}
+    first.invalidate_tag("project:2")
+    assert second.get("b") is None
+    assert first.get("b") is None
+
+
+def test_get_or_set_rejects_values_loaded_before_invalidation(tmp_path):
+    """
+    Test that a value loaded while its key was invalidated is returned
+    but not cached.
+    """
+    first, second = _worker_caches(tmp_path)
+
+    def racing_loader():
+        second.delete("claims:1")
+        return {"is_admin": True}
+
+    assert first.get_or_set("claims:1", racing_loader) == \
+        {"is_admin": True}
+    assert first.get("claims:1") is None
+    assert first.get_or_set("claims:1", lambda: {"is_admin": False}) == \
+        {"is_admin": False}
+    assert second.get("claims:1") == {"is_admin": False}
+    assert first.info()["rejected_sets"] == 1
+
+
+def test_size_based_eviction(tmp_path):
+    """
+    Test that both tiers stay within their size limits.
+    """
+    store = SQLiteStore(str(tmp_path / "cache.sqlite"), max_entries=5)
+    cache = TieredCache("test", store=store, local_maxsize=3)
+    for i in range(10):
+        cache.set(i, i)
+    store.trim()
+
+    info = cache.info()
+    assert info["local_size"] == 3
+    assert info["shared_size"] == 5
+    assert cache.get(9) == 9
+    assert cache.get(0) is None
+
+
+def test_local_only_cache_expires():
+    """
+    Test that a cache without a shared tier honours per-entry TTLs.
+    """
+    cache = TieredCache("test", ttl=60)
+    cache.set("short", 1, ttl=0.01)
+    cache.set("long", 2)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_shared_tier_stores_json(tmp_path):
+    """
+    Test that models round-trip through the shared tier and that an
+    entry that does not decode is treated as a miss.
+    """
+    first, second = _worker_caches(tmp_path, model=UserSnapshot)
+    first.set(1, UserSnapshot(id=1, username="ann", is_admin=False))
+    assert second.get(1) == UserSnapshot(id=1, username="ann",
+                                         is_admin=False)
+
+    first.store.set("test", "2", pickle.dumps({"is_admin": True}), 60,
+                    ())
+    assert second.get(2) is None
+    assert second.info()["errors"] == 1
+
+
+def test_store_is_private(tmp_path):
+    """
+    Test that the cache directory and file are only accessible by the
+    application user.
+    """
+    path = tmp_path / "cache" / "cache.sqlite"
+    SQLiteStore(str(path))
+    assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_store_refuses_foreign_file(tmp_path, monkeypatch):
+    """
+    Test that a cache file owned by another user is refused.
+    """
+    path = tmp_path / "cache.sqlite"
+    path.touch()
+    monkeypatch.setattr(os, "geteuid", lambda: os.stat(path).st_uid + 1)
+    with pytest.raises(PermissionError):
+        SQLiteStore(str(path))
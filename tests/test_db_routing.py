@@ -0,0 +1,92 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+
+from app.extensions import SessionLocal
+from app.models.fragment_model import IndividualFragment
+from app.utils.db_routing import PRIMARY_PIN_COOKIE, ReplicaPool
+
+
+@pytest.fixture
+def replica(app):
+    """
+    Fixture routing reads to a second engine on the test database,
+    standing in for a replica.
+
+    Yields:
+        list: The statements executed on the replica.
+    """
+    engine = create_engine(app.config["SQLALCHEMY_DATABASE_URI"])
+    statements = []
+    event.listen(engine, "after_cursor_execute",
+                 lambda conn, cursor, statement, *args:
+                 statements.append(statement))
+    previous = app.extensions["replicas"]
+    app.extensions["replicas"] = ReplicaPool([engine])
+    try:
+        yield statements
+    finally:
+        app.extensions["replicas"] = previous
+        engine.dispose()
+
+
+def test_get_reads_from_replica(client, replica, login):
+    """
+    Test that safe requests are served by the replica.
+    """
+    login(client)
+    resp = client.get("/api/relationships/?project_id=1")
+    assert resp.status_code == 200
+    assert replica
+    assert all(s.lstrip().upper().startswith("SELECT") for s in replica)
+
+
+def test_write_pins_reads_to_primary(client, replica, login):
+    """
+    Test that a successful write routes the client's following reads
+    to the primary.
+    """
+    login(client)
+    resp = client.post("/api/relationships/?project_id=1", json={
+        "individual_id": 1,
+        "related_id": 3,
+        "initial_relationship": "partner"
+    })
+    assert resp.status_code == 201
+    assert client.get_cookie(PRIMARY_PIN_COOKIE) is not None
+    assert not replica
+
+    resp = client.get("/api/relationships/?project_id=1")
+    assert resp.status_code == 200
+    assert len(resp.json["relationships"]) == 2
+    assert not replica
+
+
+def test_fragment_rebuild_reads_from_primary(client, replica, login):
+    """
+    Test that fragments rebuilt during a replica-routed read are built
+    from the primary's rows.
+    """
+    with SessionLocal.session_factory() as session:
+        session.query(IndividualFragment).delete()
+        session.commit()
+    login(client)
+    replica.clear()
+    resp = client.get("/api/individuals/?project_id=1")
+    assert resp.status_code == 200
+    assert len(resp.json["individuals"]) == 3
+    assert replica
+    assert not any("individuals.id IN" in s for s in replica)
+
+
+def test_unreachable_replica_is_skipped():
+    """
+    Test that a replica failing to connect is taken out of rotation.
+    """
+    engine = create_engine(
+        "postgresql://postgres:@/missing?host=/nonexistent")
+    pool = ReplicaPool([engine], retry_interval=60)
+    assert pool.choose() is engine
+    with pytest.raises(OperationalError):
+        engine.connect()
+    assert pool.choose() is None
@@ -71,4 +71,68 @@ def test_identity_invalid_date_range(client):
         assert "Valid from date cannot be after valid until date" in resp.json["details"][0]["msg"]
     else:
         # fallback if the code is returning everything in 'error'
-        assert "Valid from date cannot be after valid until date" in resp.json["error"]
\ No newline at end of file
+        assert "Valid from date cannot be after valid until date" in resp.json["error"]
+
+def test_new_primary_identity_renames_kin(client):
+    """
+    Test that a newer identity becoming primary renames the individual
+    in kinship lists and relationship listings.
+    """
+    login_payload = {
+        "email": "testuser@example.com",
+        "password": "TestPass123!"
+    }
+    client.post("/api/auth/login", json=login_payload)
+
+    payload = {
+        "individual_id": 2,
+        "first_name": "Married",
+        "last_name": "Name",
+        "gender": "female",
+        "valid_from": "2020-01-01"
+    }
+    resp = client.post("/api/identities/?project_id=1", json=payload)
+    assert resp.status_code == 201
+
+    children = client.get(
+        "/api/individuals/1?project_id=1").json["data"]["children"]
+    assert children == [{"id": 2, "first_name": "Married",
+                         "last_name": "Name", "relationship_id": 1}]
+    relationships = client.get(
+        "/api/relationships/?project_id=1").json["relationships"]
+    assert relationships[0]["related"] == {
+        "id": 2, "first_name": "Married", "last_name": "Name"}
+
+
+def test_primary_identity_moves_in_one_commit(client, query_budget):
+    """
+    Test that promoting and deleting identities keeps exactly one
+    primary per individual, writing each change only once.
+    """
+    login_payload = {
+        "email": "testuser@example.com",
+        "password": "TestPass123!"
+    }
+    client.post("/api/auth/login", json=login_payload)
+
+    def primaries():
+        identities = client.get(
+            "/api/identities/?project_id=1").json["identities"]
+        return [i["id"] for i in identities
+                if i["individual_id"] == 1 and i["is_primary"]]
+
+    with query_budget(16, repeats=1):
+        resp = client.post("/api/identities/?project_id=1", json={
+            "individual_id": 1,
+            "first_name": "Later",
+            "last_name": "Name",
+            "gender": "male",
+            "valid_from": "2010-01-01"
+        })
+    assert resp.status_code == 201
+    new_id = resp.json["identity"]["id"]
+    assert primaries() == [new_id]
+
+    resp = client.delete(f"/api/identities/{new_id}?project_id=1")
+    assert resp.status_code == 200
+    assert primaries() == [1]
@@ -0,0 +1,85 @@
+import io
+
+import pytest
+
+INDIVIDUALS_CSV = (
+    "ref,first_name,last_name,gender,birth_date,birth_place\n"
+    "a,Anna,Import,female,1950-01-01,Utrecht\n"
+    "b,Bram,Import,male,1952-02-02,\n"
+    "c,Cees,Import,non binary,1980-03-03,Delft\n"
+)
+
+RELATIONSHIPS_CSV = (
+    "individual_ref,related_ref,initial_relationship,relationship_detail\n"
+    "a,b,partner,marriage\n"
+    "b,a,partner,\n"
+    "c,a,child,biological\n"
+)
+
+
+def _upload(client, individuals, relationships=None):
+    data = {"individuals": (io.BytesIO(individuals.encode()), "individuals.csv")}
+    if relationships is not None:
+        data["relationships"] = (io.BytesIO(relationships.encode()),
+                                 "relationships.csv")
+    return client.post("/api/imports/csv?project_id=1", data=data,
+                       content_type="multipart/form-data")
+
+
+def test_import_csv_unauthorized(client):
+    """
+    Test importing a CSV without authorization.
+    """
+    resp = _upload(client, INDIVIDUALS_CSV)
+    assert resp.status_code == 401
+
+
+def test_import_csv(client, login):
+    """
+    Test importing individuals and canonicalised, de-duplicated relationships.
+    """
+    login(client)
+    resp = _upload(client, INDIVIDUALS_CSV, RELATIONSHIPS_CSV)
+    assert resp.status_code == 201
+    assert resp.json["imported"] == {
+        "individuals": 3, "identities": 3, "relationships": 2}
+
+    list_resp = client.get("/api/individuals/?project_id=1&q=Import")
+    imported = list_resp.json["individuals"]
+    assert sorted(i["individual_number"] for i in imported) == [4, 5, 6]
+    assert all(i["primary_identity"]["is_primary"] for i in imported)
+
+    rels_resp = client.get("/api/relationships/?project_id=1")
+    by_type = {r["initial_relationship"]: r for r in
+               rels_resp.json["relationships"] if r["id"] != 1}
+    assert by_type["parent"]["individual"]["first_name"] == "Anna"
+    assert by_type["parent"]["related"]["first_name"] == "Cees"
+    assert by_type["partner"]["relationship_detail"] == "marriage"
+
+
+def test_import_csv_unknown_reference(client, login):
+    """
+    Test that relationships pointing to unknown refs are rejected atomically.
+    """
+    login(client)
+    resp = _upload(client, INDIVIDUALS_CSV,
+                   "individual_ref,related_ref,initial_relationship\n"
+                   "a,zzz,partner\n")
+    assert resp.status_code == 400
+
+    list_resp = client.get("/api/individuals/?project_id=1&q=Import")
+    assert list_resp.json["individuals"] == []
+
+
+@pytest.mark.parametrize("individuals", [
+    "ref,nickname\na,Al\n",
+    "ref,first_name\na,Anna\na,Again\n",
+    "ref,birth_date\na,01-01-1950\n",
+])
+def test_import_csv_invalid_individuals(client, individuals, login):
+    """
+    Test that malformed individual CSV files return 400.
+    """
+    login(client)
+    resp = _upload(client, individuals)
+    assert resp.status_code == 400
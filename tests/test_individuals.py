@@ -1,5 +1,9 @@
+from datetime import date, timedelta
+
 import pytest
 
+from app.utils import etag_utils
+
 def test_create_individual_unauthorized(client):
     """
     Test creating an individual without authorization.
@@ -37,6 +41,29 @@ def test_create_individual_authorized(client):
     assert data["primary_identity"]["first_name"] == "Jane"
 
 
+def test_individual_numbers_follow_counter(client, db_session):
+    """
+    Test that individual numbers continue after existing rows and skip
+    a reserved block.
+    """
+    from app.models.enums_model import CounterScopeEnum
+    from app.services.counter_service import CounterService
+
+    counters = CounterService(db_session)
+    assert counters.reserve(CounterScopeEnum.INDIVIDUAL_NUMBER, 1, 3) == 4
+    db_session.commit()
+
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    resp = client.post("/api/individuals/?project_id=1", json={
+        "first_name": "Next",
+        "last_name": "Number",
+        "gender": "unknown"
+    })
+    assert resp.status_code == 201
+    assert resp.json["individual"]["individual_number"] == 7
+
+
 def test_individual_invalid_dates(client):
     """
     Test that birth_date cannot be after death_date.
@@ -75,6 +102,96 @@ def test_list_individuals(client):
     assert isinstance(resp.json["individuals"], list)
 
 
+def test_list_individuals_conditional_get(client):
+    """
+    Test that listing individuals honours If-None-Match until the
+    project changes.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    resp = client.get("/api/individuals/?project_id=1")
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    resp = client.get("/api/individuals/?project_id=1",
+                      headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+    assert resp.data == b""
+
+    client.post("/api/individuals/?project_id=1",
+                json={"first_name": "Etag", "last_name": "Person",
+                      "gender": "male"})
+    resp = client.get("/api/individuals/?project_id=1",
+                      headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+def test_list_individuals_etag_changes_daily(client, monkeypatch):
+    """
+    Test that a list's ETag changes at midnight, when ages in the
+    payload may change without any change to the project.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    etag = client.get("/api/individuals/?project_id=1").headers["ETag"]
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    monkeypatch.setattr(etag_utils, "date", Tomorrow)
+    resp = client.get("/api/individuals/?project_id=1",
+                      headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+def test_list_individuals_from_fragments(client):
+    """
+    Test that listed individuals match their detail payloads and follow
+    identity changes.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    listed = {i["id"]: i for i in
+              client.get("/api/individuals/?project_id=1").json["individuals"]}
+    detail = client.get("/api/individuals/1?project_id=1").json["data"]
+    for key in ("parents", "children", "partners", "siblings"):
+        detail.pop(key)
+    assert listed[1] == detail
+
+    client.patch("/api/identities/1?project_id=1",
+                 json={"first_name": "Fragmented"})
+    resp = client.get("/api/individuals/search?project_id=1&q=Fragmented"
+                      "&exclude_ids=2")
+    assert resp.status_code == 200
+    assert [i["primary_identity"]["first_name"]
+            for i in resp.json["individuals"]] == ["Fragmented"]
+
+
+def test_individual_detail_follows_kin_changes(client):
+    """
+    Test that a cached individual detail is refreshed when a related
+    individual is renamed.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    resp = client.get("/api/individuals/1?project_id=1")
+    assert resp.status_code == 200
+    assert resp.json["data"]["children"][0]["first_name"] == "Ind2First"
+    assert client.get("/api/individuals/1?project_id=1").json == resp.json
+
+    client.patch("/api/individuals/2?project_id=1",
+                 json={"first_name": "Renamed"})
+    resp = client.get("/api/individuals/1?project_id=1")
+    assert resp.json["data"]["children"][0]["first_name"] == "Renamed"
+
+
 def test_update_individual(client):
     """
     Test updating an individual's details.
@@ -105,6 +222,33 @@ def test_delete_individual(client):
         assert "message" in resp.json
 
 
+def test_restore_deleted_individual(client):
+    """
+    Test that deleting an individual hides its relationships, and that
+    restoring it brings them back.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    assert client.delete(
+        "/api/individuals/1?project_id=1").status_code == 200
+    assert client.get(
+        "/api/individuals/1?project_id=1").status_code == 404
+    resp = client.get("/api/relationships/?project_id=1")
+    assert resp.json["relationships"] == []
+    changes = client.get("/api/projects/1/changes?since=0").json
+    assert changes["deleted"]["individuals"] == [1]
+    assert changes["deleted"]["relationships"] == [1]
+
+    resp = client.post("/api/individuals/1/restore?project_id=1")
+    assert resp.status_code == 200
+    assert resp.json["individual"]["identities"] == [{"id": 1}]
+    resp = client.get("/api/individuals/2?project_id=1")
+    assert [p["id"] for p in resp.json["data"]["parents"]] == [1]
+    assert client.post(
+        "/api/individuals/1/restore?project_id=1").status_code == 404
+
+
 def test_create_individual_invalid_data(client):
     """
     Test creating an individual with invalid data. The 'first_name' can't be empty.
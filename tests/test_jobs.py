@@ -0,0 +1,301 @@
+import io
+import os
+import stat
+import time
+from datetime import datetime, timezone
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+from app.config import _hour_range
+from app.extensions import SessionLocal
+from app.jobs import Worker, in_purge_window, job_handler, spool_upload
+from app.models.enums_model import JobStatusEnum
+from app.models.individual_model import Individual
+from app.models.job_model import Job
+from app.services import project_service
+from app.services.job_service import JobService
+
+INDIVIDUALS_CSV = (
+    "ref,first_name,last_name\n"
+    "a,Anna,Job\n"
+    "b,Bram,Job\n"
+)
+
+
+def _run_worker(app):
+    return Worker(app, worker_id="test-worker").run_once()
+
+
+def test_get_job_unauthorized(client):
+    """
+    Test retrieving a job without authorization.
+    """
+    resp = client.get("/api/jobs/1")
+    assert resp.status_code == 401
+
+
+def test_background_import(app, client, login):
+    """
+    Test queueing a CSV import and polling it until it completes.
+    """
+    login(client)
+    data = {"individuals": (io.BytesIO(INDIVIDUALS_CSV.encode()),
+                            "individuals.csv")}
+    resp = client.post("/api/imports/csv?project_id=1&background=true",
+                       data=data, content_type="multipart/form-data")
+    assert resp.status_code == 202
+    job_id = resp.json["job"]["id"]
+    assert resp.json["job"]["status"] == "queued"
+
+    assert _run_worker(app) is True
+    assert _run_worker(app) is False
+
+    job = client.get(f"/api/jobs/{job_id}").json["job"]
+    assert job["status"] == "completed"
+    assert job["result"]["imported"]["individuals"] == 2
+    assert job["progress_current"] == job["progress_total"] == len(
+        INDIVIDUALS_CSV)
+
+    list_resp = client.get("/api/individuals/?project_id=1&q=Job")
+    assert len(list_resp.json["individuals"]) == 2
+
+
+def test_background_import_invalid_file(app, client, login):
+    """
+    Test that validation errors of a queued import fail the job.
+    """
+    login(client)
+    data = {"individuals": (io.BytesIO(b"ref,nickname\na,Al\n"),
+                            "individuals.csv")}
+    resp = client.post("/api/imports/csv?project_id=1&background=true",
+                       data=data, content_type="multipart/form-data")
+    job_id = resp.json["job"]["id"]
+
+    _run_worker(app)
+    job = client.get(f"/api/jobs/{job_id}").json["job"]
+    assert job["status"] == "failed"
+    assert "nickname" in job["error"]
+
+
+def test_background_snapshot_export(app, client, login):
+    """
+    Test exporting a snapshot as a job and downloading the result.
+    """
+    login(client)
+    resp = client.get("/api/projects/1/snapshot?background=true")
+    assert resp.status_code == 202
+    job_id = resp.json["job"]["id"]
+
+    _run_worker(app)
+    job = client.get(f"/api/jobs/{job_id}").json["job"]
+    assert job["status"] == "completed"
+    assert job["result"]["exported"]["individuals"] == 3
+    assert job["progress_current"] == job["progress_total"] > 3
+
+    download = client.get(f"/api/jobs/{job_id}/download")
+    assert download.status_code == 200
+    restore = client.post(
+        "/api/projects/snapshot",
+        data={"snapshot": (io.BytesIO(download.data), "p.gaisnap")},
+        content_type="multipart/form-data")
+    assert restore.status_code == 201
+
+
+def test_background_snapshot_restore(app, client, login):
+    """
+    Test restoring a spooled snapshot as a job.
+    """
+    login(client)
+    snapshot = client.get("/api/projects/1/snapshot").data
+    resp = client.post(
+        "/api/projects/snapshot?background=true",
+        data={"snapshot": (io.BytesIO(snapshot), "p.gaisnap"),
+              "name": "Queued restore"},
+        content_type="multipart/form-data")
+    assert resp.status_code == 202
+    job_id = resp.json["job"]["id"]
+
+    _run_worker(app)
+    job = client.get(f"/api/jobs/{job_id}").json["job"]
+    assert job["status"] == "completed"
+    project_id = job["result"]["project_id"]
+    individuals = client.get(
+        f"/api/individuals/?project_id={project_id}").json["individuals"]
+    assert len(individuals) == 3
+    assert not [name for name in os.listdir(app.config["JOB_SPOOL_DIR"])
+                if name.startswith("upload-")]
+
+
+def test_background_clone_in_batches(app, client, monkeypatch, login):
+    """
+    Test that a queued clone copies its rows in batches and reports
+    progress after each one.
+    """
+    monkeypatch.setattr(project_service, "CLONE_BATCH_SIZE", 1)
+    login(client)
+    resp = client.post("/api/projects/1/clone?background=true",
+                       json={"name": "Batched"})
+    job_id = resp.json["job"]["id"]
+
+    _run_worker(app)
+    job = client.get(f"/api/jobs/{job_id}").json["job"]
+    assert job["status"] == "completed"
+    # Three batches of individuals, then three of relationships.
+    assert job["progress_current"] == job["progress_total"] == 6
+    project_id = job["result"]["project_id"]
+    individuals = client.get(
+        f"/api/individuals/?project_id={project_id}").json["individuals"]
+    assert len(individuals) == 3
+    rels = client.get(
+        f"/api/relationships/?project_id={project_id}").json["relationships"]
+    assert len(rels) == 1
+
+
+def test_heartbeat_renewed_without_progress(app, monkeypatch):
+    """
+    Test that the worker renews the heartbeat of a job whose handler
+    reports no progress.
+    """
+    monkeypatch.setitem(app.config, "JOB_HEARTBEAT_INTERVAL", 0.05)
+    heartbeats = []
+
+    def heartbeat_at(job_id):
+        with SessionLocal.session_factory() as other:
+            return other.get(Job, job_id).heartbeat_at
+
+    @job_handler("test_heartbeat")
+    def run_test_heartbeat(context):
+        heartbeats.append(heartbeat_at(context.job_id))
+        time.sleep(0.3)
+        heartbeats.append(heartbeat_at(context.job_id))
+
+    with SessionLocal.session_factory() as session:
+        JobService(db=session).enqueue_job(
+            user_id=1, job_type="test_heartbeat", project_id=1)
+
+    _run_worker(app)
+    assert heartbeats[1] > heartbeats[0]
+
+
+def test_reclaimed_job_keeps_new_owner(app):
+    """
+    Test that a worker whose job was claimed again by another worker
+    does not overwrite the job's state when its handler returns.
+    """
+
+    @job_handler("test_reclaimed")
+    def run_test_reclaimed(context):
+        with SessionLocal.session_factory() as other:
+            other.get(Job, context.job_id).worker_id = "other-worker"
+            other.commit()
+        return {"done": True}
+
+    with SessionLocal.session_factory() as session:
+        job_id = JobService(db=session).enqueue_job(
+            user_id=1, job_type="test_reclaimed", project_id=1).id
+
+    _run_worker(app)
+    with SessionLocal.session_factory() as session:
+        job = session.get(Job, job_id)
+        assert job.status == JobStatusEnum.RUNNING
+        assert job.worker_id == "other-worker"
+        assert job.result is None
+
+
+def test_cancel_queued_job(app, client, login):
+    """
+    Test that a cancelled queued job is never run.
+    """
+    login(client)
+    resp = client.post("/api/projects/1/clone?background=true",
+                       json={"name": "Never"})
+    job_id = resp.json["job"]["id"]
+
+    cancel = client.post(f"/api/jobs/{job_id}/cancel")
+    assert cancel.status_code == 200
+    assert cancel.json["job"]["status"] == "cancelled"
+    assert _run_worker(app) is False
+
+
+def test_cancel_running_job(app, client, login):
+    """
+    Test that a running job stops at its next progress update and its
+    work is rolled back.
+    """
+
+    @job_handler("test_cancel")
+    def run_test_cancel(context):
+        context.session.add(Individual(
+            user_id=context.user_id, project_id=context.project_id,
+            individual_number=99))
+        context.session.flush()
+        with SessionLocal.session_factory() as other:
+            JobService(db=other).cancel_job(context.job_id,
+                                            context.user_id)
+        context.check_cancelled()
+        context.session.commit()
+
+    with SessionLocal.session_factory() as session:
+        job_id = JobService(db=session).enqueue_job(
+            user_id=1, job_type="test_cancel", project_id=1).id
+
+    _run_worker(app)
+    login(client)
+    job = client.get(f"/api/jobs/{job_id}").json["job"]
+    assert job["status"] == "cancelled"
+    with SessionLocal.session_factory() as session:
+        assert session.query(Individual).filter_by(
+            individual_number=99).count() == 0
+
+
+def test_get_job_not_found(client, login):
+    """
+    Test retrieving a job that does not exist.
+    """
+    login(client)
+    resp = client.get("/api/jobs/9999")
+    assert resp.status_code == 404
+
+
+def test_in_purge_window():
+    """
+    Test purge windows within a day and wrapping past midnight.
+    """
+    def at(hour):
+        return datetime(2026, 1, 1, hour, tzinfo=timezone.utc)
+
+    assert in_purge_window((2, 5), at(2))
+    assert not in_purge_window((2, 5), at(5))
+    assert in_purge_window((22, 3), at(23))
+    assert in_purge_window((22, 3), at(1))
+    assert not in_purge_window((22, 3), at(12))
+
+
+def test_spool_is_private(app, tmp_path, monkeypatch):
+    """
+    Test that spooled uploads are only accessible by the application
+    user, and that a spool directory of another user is refused.
+    """
+    spool_dir = tmp_path / "jobs"
+    monkeypatch.setitem(app.config, "JOB_SPOOL_DIR", str(spool_dir))
+    with app.test_request_context():
+        path = spool_upload(FileStorage(io.BytesIO(b"ref\n")))
+        assert stat.S_IMODE(os.stat(spool_dir).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+        owner = os.stat(spool_dir).st_uid
+        monkeypatch.setattr(os, "geteuid", lambda: owner + 1)
+        with pytest.raises(PermissionError):
+            spool_upload(FileStorage(io.BytesIO(b"ref\n")))
+
+
+@pytest.mark.parametrize("value", ["2", "2-", "24-1", "a-b"])
+def test_malformed_purge_window_fails_at_config_load(monkeypatch, value):
+    """
+    Test that a malformed purge window is rejected when the
+    configuration is read, instead of failing in the worker loop.
+    """
+    monkeypatch.setenv("PURGE_WINDOW", value)
+    with pytest.raises(ValueError, match="PURGE_WINDOW"):
+        _hour_range("PURGE_WINDOW", "2-5")
@@ -1,4 +1,16 @@
+import io
+from datetime import timedelta
+
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.identity_model import Identity
+from app.models.project_model import Project
+from app.services.display_service import DisplayNameService
+from app.services.project_service import ProjectService
+from app.services.purge_service import PurgeService
+from app.utils.snapshot_format import SnapshotWriter
+
 
 def test_list_projects_unauthorized(client):
     """
@@ -47,4 +59,243 @@ def test_delete_project(client):
     resp = client.delete("/api/projects/1")
     assert resp.status_code in (200, 404)
     if resp.status_code == 200:
-        assert "Project deleted successfully." in resp.json["message"]
\ No newline at end of file
+        assert "Project deleted successfully." in resp.json["message"]
+
+def test_clone_project(client):
+    """
+    Test cloning a project copies its individuals and relationships.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    resp = client.post("/api/projects/1/clone", json={"name": "Experiment"})
+    assert resp.status_code == 201
+    project = resp.json["project"]
+    assert project["name"] == "Experiment"
+    assert project["project_number"] == 2
+
+    individuals = client.get(
+        f"/api/individuals/?project_id={project['id']}").json["individuals"]
+    assert sorted(i["individual_number"] for i in individuals) == [1, 2, 3]
+    assert all(i["id"] not in (1, 2, 3) for i in individuals)
+    assert {i["primary_identity"]["first_name"] for i in individuals} == {
+        "Ind1First", "Ind2First", "Ind3First"}
+
+    rels = client.get(
+        f"/api/relationships/?project_id={project['id']}").json["relationships"]
+    assert len(rels) == 1
+    assert rels[0]["individual"]["first_name"] == "Ind1First"
+    assert rels[0]["related"]["first_name"] == "Ind2First"
+
+
+def test_clone_project_not_found(client):
+    """
+    Test cloning a project that does not exist.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    resp = client.post("/api/projects/999/clone")
+    assert resp.status_code == 404
+
+
+def test_clone_project_database_error(client, monkeypatch):
+    """
+    Test that a database error during a clone is reported as a server
+    error, not as a missing project.
+    """
+    def fail(self, project_id):
+        raise SQLAlchemyError("connection lost")
+
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    monkeypatch.setattr(DisplayNameService, "refresh_project", fail)
+    resp = client.post("/api/projects/1/clone")
+    assert resp.status_code == 500
+
+
+def test_snapshot_roundtrip(client):
+    """
+    Test exporting a project snapshot and restoring it as a new project.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    resp = client.get("/api/projects/1/snapshot")
+    assert resp.status_code == 200
+    assert resp.data.startswith(b"GAISNAP1")
+
+    restore = client.post("/api/projects/snapshot", data={
+        "snapshot": (io.BytesIO(resp.data), "project-1.gaisnap"),
+        "name": "Restored"}, content_type="multipart/form-data")
+    assert restore.status_code == 201
+    project = restore.json["project"]
+    assert project["name"] == "Restored"
+
+    individuals = client.get(
+        f"/api/individuals/?project_id={project['id']}").json["individuals"]
+    by_number = {i["individual_number"]: i for i in individuals}
+    assert sorted(by_number) == [1, 2, 3]
+    assert by_number[1]["birth_date"] == "Mon, 01 Jan 1990 00:00:00 GMT"
+    assert by_number[2]["primary_identity"]["gender"] == "female"
+
+    rels = client.get(
+        f"/api/relationships/?project_id={project['id']}").json["relationships"]
+    assert [(r["individual"]["first_name"], r["related"]["first_name"],
+             r["initial_relationship"]) for r in rels] == [
+        ("Ind1First", "Ind2First", "parent")]
+
+
+def test_snapshot_restore_too_large(app, client, monkeypatch):
+    """
+    Test that snapshot uploads above the size limit are rejected.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    snapshot = client.get("/api/projects/1/snapshot").data
+    monkeypatch.setitem(app.config, "SNAPSHOT_MAX_BYTES", 64)
+    resp = client.post("/api/projects/snapshot", data={
+        "snapshot": (io.BytesIO(snapshot), "p.gaisnap")},
+        content_type="multipart/form-data")
+    assert resp.status_code == 413
+
+
+def test_snapshot_restore_invalid_file(client):
+    """
+    Test restoring a file that is not a snapshot.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    resp = client.post("/api/projects/snapshot", data={
+        "snapshot": (io.BytesIO(b'{"not": "a snapshot"}'), "x.json")},
+        content_type="multipart/form-data")
+    assert resp.status_code == 400
+
+
+@pytest.mark.parametrize("typecode", [None, 7, "Z"])
+def test_snapshot_restore_unknown_typecode(client, typecode):
+    """
+    Test restoring a snapshot whose index has a column without a known
+    typecode.
+    """
+    buffer = io.BytesIO()
+    writer = SnapshotWriter(buffer)
+    writer.add_meta({"project_name": "Broken"})
+    writer.add_ints("individuals.id", [1])
+    writer._index[-1]["typecode"] = typecode
+    writer.close()
+
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    resp = client.post("/api/projects/snapshot", data={
+        "snapshot": (io.BytesIO(buffer.getvalue()), "x.gaisnap")},
+        content_type="multipart/form-data")
+    assert resp.status_code == 400
+
+
+def test_project_changes(client):
+    """
+    Test that the change feed returns only entities changed since a sequence.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    since = client.get("/api/individuals/?project_id=1").json["change_seq"]
+    resp = client.get(f"/api/projects/1/changes?since={since}")
+    assert resp.status_code == 200
+    assert resp.json["individuals"] == []
+    assert resp.json["change_seq"] == since
+
+    client.patch("/api/individuals/2?project_id=1",
+                 json={"first_name": "Changed"})
+    client.delete("/api/relationships/1?project_id=1")
+    client.post("/api/relationships/?project_id=1",
+                json={"individual_id": 1, "related_id": 3,
+                      "initial_relationship": "partner"})
+
+    resp = client.get(f"/api/projects/1/changes?since={since}")
+    assert resp.json["change_seq"] > since
+    individuals = {i["id"]: i for i in resp.json["individuals"]}
+    # Individuals 1 and 3 are touched as relationship counterparts.
+    assert set(individuals) == {1, 2, 3}
+    assert individuals[2]["primary_identity"]["first_name"] == "Changed"
+    assert resp.json["deleted"]["relationships"] == [1]
+    assert resp.json["relationships"][0]["related"]["first_name"] == \
+        "Ind3First"
+
+    latest = resp.json["change_seq"]
+    client.delete("/api/individuals/2?project_id=1")
+    resp = client.get(f"/api/projects/1/changes?since={latest}")
+    assert resp.json["individuals"] == []
+    assert resp.json["deleted"]["individuals"] == [2]
+    assert resp.json["deleted"]["identities"] == [2]
+
+
+def test_project_changes_reset(client):
+    """
+    Test that a sequence ahead of the project asks the client to reload.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    resp = client.get("/api/projects/1/changes?since=1000")
+    assert resp.status_code == 200
+    assert resp.json["reset"] is True
+
+    resp = client.get("/api/projects/1/changes")
+    assert resp.status_code == 400
+
+
+def test_deleted_project_access_revoked(client):
+    """
+    Test that a deleted project is no longer accessible even though its
+    ownership was cached by earlier requests.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    project = client.post("/api/projects/",
+                          json={"name": "Short-lived"}).json["project"]
+    url = f"/api/individuals/?project_id={project['id']}"
+    assert client.get(url).status_code == 200
+
+    resp = client.delete(f"/api/projects/{project['id']}")
+    assert resp.status_code == 200
+    assert client.get(url).status_code == 404
+
+
+def test_restore_deleted_project(client):
+    """
+    Test that a deleted project is hidden until it is restored.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    assert client.delete("/api/projects/1").status_code == 200
+    assert client.get("/api/projects/1").status_code == 404
+    assert client.get("/api/projects/").json["projects"] == []
+
+    resp = client.post("/api/projects/1/restore")
+    assert resp.status_code == 200
+    assert resp.json["project"]["id"] == 1
+    resp = client.get("/api/individuals/?project_id=1")
+    assert len(resp.json["individuals"]) == 3
+    assert client.post("/api/projects/1/restore").status_code == 404
+
+
+def test_purge_deleted_project(db_session):
+    """
+    Test that the purger deletes a tombstoned project batch by batch,
+    once it is older than the retention period.
+    """
+    assert ProjectService(db_session).delete_project(
+        project_id=1, user_id=1)
+    service_purge = PurgeService(db_session)
+    assert service_purge.purge_deleted(timedelta(days=1))["projects"] == 0
+
+    counts = service_purge.purge_deleted(timedelta(0), batch_size=2)
+    assert counts["projects"] == 1
+    assert counts["individuals"] == 3
+    assert db_session.query(Project).execution_options(
+        include_deleted=True).count() == 0
+    assert db_session.query(Identity).execution_options(
+        include_deleted=True).count() == 0
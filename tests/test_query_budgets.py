@@ -0,0 +1,146 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+
+from app.models.identity_model import Identity
+from app.models.project_model import Project
+from app.models.relationship_model import Relationship
+from app.services.identity_service import IdentityService
+from app.services.individual_service import IndividualService
+from app.services.project_service import ProjectService
+from app.services.register_numbering_service import \
+    RegisterNumberingService
+from app.services.relationship_service import RelationshipService
+from app.utils.loader_profiles import DETAIL
+from app.utils.query_metrics import capture_queries
+
+READ_ENDPOINTS = [
+    ("/api/individuals/?project_id=1", 2),
+    ("/api/individuals/search?project_id=1&q=Ind", 2),
+    ("/api/individuals/1?project_id=1", 2),
+    ("/api/identities/?project_id=1", 2),
+    ("/api/identities/1?project_id=1", 2),
+    ("/api/relationships/?project_id=1", 3),
+    ("/api/relationships/1?project_id=1", 3),
+    ("/api/projects/1/changes?since=0", 2),
+]
+
+
+@pytest.mark.parametrize("url, queries", READ_ENDPOINTS)
+def test_read_endpoint_query_budget(client, login, query_budget, url,
+                                    queries):
+    """
+    Test that read endpoints stay within their query budget once the
+    project owner and fragments are cached, and run no statement twice.
+    """
+    login(client)
+    client.get(url)
+    with query_budget(queries, repeats=1):
+        resp = client.get(url)
+    assert resp.status_code == 200
+
+
+def test_individual_detail_cold_query_budget(client, query_budget, login):
+    """
+    Test that an uncached individual detail loads the project once.
+    """
+    login(client)
+    with query_budget(6, repeats=1):
+        resp = client.get("/api/individuals/1?project_id=1")
+    assert resp.status_code == 200
+
+
+def test_query_count_headers(client, login):
+    """
+    Test that the testing config reports query counts in headers.
+    """
+    login(client)
+    resp = client.get("/api/relationships/?project_id=1")
+    assert int(resp.headers["X-Query-Count"]) > 0
+    assert resp.headers["X-Query-Repeats"] == "1"
+    assert resp.headers["Server-Timing"].startswith("db;dur=")
+
+
+def test_register_numbers_single_query(client, login, db_session,
+                                       query_budget):
+    """
+    Test that register numbers are computed with one query and an
+    individual reached through two parents is numbered once.
+    """
+    login(client)
+    for parent_id in (1, 2):
+        resp = client.post("/api/relationships/?project_id=1", json={
+            "individual_id": parent_id,
+            "related_id": 3,
+            "initial_relationship": "parent"
+        })
+        assert resp.status_code == 201
+
+    with query_budget(1):
+        numbers = RegisterNumberingService(
+            db_session).compute_register_numbers(1)
+    assert numbers == {1: 1, 2: 2, 3: 3}
+
+
+def test_delete_project_single_statement(db_session, query_budget):
+    """
+    Test that deleting a project is one update of the project row,
+    leaving its identities and relationships for the purger.
+    """
+    with query_budget(1):
+        assert ProjectService(db_session).delete_project(
+            project_id=1, user_id=1)
+    assert db_session.query(Project).count() == 0
+    assert db_session.query(Identity).count() == 3
+    assert db_session.query(Relationship).count() == 1
+
+
+def test_hot_reads_reuse_statements(db_session):
+    """
+    Test that hot service reads execute the same statement objects on
+    every call, so SQLAlchemy reuses their cache keys and compiled SQL.
+    """
+    def read():
+        IndividualService(db_session).get_individual_by_id(
+            1, 1, 1, profile=DETAIL)
+        IndividualService(db_session).get_individuals_by_project(
+            1, 1, search_query="Ind")
+        IdentityService(db_session).get_identity_by_id(1)
+        IdentityService(db_session).get_all_identities(1)
+        RelationshipService(db_session).get_relationship_by_id(1)
+        RelationshipService(db_session).list_relationships(1)
+        ProjectService(db_session).get_projects_by_user(1)
+        db_session.expunge_all()
+
+    rounds = []
+
+    def record(execute_state):
+        if not execute_state.is_relationship_load:
+            rounds[-1].append(execute_state.statement)
+
+    event.listen(db_session, "do_orm_execute", record)
+    try:
+        for _ in range(2):
+            rounds.append([])
+            read()
+    finally:
+        event.remove(db_session, "do_orm_execute", record)
+
+    first, second = rounds
+    assert len(first) == len(second) == 7
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_failed_statement_leaves_timing_intact(db_session):
+    """
+    Test that a failing statement is not recorded and does not skew
+    the timing of later statements on the same connection.
+    """
+    with capture_queries() as stats:
+        with pytest.raises(DBAPIError):
+            db_session.execute(text("SELECT 1 / 0"))
+        db_session.rollback()
+        db_session.execute(text("SELECT pg_sleep(0.05)"))
+    assert stats.count == 1
+    assert 0.05 <= stats.duration < 1
+    assert "query_start" not in db_session.connection().info
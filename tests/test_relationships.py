@@ -57,6 +57,30 @@ def test_relationship_self_reference(client):
             "Failed to create relationship" in resp.json["error"])
 
 
+def test_relationship_duplicate_pair(client):
+    """
+    Test that a second relationship between the same two individuals,
+    in either direction, and links to individuals outside the project
+    are rejected.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    payload = {
+        "individual_id": 2,
+        "related_id": 1,
+        "initial_relationship": "partner"
+    }
+    resp = client.post("/api/relationships/?project_id=1", json=payload)
+    assert resp.status_code == 400
+    assert "already have a relationship" in resp.json["error"]
+
+    payload["related_id"] = 999
+    resp = client.post("/api/relationships/?project_id=1", json=payload)
+    assert resp.status_code == 400
+    assert "same project" in resp.json["error"]
+
+
 def test_update_relationship(client):
     """
     Test updating an existing relationship.
@@ -69,6 +93,29 @@ def test_update_relationship(client):
     assert resp.status_code in (200, 404)
 
 
+def test_update_relationship_onto_related_pair(client):
+    """
+    Test that moving a relationship onto a pair that is already
+    related with another type is rejected with a clear error.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    resp = client.post("/api/relationships/?project_id=1", json={
+        "individual_id": 3,
+        "related_id": 2,
+        "initial_relationship": "partner"
+    })
+    assert resp.status_code == 201
+    relationship_id = resp.json["data"]["id"]
+
+    resp = client.patch(
+        f"/api/relationships/{relationship_id}?project_id=1",
+        json={"related_id": 1})
+    assert resp.status_code == 400
+    assert "already exists" in resp.json["error"]
+
+
 def test_delete_relationship(client):
     """
     Test deleting a relationship by ID.
@@ -79,4 +126,23 @@ def test_delete_relationship(client):
     resp = client.delete("/api/relationships/1?project_id=1")
     assert resp.status_code in (200, 404)
     if resp.status_code == 200:
-        assert "Relationship deleted successfully." in resp.json["message"]
\ No newline at end of file
+        assert "Relationship deleted successfully." in resp.json["message"]
+
+
+def test_recreate_deleted_relationship(client):
+    """
+    Test that a deleted relationship no longer blocks its pair.
+    """
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+
+    assert client.delete(
+        "/api/relationships/1?project_id=1").status_code == 200
+    assert client.get(
+        "/api/relationships/1?project_id=1").status_code == 404
+    resp = client.post("/api/relationships/?project_id=1", json={
+        "individual_id": 2,
+        "related_id": 1,
+        "initial_relationship": "child"
+    })
+    assert resp.status_code == 201
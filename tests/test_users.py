@@ -19,6 +19,26 @@ def test_get_user_profile_authorized(client):
     assert "user" in resp.json
 
 
+def test_navbar_user_snapshot_cached(client):
+    """
+    Test that rendering pages caches the current user snapshot and that
+    updating the user invalidates it.
+    """
+    from app.utils.access_cache import get_cached_user
+
+    login_payload = {"email": "testuser@example.com", "password": "TestPass123!"}
+    client.post("/api/auth/login", json=login_payload)
+    user_id = client.get("/api/users/").json["user"]["id"]
+
+    resp = client.get("/users/profile")
+    assert resp.status_code == 200
+    assert b"Logout" in resp.data
+    assert get_cached_user(user_id).id == user_id
+
+    client.patch("/api/users/", json={"username": "snapshot_user"})
+    assert get_cached_user(user_id) is None
+
+
 def test_update_user_profile(client):
     """
     Test updating the user's profile.
@@ -0,0 +1,8 @@
+from app import create_app
+from app.jobs import Worker
+
+app = create_app()
+
+
+if __name__ == '__main__':
+    Worker(app).run_forever()